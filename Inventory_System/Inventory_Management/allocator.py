@@ -0,0 +1,122 @@
+import threading
+
+from Inventory_System.Inventory_Management.location import Location
+
+
+class LocationAllocator:
+    def __init__(self, warehouse="main"):
+        self.warehouse = warehouse
+        self._lock = threading.RLock()
+        self._category_aisles = {}
+        self._next_aisle_number = 1
+        self._shelf_counter_by_category = {}
+        self._product_shelving = {}
+        self._free_shelves = {}
+        self._occupancy = {}
+
+    def _aisle_for(self, category):
+        aisle = self._category_aisles.get(category)
+        if aisle is None:
+            aisle = self._category_aisles[category] = self._next_aisle_number
+            self._next_aisle_number += 1
+        return aisle
+
+    def assign(self, category, code):
+        with self._lock:
+            aisle = self._aisle_for(category)
+            key = (category, code)
+            shelf = self._product_shelving.get(key)
+            if shelf is None:
+                free = self._free_shelves.get(category)
+                if free:
+                    shelf = next(iter(free))
+                    del free[shelf]
+                else:
+                    shelf = self._shelf_counter_by_category.get(category, 0) + 1
+                    self._shelf_counter_by_category[category] = shelf
+                self._product_shelving[key] = shelf
+                self._occupancy[(aisle, shelf)] = code
+            return Location(aisle, shelf)
+
+    def place(self, category, code, location):
+        aisle = int(location.aisle)
+        shelf = int(location.shelf)
+        with self._lock:
+            if category not in self._category_aisles:
+                self._category_aisles[category] = aisle
+                self._next_aisle_number = max(
+                    self._next_aisle_number, aisle + 1
+                )
+
+            key = (category, code)
+            previous = self._product_shelving.get(key)
+            if previous is not None and previous != shelf:
+                self._vacate(category, code, previous)
+            self._product_shelving[key] = shelf
+            self._occupancy[(self._category_aisles[category], shelf)] = code
+            free = self._free_shelves.get(category)
+            if free:
+                free.pop(shelf, None)
+            if shelf > self._shelf_counter_by_category.get(category, 0):
+                self._shelf_counter_by_category[category] = shelf
+
+    def release(self, category, code):
+        with self._lock:
+            shelf = self._product_shelving.pop((category, code), None)
+            if shelf is not None:
+                self._vacate(category, code, shelf)
+
+    def _vacate(self, category, code, shelf):
+        slot = (self._category_aisles[category], shelf)
+        if self._occupancy.get(slot) == code:
+            del self._occupancy[slot]
+            self._free_shelves.setdefault(category, {})[shelf] = None
+
+    def occupant(self, aisle, shelf):
+        return self._occupancy.get((int(aisle), int(shelf)))
+
+    def location_of(self, category, code):
+        shelf = self._product_shelving.get((category, code))
+        if shelf is None:
+            return None
+        return Location(self._category_aisles[category], shelf)
+
+    def aisle_of(self, category):
+        return self._category_aisles.get(category)
+
+    def free_shelves(self, category):
+        return list(self._free_shelves.get(category, ()))
+
+    def export_state(self):
+        with self._lock:
+            return {
+                "warehouse": self.warehouse,
+                "category_aisles": dict(self._category_aisles),
+                "next_aisle_number": self._next_aisle_number,
+                "shelf_counter_by_category": dict(
+                    self._shelf_counter_by_category
+                ),
+                "product_shelving": dict(self._product_shelving),
+                "free_shelves": {
+                    category: list(free)
+                    for category, free in self._free_shelves.items() if free
+                }
+            }
+
+    def import_state(self, state):
+        with self._lock:
+            self.warehouse = state.get("warehouse", self.warehouse)
+            self._category_aisles = dict(state["category_aisles"])
+            self._next_aisle_number = state["next_aisle_number"]
+            self._shelf_counter_by_category = dict(
+                state["shelf_counter_by_category"]
+            )
+            self._product_shelving = dict(state["product_shelving"])
+            self._free_shelves = {
+                category: dict.fromkeys(shelves)
+                for category, shelves in state.get("free_shelves", {}).items()
+            }
+            self._occupancy = {
+                (self._category_aisles[category], shelf): code
+                for (category, code), shelf in self._product_shelving.items()
+            }
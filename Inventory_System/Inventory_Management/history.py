@@ -0,0 +1,69 @@
+from array import array
+from bisect import bisect_right
+from datetime import date, datetime, time
+
+
+class StockHistory:
+    def __init__(self):
+        self._times = {}
+        self._totals = {}
+        self._synced = {}
+
+    @staticmethod
+    def timestamp(when):
+        if isinstance(when, datetime):
+            return when.timestamp()
+        if isinstance(when, date):
+            return datetime.combine(when, time.max).timestamp()
+        raise TypeError("Expected a date or datetime.")
+
+    def drop(self, code):
+        self._times.pop(code, None)
+        self._totals.pop(code, None)
+        self._synced.pop(code, None)
+
+    def sync(self, code, stock):
+        movements = stock._record
+        synced = self._synced.get(code, 0)
+        if synced == len(movements):
+            return
+        times = self._times.setdefault(code, array("d"))
+        totals = self._totals.setdefault(code, array("q"))
+
+        for index in range(synced, len(movements)):
+            movement = movements[index]
+            self._insert(
+                times, totals, movement.date.timestamp(), movement.get_delta()
+            )
+        self._synced[code] = len(movements)
+
+    @staticmethod
+    def _insert(times, totals, ts, delta):
+        if not times or ts >= times[-1]:
+            times.append(ts)
+            totals.append((totals[-1] if totals else 0) + delta)
+            return
+
+        index = bisect_right(times, ts)
+        times.insert(index, ts)
+        totals.insert(index, (totals[index - 1] if index else 0) + delta)
+        for later in range(index + 1, len(totals)):
+            totals[later] += delta
+
+    def delta_until(self, code, ts):
+        times = self._times.get(code)
+        if not times:
+            return 0
+        index = bisect_right(times, ts)
+        return self._totals[code][index - 1] if index else 0
+
+    def stock_at(self, code, stock, when):
+        return self.stock_at_timestamp(code, stock, self.timestamp(when))
+
+    def stock_at_timestamp(self, code, stock, ts):
+        self.sync(code, stock)
+        totals = self._totals.get(code)
+        if not totals:
+            return stock.get_actual_stock()
+        after = totals[-1] - self.delta_until(code, ts)
+        return stock.get_actual_stock() - after
@@ -1,47 +1,307 @@
+import threading
+from bisect import bisect_left, insort
+from functools import partial
+from itertools import islice
+
+from Inventory_System.Inventory_Management.history import StockHistory
+from Inventory_System.Inventory_Management.locks import StripedLock
+from Inventory_System.Products.search import ProductSearchIndex
+from Inventory_System.Transactions.aggregates import SalesAggregates
+from Inventory_System.Transactions.ledger import MovementLedger
+from Inventory_System.Transactions.time_index import MovementTimeIndex
+
 class Inventory:
-    def __init__(self):
+    def __init__(self, columnar=False):
         self.records = {}
-        self.movements = []
+        self.columnar = columnar
+        self.movements = MovementLedger() if columnar else []
+        self.journal = None
+        self.repository = None
+        self._movements_by_code = {}
+        self._movements_by_actor = {}
+        self._unbilled_by_actor = {}
+        self._critical = {}
+        self._critical_order = []
+        self.search_index = ProductSearchIndex()
+        self.history = StockHistory()
+        self.time_index = MovementTimeIndex()
+        self.aggregates = SalesAggregates()
+        self.record_locks = StripedLock()
+        self.write_lock = threading.RLock()
 
     def add_record(self, record):
         code = record.product._code
-        if code not in self.records:
-            self.records[code] = record
-        else:
-            print("This product already exists in the inventory.")
+        with self.write_lock:
+            if code not in self.records:
+                if self.columnar and not record.stock._record:
+                    record.stock._record = self.movements.history()
+                self.records[code] = record
+                record.stock._listener = partial(
+                    self._refresh_critical, code
+                )
+                self._refresh_critical(code)
+                self.search_index.add(record.product)
+                if self.repository:
+                    self.repository.save_record(record)
+                if self.journal:
+                    self.journal.record_record(record)
+            else:
+                print("This product already exists in the inventory.")
     
     def remove_record(self, code):
-        if code in self.records:
-            del self.records[code]
-        else:
-            print("No record found with this code.")
+        with self.record_locks.lock_for(code), self.write_lock:
+            if code in self.records:
+                self.records[code].stock._listener = None
+                self._drop_critical(code)
+                self.search_index.remove(self.records[code].product)
+                self.history.drop(code)
+                del self.records[code]
+                if self.repository:
+                    self.repository.remove_record(code)
+                if self.journal:
+                    self.journal.record_removal(code)
+            else:
+                print("No record found with this code.")
 
     def update_stock_limits(self, product_code:str, new_min:int, new_max:int):
         if product_code not in self.records:
             raise ValueError("Product not found in inventory records.")
         
-        self.records[product_code].stock.update_stock_limits(new_min, new_max)  
+        with self.record_locks.lock_for(product_code), self.write_lock:
+            record = self.records[product_code]
+            record.stock.update_stock_limits(new_min, new_max)
+            if self.repository:
+                self.repository.save_limits(record)
+            if self.journal:
+                self.journal.record_limits(product_code, new_min, new_max)
 
     def add_movement(self, movement, apply_stock: bool = True):
-        self.movements.append(movement)
-        if apply_stock:
-            product_code = movement.product._code
-            delta = movement.get_delta()
-            self.records[product_code].stock.update_stock(delta, movement)
+        product_code = movement.product._code
+        journal = entry = None
+        with self.record_locks.lock_for(product_code):
+            with self.write_lock:
+                movement._seq = len(self.movements)
+                applied = False
+                if apply_stock:
+                    delta = movement.get_delta()
+                    stock = self.records[product_code].stock
+                    applied = stock.update_stock(delta, movement)
+                self.movements.append(movement)
+                self._index_movement(movement)
+                if self.repository:
+                    self.repository.save_movement(movement, applied)
+                journal = self.journal
+                if journal:
+                    entry = journal.record_movement(
+                        movement, apply_stock, defer_sync=True
+                    )
+            if journal:
+                journal.sync_through(entry)
+
+    def add_movements(self, movements, apply_stock=True):
+        by_code = {}
+        for movement in movements:
+            grouped = by_code.get(movement.product._code)
+            if grouped is None:
+                by_code[movement.product._code] = [movement]
+            else:
+                grouped.append(movement)
+
+        journal = entry = None
+        with self.record_locks.hold(by_code):
+            with self.write_lock:
+                start = len(self.movements)
+                for seq, movement in enumerate(movements, start):
+                    movement._seq = seq
+                if apply_stock:
+                    for code, grouped in by_code.items():
+                        if len(grouped) == 1:
+                            delta = grouped[0].get_delta()
+                        else:
+                            delta = sum(m.get_delta() for m in grouped)
+                        self.records[code].stock.apply_batch(delta, grouped)
+
+                index = self._index_movement
+                for movement in movements:
+                    index(movement)
+                if self.columnar:
+                    for movement in movements:
+                        self.movements.append(movement)
+                else:
+                    self.movements.extend(movements)
+                if self.repository:
+                    self.repository.save_movements(movements, apply_stock)
+                journal = self.journal
+                if journal:
+                    entry = journal.record_movements(
+                        movements, apply_stock, defer_sync=True
+                    )
+            if journal:
+                journal.sync_through(entry)
+
+    def attach_applied(self, movements):
+        with self.write_lock:
+            for movement in movements:
+                stock = self.records[movement.product._code].stock
+                stock.attach_record(movement)
+            if self.repository:
+                self.repository.mark_applied(movements)
+
+    def _index_movement(self, movement):
+        seq = movement._seq
+        code = movement.product._code
+        actor_id = movement._actor_id
+        self._movements_by_code.setdefault(code, []).append(seq)
+        self._movements_by_actor.setdefault(actor_id, []).append(seq)
+        if movement.bill_id is None:
+            self._unbilled_by_actor.setdefault(actor_id, {})[seq] = None
+        self.time_index.add(movement)
+        self.aggregates.add(movement)
+
+    def mark_billed(self, movement, bill_id):
+        with self.write_lock:
+            movement._bill_id = bill_id
+            seq = getattr(movement, "_seq", None)
+            if self.columnar and seq is not None:
+                self.movements.set_bill(seq, bill_id)
+            pending = self._unbilled_by_actor.get(movement._actor_id)
+            if pending and seq is not None:
+                pending.pop(seq, None)
+            if self.repository:
+                self.repository.mark_billed(movement, bill_id)
 
     def get_movements_by_code(self, code):
         return [
-            movement for movement in self.movements if 
-                movement.product._code == code
+            self.movements[seq]
+            for seq in self._movements_by_code.get(code, ())
         ]
 
-    def get_critical_records(self):
-        return [
-            r for r in self.records.values()
-            if r.stock.get_actual_stock() < r.stock.minimum_stock
+    def get_movements_by_actor(self, actor_id, actor_type=None):
+        movements = [
+            self.movements[seq]
+            for seq in self._movements_by_actor.get(actor_id, ())
         ]
-        
-    def restock_suggestions(self):
+        if actor_type:
+            movements = [m for m in movements if m.actor_type == actor_type]
+        return movements
+
+    def get_unbilled_movements(self, actor_id, offset=0, limit=None):
+        seqs = self._unbilled_by_actor.get(actor_id, ())
+        stop = None if limit is None else offset + limit
+        return [self.movements[seq] for seq in islice(seqs, offset, stop)]
+
+    def count_unbilled_movements(self, actor_id):
+        return len(self._unbilled_by_actor.get(actor_id, ()))
+
+    def _refresh_critical(self, code):
+        stock = self.records[code].stock
+        key = (-stock.shortage(), code) if stock.is_critical() else None
+        with self.write_lock:
+            if self._critical.get(code) == key:
+                return
+            self._drop_critical(code)
+            if key is not None:
+                insort(self._critical_order, key)
+                self._critical[code] = key
+
+    def _drop_critical(self, code):
+        key = self._critical.pop(code, None)
+        if key is not None:
+            del self._critical_order[bisect_left(self._critical_order, key)]
+
+    def rebuild_critical(self):
+        with self.write_lock:
+            self._critical = {}
+            self._critical_order = []
+            for code in self.records:
+                self._refresh_critical(code)
+
+    def sales_summary(self, product_code=None):
+        return self.aggregates.summary(product_code)
+
+    def sales_totals(self):
+        return self.aggregates.totals()
+
+    def top_sellers(self, n=10, by="qty"):
+        return self.aggregates.top_sellers(n, by)
+
+    def daily_sales(self, start=None, end=None, product_code=None):
+        return self.aggregates.daily(start, end, product_code)
+
+    def _rebuilt_aggregates(self):
+        if self.columnar:
+            return SalesAggregates.from_ledger(self.movements)
+        return SalesAggregates.from_movements(self.movements)
+
+    def check_aggregates(self):
+        return self.aggregates.differences(self._rebuilt_aggregates())
+
+    def rebuild_aggregates(self):
+        self.aggregates = self._rebuilt_aggregates()
+
+    def scan_movements(
+        self, start=None, end=None, product=None, actor=None, type=None,
+        cursor=None
+    ):
+        start = MovementTimeIndex.timestamp(start)
+        end = MovementTimeIndex.timestamp(end)
+        after = MovementTimeIndex.parse_cursor(cursor) if cursor else None
+
+        if product is not None:
+            with self.write_lock:
+                seqs = self.time_index.select(
+                    ("product", product),
+                    self._movements_by_code.get(product, ()),
+                    start, end, after
+                )
+        elif actor is not None:
+            with self.write_lock:
+                seqs = self.time_index.select(
+                    ("actor", actor), self._movements_by_actor.get(actor, ()),
+                    start, end, after
+                )
+        else:
+            seqs = self.time_index.scan(start, end, after)
+
+        for seq in seqs:
+            movement = self.movements[seq]
+            if actor is not None and movement._actor_id != actor:
+                continue
+            if type is not None and movement.type != type:
+                continue
+            yield movement
+
+    def stock_at(self, code, when):
+        if code not in self.records:
+            raise ValueError("Product not found in inventory records.")
+        return self._stock_at_timestamp(code, StockHistory.timestamp(when))
+
+    def _stock_at_timestamp(self, code, ts):
+        with self.record_locks.lock_for(code):
+            return self.history.stock_at_timestamp(
+                code, self.records[code].stock, ts
+            )
+
+    def stock_snapshot(self, when, codes=None):
+        ts = StockHistory.timestamp(when)
+        return {
+            code: self._stock_at_timestamp(code, ts)
+            for code in (list(self.records) if codes is None else codes)
+        }
+
+    def get_critical_records(self, limit=None, offset=0):
+        stop = None if limit is None else offset + limit
+        with self.write_lock:
+            keys = self._critical_order[offset:stop]
+        return [self.records[code] for _, code in keys]
+
+    def count_critical_records(self):
+        return len(self._critical)
+
+    def most_urgent_records(self, n=10):
+        return self.get_critical_records(limit=n)
+
+    def restock_suggestions(self, limit=None, offset=0):
         return [
             {
                 "Name": r.product.name,
@@ -49,5 +309,5 @@ class Inventory:
             "Current Stock": r.stock.get_actual_stock(),
             "Minimum Required": r.stock.minimum_stock
             }
-            for r in self.get_critical_records()
+            for r in self.get_critical_records(limit, offset)
         ]
@@ -1,4 +1,6 @@
 class InventoryRecord:
+    __slots__ = ("product", "stock", "location")
+
     def __init__(self, product, stock, location):
         self.product = product
         self.stock = stock
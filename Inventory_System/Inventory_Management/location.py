@@ -1,51 +1,10 @@
 class Location:
-
-    _category_aisles = {}
-    _next_aisle_number = 1
-    _shelf_counter_by_category = {}
-    _product_shelving = {}
+    __slots__ = ("aisle", "shelf")
 
     def __init__(self, aisle, shelf):
         self.aisle = aisle
         self.shelf = shelf
 
-    @classmethod
-    def sync_from_inventory(cls, records):
-        for record in records:
-            category = record.product.category
-            code = record.product._code
-            aisle = int(record.location.aisle)
-            shelf = int(record.location.shelf)
-
-            if category not in cls._category_aisles:
-                cls._category_aisles[category] = aisle
-                cls._next_aisle_number = max(cls._next_aisle_number, aisle+1)
-
-            cls._product_shelving[(category, code)] = shelf
-            cls._shelf_counter_by_category[category] = max(
-                cls._shelf_counter_by_category.get(category, 0),
-                shelf
-            )
-
-    @classmethod
-    def assign_location(cls, category, code):
-        if category not in cls._category_aisles:
-            cls._category_aisles[category] = cls._next_aisle_number
-            cls._next_aisle_number += 1
-        
-        aisle = cls._category_aisles[category]
-
-        key = (category, code)
-        if key in cls._product_shelving:
-            shelf = cls._product_shelving[key]
-        else:
-            cls._shelf_counter_by_category.setdefault(category, 0)
-            cls._shelf_counter_by_category[category] += 1
-            shelf = cls._shelf_counter_by_category[category]
-            cls._product_shelving[key] = shelf
-
-        return cls(aisle, shelf)
-    
     def to_dict(self):
         return {
             "aisle": self.aisle,
@@ -0,0 +1,28 @@
+import threading
+from contextlib import contextmanager
+
+
+class StripedLock:
+    def __init__(self, stripes=64):
+        if stripes <= 0:
+            raise ValueError("A striped lock needs at least one stripe.")
+        self._locks = [threading.RLock() for _ in range(stripes)]
+
+    def _index(self, key):
+        return hash(key) % len(self._locks)
+
+    def lock_for(self, key):
+        return self._locks[self._index(key)]
+
+    @contextmanager
+    def hold(self, keys):
+        indexes = sorted({self._index(key) for key in keys})
+        acquired = []
+        try:
+            for index in indexes:
+                self._locks[index].acquire()
+                acquired.append(index)
+            yield
+        finally:
+            for index in reversed(acquired):
+                self._locks[index].release()
@@ -1,11 +1,22 @@
 from Inventory_System.Transactions.movements import Movement
 
 class Stock:
-    def __init__(self, actual_stock, minimum_stock, maximum_stock):
+    __slots__ = (
+        "_actual_stock", "minimum_stock", "maximum_stock",
+        "opening_stock", "_record", "_listener"
+    )
+
+    def __init__(
+        self, actual_stock, minimum_stock, maximum_stock, opening_stock=None
+    ):
         self._actual_stock = actual_stock
         self.minimum_stock = minimum_stock
         self.maximum_stock = maximum_stock
+        self.opening_stock = (
+            actual_stock if opening_stock is None else opening_stock
+        )
         self._record = []
+        self._listener = None
 
     def get_actual_stock(self):
         return self._actual_stock
@@ -25,8 +36,25 @@ class Stock:
         
         self._actual_stock += delta
         self._record.append(movement)
+        self._notify()
         return True
 
+    def apply_batch(self, delta, movements):
+        if not self.is_valid_update(delta):
+            raise ValueError("Cannot update stock.")
+        self._actual_stock += delta
+        self._record.extend(movements)
+        self._notify()
+
+    def attach_record(self, movement):
+        self._record.append(movement)
+
+    def applied_delta(self):
+        return sum(movement.get_delta() for movement in self._record)
+
+    def derive_opening_stock(self):
+        self.opening_stock = self._actual_stock - self.applied_delta()
+
     def update_stock_limits(self, new_min, new_max):
         if new_min < 0 or new_max < 0:
             raise ValueError("Stock limits cannot be negative.")
@@ -34,6 +62,17 @@ class Stock:
             raise ValueError("Minimum stock cannot exceed maximum stock.")
         self.minimum_stock = new_min
         self.maximum_stock = new_max
+        self._notify()
+
+    def is_critical(self):
+        return self._actual_stock < self.minimum_stock
+
+    def shortage(self):
+        return self.minimum_stock - self._actual_stock
+
+    def _notify(self):
+        if self._listener:
+            self._listener()
 
     def to_dict(self):
         return {
@@ -1,10 +1,15 @@
 import tkinter as tk
+from itertools import islice
 from tkinter import (
     filedialog, messagebox, Toplevel, StringVar, OptionMenu, ttk
 )
 
 from Inventory_System.Operantions_Center.system import System
 from Inventory_System.Operantions_Center.extracts import Extracts
+from Inventory_System.Operantions_Center.tasks import TaskRunner, TaskPanel
+from Inventory_System.Operantions_Center.widgets import (
+    TypeAheadEntry, VirtualListbox, VirtualTreeview
+)
 from Inventory_System.Products.product import Product
 from Inventory_System.Products.state import State
 from Inventory_System.People.supplier import Supplier
@@ -18,6 +23,7 @@ class InventoryApp:
         self.root = root
         root.title("Inventory Management System")
         self.system = system
+        self.tasks = TaskRunner(root)
 
         style = ttk.Style()
         style.theme_use("clam")
@@ -37,6 +43,7 @@ class InventoryApp:
             ("📤 Export Bill", self.export_bill),
             ("📈 Sales Summary", self.generate_sales_summary),
             ("📦 Restock Suggestions", self.show_restock_suggestions),
+            ("🧵 Background Jobs", self.show_tasks),
             ("🚪 Quit", root.quit)
         ]
 
@@ -45,34 +52,88 @@ class InventoryApp:
                 main_frame, text=text, command=command
             ).pack(pady=6, fill="x")
 
+    def product_suggestions(self, text, limit):
+        if text:
+            products = self.system.search_products(text, limit)
+        else:
+            products = [
+                record.product
+                for record in islice(self.system.records.values(), limit)
+            ]
+        return [
+            (f"{product.name} ({product._code})", product._code)
+            for product in products
+        ]
+
+    def actor_suggestions(self, actor_type):
+        directory = self.system.actor_directory(actor_type)
+
+        def search(text, limit):
+            return [
+                (f"{actor.name} ({directory.contact_of(actor)})", actor._id)
+                for actor in directory.search(text, limit)
+            ]
+        return search
+
+    def resolve_actor(self, entry, actor_type):
+        actors = (
+            self.system.customers
+            if actor_type == "customer" else self.system.suppliers
+        )
+        actor = actors.get(entry.get())
+        if actor is None:
+            actor = self.system.actor_directory(actor_type).first(
+                entry.text.get()
+            )
+        return actor
+
+    def show_tasks(self):
+        TaskPanel(self.root, self.tasks)
+
+    def system_available(self, writes_only=False):
+        if self.tasks.is_busy(writes_only):
+            messagebox.showwarning(
+                "Background jobs running",
+                "Wait until the background jobs finish to use this option."
+            )
+            return False
+        return True
+
     def load_json(self):
         filepath = filedialog.askopenfilename(
             filetypes=[("JSON Files", "*.json")]
         )
         if filepath:
-            try:
-                System.load_full_backup(self.system, filepath)
-                messagebox.showinfo(
+            self.tasks.submit(
+                "Load JSON archive",
+                lambda task: self.system.load_full_backup(
+                    filepath, progress=task.update
+                ),
+                writes=True,
+                on_done=lambda report: messagebox.showinfo(
                     "Success", "JSON archive has been loaded."
-                )
-            except Exception as e:
-                messagebox.showerror(
+                ),
+                on_error=lambda e: messagebox.showerror(
                     "Error", f"Couldn't load the archive:\n{e}"
                 )
+            )
 
     def generate_inventory_pdf(self):
-        try:
-            System.export_inventory_pdf(self.system)
-            messagebox.showinfo(
+        self.tasks.submit(
+            "Inventory report",
+            lambda task: self.system.export_inventory_pdf(),
+            on_done=lambda result: messagebox.showinfo(
                 "Success", 
                 "Report has been generated as 'inventory_report.pdf'"
-            )
-        except Exception as e:
-            messagebox.showerror(
+            ),
+            on_error=lambda e: messagebox.showerror(
                 "Error", f"Couldn't generate the report:\n{e}"
             )
+        )
 
     def generate_actor_history(self):
+        if not self.system_available(writes_only=True):
+            return
         actor_id = simple_input_dialog(
             "Join the actor ID (customer/supplier):"
         )
@@ -87,6 +148,8 @@ class InventoryApp:
             )
 
     def add_product_method(self):
+        if not self.system_available():
+            return
         dialog = Toplevel(self.root)
         dialog.title("Add Product")
         dialog.grab_set()
@@ -164,23 +227,11 @@ class InventoryApp:
         ttk.Label(
             existing_supplier_frame, text="Select existent supplier:"
         ).pack(anchor="w")
-        supplier_var = tk.StringVar()
-
-        if self.system.suppliers:
-            supplier_names = [s.name for s in self.system.suppliers.values()]
-            supplier_var.set(supplier_names[0])
-            supplier_menu = ttk.OptionMenu(
-                existing_supplier_frame, supplier_var,
-                supplier_names[0],*supplier_names
-            )
-        else:
-            supplier_var.set("There's not suppliers")
-            supplier_menu = ttk.OptionMenu(
-                existing_supplier_frame, supplier_var,
-                "There's not suppliers"
-            )
-            supplier_menu.state(["disabled"])
-        supplier_menu.pack(fill="x")
+        supplier_entry = TypeAheadEntry(
+            existing_supplier_frame, self.actor_suggestions("supplier"),
+            limit=5
+        )
+        supplier_entry.pack(fill="x")
         existing_supplier_frame.pack(pady=5, fill="x")
 
         new_supplier_frame = ttk.Frame(supplier_container)
@@ -253,12 +304,9 @@ class InventoryApp:
                     supplier_option.get() == "existent" and
                     self.system.suppliers
                 ):
-                    supplier = next(
-                        (
-                            s for s in self.system.suppliers.values() 
-                            if s.name == supplier_var.get()
-                         ), None
-                    )
+                    supplier = self.resolve_actor(supplier_entry, "supplier")
+                    if not supplier:
+                        raise ValueError("The supplier selected is invalid.")
                 else:
                     supplier_name = new_supplier_name.get().strip()
                     supplier_contact = new_supplier_contact.get().strip()
@@ -271,16 +319,10 @@ class InventoryApp:
                             "The contact number must be numeric only"
                         )
                     
-                    existing = [
-                        supplier for supplier in self.system.suppliers.values() 
-                        if (
-                            supplier.name == supplier_name and
-                            supplier.contact == supplier_contact
-                        )
-                    ]
-                    if existing:
-                        supplier = existing[0]
-                    else:
+                    supplier = self.system.supplier_directory.find_duplicate(
+                        supplier_name, supplier_contact
+                    )
+                    if not supplier:
                         supplier = Supplier(supplier_name, supplier_contact)
                         self.system.add_supplier(supplier)
 
@@ -305,19 +347,28 @@ class InventoryApp:
     def export_to_json(self):
         filepath = filedialog.asksaveasfilename(
             defaultextension=".json",
-            filetypes=[("JSON Files", "*.json")],
+            filetypes=[
+                ("JSON Files", "*.json"),
+                ("NDJSON Files", "*.ndjson"),
+                ("Compressed NDJSON", "*.ndjson.gz")
+            ],
             title="Save Backup"
         )
         if filepath:
-            try:
-                self.system.export_full_system(filepath)
-                messagebox.showinfo(
+            self.tasks.submit(
+                "Export JSON archive",
+                lambda task: self.system.export_full_system(filepath),
+                on_done=lambda result: messagebox.showinfo(
                     "Success", f"Backup saved in:\n{filepath}"
+                ),
+                on_error=lambda e: messagebox.showerror(
+                    "Error", f"Couldn't export:\n{e}"
                 )
-            except Exception as e:
-                messagebox.showerror("Error", f"Couldn't export:\n{e}")
+            )
 
     def add_movement_method(self):
+        if not self.system_available():
+            return
         if not self.system.records:
             messagebox.showwarning(
                 "No products available", 
@@ -346,16 +397,8 @@ class InventoryApp:
         ).pack(anchor="w")
 
         ttk.Label(main_frame, text="Select product:").pack(pady=5, anchor="w")
-        product_var = tk.StringVar(main_frame)
-        if self.system.records:
-            product_var.set(
-                next(iter(self.system.records.values())).product.name
-            )
-        product_menu = ttk.OptionMenu(
-            main_frame, product_var, 
-            *[record.product.name for record in self.system.records.values()]
-        )
-        product_menu.pack(pady=5, fill="x")
+        product_entry = TypeAheadEntry(main_frame, self.product_suggestions)
+        product_entry.pack(pady=5, fill="x")
 
         ttk.Label(main_frame, text="Amount:").pack(pady=5, anchor="w")
         quantity_entry = ttk.Entry(main_frame)
@@ -382,13 +425,7 @@ class InventoryApp:
         actor_container.pack(pady=5, fill="x")
 
         existing_actor_frame = ttk.Frame(actor_container)
-        actor_var = tk.StringVar(existing_actor_frame)
-        actor_label = ttk.Label(
-            existing_actor_frame, text="Select existent actor:"
-        )
-        actor_menu = ttk.OptionMenu(existing_actor_frame, actor_var, "")
-        actor_label.pack(pady=5)
-        actor_menu.pack(pady=5, fill="x")
+        actor_entry = None
 
         new_actor_frame = ttk.Frame(actor_container)
         new_actor_name_label = ttk.Label(
@@ -415,10 +452,10 @@ class InventoryApp:
                 new_actor_frame.pack(pady=5, fill="x")
 
         def update_actor_menu():
-            if movement_type.get() == "in":
-                options = [s.name for s in self.system.suppliers.values()]
-            else:
-                options = [c.name for c in self.system.customers.values()]
+            nonlocal actor_entry
+            actor_type = (
+                "supplier" if movement_type.get() == "in" else "customer"
+            )
 
             for widget in existing_actor_frame.winfo_children():
                 widget.destroy()
@@ -427,19 +464,11 @@ class InventoryApp:
                 existing_actor_frame, text="Select existent actor:"
             ).pack(pady=2, anchor="w")
 
-            if options:
-                actor_var.set(options[0])
-                new_menu = ttk.OptionMenu(
-                    existing_actor_frame, actor_var, options[0], *options
-                )
-            else:
-                actor_var.set("No actors available")
-                new_menu = ttk.OptionMenu(
-                    existing_actor_frame, actor_var, "No actors available"
-                )
-                new_menu.state(["disabled"])
-            
-            new_menu.pack(fill="x")
+            actor_entry = TypeAheadEntry(
+                existing_actor_frame, self.actor_suggestions(actor_type),
+                limit=5
+            )
+            actor_entry.pack(fill="x")
             toggle_actor_fields()
 
         update_actor_menu()
@@ -455,22 +484,16 @@ class InventoryApp:
                 if not reason_entry.get().strip():
                     raise ValueError("You have to enter a reason.")
 
-                product_name = product_var.get()
-                product = next(
-                    r.product for r in self.system.records.values() 
-                    if r.product.name == product_name
-                )
+                product_code = product_entry.get()
+                if product_code not in self.system.records:
+                    raise ValueError("You have to select a product.")
+                product = self.system.records[product_code].product
                 cantidad = int(quantity_entry.get())
                 reason = reason_entry.get().strip()
 
                 if movement_type.get() == "in":
                     if actor_option.get() == "existent":
-                        actor = next(
-                            (
-                                s for s in self.system.suppliers.values() 
-                                if s.name == actor_var.get()
-                             ), None
-                        )
+                        actor = self.resolve_actor(actor_entry, "supplier")
                         if not actor:
                             raise ValueError(
                                 "The supplier selected is invalid."
@@ -491,12 +514,7 @@ class InventoryApp:
 
                 else:
                     if actor_option.get() == "existent":
-                        actor = next(
-                            (
-                                c for c in self.system.customers.values() 
-                                if c.name == actor_var.get()
-                             ), None
-                        )
+                        actor = self.resolve_actor(actor_entry, "customer")
                         if not actor:
                             raise ValueError(
                                 "The customer selected is invalid."
@@ -528,6 +546,8 @@ class InventoryApp:
         ).pack(pady=15, fill="x")
 
     def create_bill_method(self):
+        if not self.system_available():
+            return
         if not self.system.records:
             messagebox.showwarning(
                 "No products available", 
@@ -583,31 +603,18 @@ class InventoryApp:
 
             existing_actor_frame.pack_forget()
             new_actor_frame.pack_forget()
-
-            actors_dict = (
-                self.system.customers 
-                if actor_type.get() == "customer" else self.system.suppliers
-            )
+            actor_var.set("")
 
             if actor_mode.get() == "existent":
                 existing_actor_frame.pack()
                 ttk.Label(
                     existing_actor_frame, text="Select an existent actor:"
                 ).pack()
-                if actors_dict:
-                    actor_names = [a.name for a in actors_dict.values()]
-                    actor_var.set(actor_names[0])
-                    actor_menu = ttk.OptionMenu(
-                        existing_actor_frame, actor_var, 
-                        actor_names[0], *actor_names
-                    )
-                else:
-                    actor_var.set("No actors available")
-                    actor_menu = ttk.OptionMenu(
-                        existing_actor_frame, actor_var, "No actors available"
-                    )
-                    actor_menu.state(["disabled"])
-                actor_menu.pack()
+                TypeAheadEntry(
+                    existing_actor_frame,
+                    self.actor_suggestions(actor_type.get()),
+                    limit=5, on_select=actor_var.set
+                ).pack()
             else:
                 new_actor_frame.pack()
                 ttk.Label(new_actor_frame, text="New actor name:").pack()
@@ -676,39 +683,39 @@ class InventoryApp:
         ).grid(row=0, column=6, padx=5)
 
         ttk.Label(main_frame, text="Pending Movements:").pack(pady=5)
-        pending_listbox = tk.Listbox(
-            main_frame, selectmode=tk.EXTENDED, width=70, height=4
+        pending_actor = None
+
+        def fetch_pending(offset, limit):
+            if not pending_actor:
+                return []
+            return self.system.get_unbilled_movements(
+                pending_actor._id, offset, limit
+            )
+
+        def count_pending():
+            if not pending_actor:
+                return 0
+            return self.system.count_unbilled_movements(pending_actor._id)
+
+        pending_listbox = VirtualListbox(
+            main_frame, fetch_pending, count_pending,
+            lambda idx, mov: (
+                f"{idx+1}. {mov.product.name} x{mov.amount} — "
+                f"{mov.date.strftime('%Y-%m-%d')}"
+            )
         )
         pending_listbox.pack()
 
-        pending_movements = []
-
         def update_pending_movements():
-            nonlocal pending_movements
-            pending_listbox.delete(0, tk.END)
+            nonlocal pending_actor
 
             actors_dict = (
                 self.system.customers 
                 if actor_type.get() == "customer" else self.system.suppliers
             )
 
-            actor_obj = next((a for a in actors_dict.values() 
-                            if a.name == actor_var.get()), None)
-
-            if actor_obj:
-                pending_movements = [
-                    m for m in self.system.movements
-                    if m.actor == actor_obj and 
-                    getattr(m, "bill_id", None) is None
-                ]
-                for idx, mov in enumerate(pending_movements):
-                    text = (
-                        f"{idx+1}. {mov.product.name} x{mov.amount} — "
-                        f"{mov.date.strftime('%Y-%m-%d')}"
-                    )
-                    pending_listbox.insert(tk.END, text)
-            else:
-                pending_movements = []
+            pending_actor = actors_dict.get(actor_var.get())
+            pending_listbox.reset()
 
         actor_var.trace_add("write", lambda *args: update_pending_movements())
         update_pending_movements()
@@ -756,22 +763,13 @@ class InventoryApp:
         def submit():
             try:
                 if actor_mode.get() == "existent":
-                    if (
-                        actor_var.get() and 
-                        actor_var.get() != "It's not actors available"
-                    ):
-                        actors_dict = (
-                            self.system.customers 
-                            if actor_type.get() == "customer" 
-                            else self.system.suppliers
-                        )
-                        actor = next(
-                            (
-                                a for a in actors_dict.values() 
-                                if a.name == actor_var.get()
-                             ), None
-                        )
-                    else:
+                    actors_dict = (
+                        self.system.customers 
+                        if actor_type.get() == "customer" 
+                        else self.system.suppliers
+                    )
+                    actor = actors_dict.get(actor_var.get())
+                    if not actor:
                         raise ValueError("You must select a valid actor.")
                 else:
                     actor_name = new_actor_name.get().strip()
@@ -792,10 +790,7 @@ class InventoryApp:
                         Movement(product, qty, actor, "Manual sell")
                     )
 
-                selected_indexes = pending_listbox.curselection()
-                selected_pending = [
-                    pending_movements[i] for i in selected_indexes
-                ]
+                selected_pending = pending_listbox.selected_rows()
 
                 all_movements = manual_movements + selected_pending
                 if not all_movements:
@@ -829,8 +824,8 @@ class InventoryApp:
                     else:
                         self.system.add_supplier(actor)
 
-                for movement in manual_movements:
-                    self.system.add_movement(movement)
+                if manual_movements:
+                    self.system.apply_movements(manual_movements)
  
                 bill = self.system.create_bill(actor, all_movements, payment)
                 if bill is None:
@@ -855,15 +850,18 @@ class InventoryApp:
         ).pack(pady=10)
 
     def export_movements_report(self):
-        try:
-            self.system.export_movements_pdf()
-            messagebox.showinfo(
+        self.tasks.submit(
+            "Movements report",
+            lambda task: self.system.export_movements_pdf(),
+            on_done=lambda result: messagebox.showinfo(
                 "Success", "Movements report saved as 'movement_report.pdf'."
-            )
-        except Exception as e:
-            messagebox.showerror("Error", str(e))
+            ),
+            on_error=lambda e: messagebox.showerror("Error", str(e))
+        )
             
     def export_bill(self):
+        if not self.system_available(writes_only=True):
+            return
         bill_id = simple_input_dialog("Enter the ID of the bill:")
         if bill_id not in self.system.bills:
             messagebox.showerror(
@@ -884,6 +882,8 @@ class InventoryApp:
             )
 
     def generate_sales_summary(self):
+        if not self.system_available(writes_only=True):
+            return
         dialog = tk.Toplevel(self.root)
         dialog.title("Sales Summary")
         dialog.grab_set()
@@ -912,32 +912,32 @@ class InventoryApp:
                 return
 
             if product_code:
-                codes = {m.product._code for m in self.system.movements}
-                if product_code not in codes:
+                if not self.system.get_movements_by_code(product_code):
                     messagebox.showerror(
                         "Error", 
                         f"The product code '{product_code}' doesn't exist."
                     )
                     return
-            try:
-                self.system.export_sales_summary_pdf(
+            self.tasks.submit(
+                "Sales summary",
+                lambda task: self.system.export_sales_summary_pdf(
                     filename="sales_summary.pdf", product_code=product_code
-                )
-                messagebox.showinfo(
+                ),
+                on_done=lambda result: messagebox.showinfo(
                     "Success", "Summary generated in 'sales_summary.pdf'"
-                )
-                dialog.destroy()
-            except Exception as e:
-                messagebox.showerror(
+                ),
+                on_error=lambda e: messagebox.showerror(
                     "Error", f"Couldn't generate the summary:\n{e}"
                 )
+            )
+            dialog.destroy()
 
         ttk.Button(main_frame, text="Generate", command=submit).pack(pady=10)
 
     def show_restock_suggestions(self):
-        suggestions = self.system.restock_suggestions()
-
-        if not suggestions:
+        if not self.system_available(writes_only=True):
+            return
+        if not self.system.count_critical_records():
             messagebox.showinfo("Info", "There are no restock suggestions.")
             return
 
@@ -953,28 +953,23 @@ class InventoryApp:
         ).grid(row=0, column=0, columnspan=2, pady=(0,15))
 
         cols = ("Code", "Product", "Current", "Minimum")
-        tree = ttk.Treeview(
-            main_frame, columns=cols, show="headings", style="Treeview"
-        )
-        for c in cols:
-            tree.heading(c, text=c)
-            tree.column(c, anchor="center")
-        tree.grid(row=1, column=0, sticky="nsew")
-
-        sb = ttk.Scrollbar(main_frame, orient="vertical", command=tree.yview)
-        tree.configure(yscroll=sb.set)
-        sb.grid(row=1, column=1, sticky="ns")
-
-        main_frame.rowconfigure(1, weight=1)
-        main_frame.columnconfigure(0, weight=1)
-
-        for item in suggestions:
-            tree.insert("", "end", values=(
+        tree = VirtualTreeview(
+            main_frame, cols,
+            lambda offset, limit: self.system.restock_suggestions(
+                limit, offset
+            ),
+            self.system.count_critical_records,
+            lambda index, item: (
                 item["Code"],
                 item["Name"],
                 item["Current Stock"],
                 item["Minimum Required"]
-            ))
+            )
+        )
+        tree.grid(row=1, column=0, columnspan=2, sticky="nsew")
+
+        main_frame.rowconfigure(1, weight=1)
+        main_frame.columnconfigure(0, weight=1)
 
         button_frame = ttk.Frame(main_frame)
         button_frame.grid(row=2, column=0, columnspan=2, pady=10)
@@ -1,4 +1,9 @@
+import gzip
+import itertools
 import json
+import lzma
+import re
+from collections import Counter, deque
 from datetime import datetime
 
 from Inventory_System.Products.product import Product
@@ -12,7 +17,15 @@ from Inventory_System.Inventory_Management.inventory_record import InventoryReco
 from Inventory_System.Transactions.bills import Bill
 from Inventory_System.Transactions.payment import Cash, Card
 
+_ELEMENT_START = re.compile(r"\n[ \t\r,]*[\[{\]]")
+
 class Extracts:
+    BACKUP_FORMAT = "inventory-backup"
+    BACKUP_VERSION = 2
+    BACKUP_SECTIONS = (
+        "customers", "suppliers", "records", "movements", "bills"
+    )
+    NDJSON_SUFFIXES = (".ndjson", ".ndjson.gz", ".ndjson.xz")
 
     @staticmethod
     def get_movements(system):
@@ -34,6 +47,26 @@ class Extracts:
     def get_suppliers(system):
         return [supplier.to_dict() for supplier in system.suppliers.values()]
 
+    @staticmethod
+    def iter_movements(system):
+        return (movement.to_dict() for movement in system.movements)
+
+    @staticmethod
+    def iter_bills(system):
+        return (bill.to_dict() for bill in system.bills.values())
+
+    @staticmethod
+    def iter_records(system):
+        return (record.to_dict() for record in system.records.values())
+
+    @staticmethod
+    def iter_customers(system):
+        return (customer.to_dict() for customer in system.customers.values())
+
+    @staticmethod
+    def iter_suppliers(system):
+        return (supplier.to_dict() for supplier in system.suppliers.values())
+
     @staticmethod
     def export_movements(system, filename="movements.json"):
         Extracts.export_to_json(Extracts.get_movements(system), filename)
@@ -66,21 +99,356 @@ class Extracts:
             )
 
     @staticmethod
-    def export_full_system(system, filename="full_backup.json"):
-        data = {
-            "movements": Extracts.get_movements(system),
-            "bills": Extracts.get_bills(system),
-            "records": Extracts.get_records(system),
+    def open_stream(filename, mode="rt", compression=None):
+        if compression is None:
+            if filename.endswith(".gz"):
+                compression = "gzip"
+            elif filename.endswith((".xz", ".lzma")):
+                compression = "lzma"
+
+        if compression == "gzip":
+            return gzip.open(filename, mode, encoding="utf-8")
+        if compression == "lzma":
+            return lzma.open(filename, mode, encoding="utf-8")
+        if compression:
+            raise ValueError(f"Unsupported compression: {compression}")
+        return open(filename, mode, encoding="utf-8")
+
+    @staticmethod
+    def write_ndjson(rows, filename, compression=None, chunk_size=1000):
+        count = 0
+        chunk = []
+        try:
+            with Extracts.open_stream(filename, "wt", compression) as f:
+                for row in rows:
+                    chunk.append(json.dumps(row, ensure_ascii=False))
+                    if len(chunk) >= chunk_size:
+                        f.write("\n".join(chunk) + "\n")
+                        count += len(chunk)
+                        chunk.clear()
+                if chunk:
+                    f.write("\n".join(chunk) + "\n")
+                    count += len(chunk)
+        except Exception as e:
+            raise ValueError(
+                f"Error exporting to {filename}: {e}"
+            )
+        print(f"Exported {count} lines to {filename}")
+        return count
+
+    @staticmethod
+    def backup_header():
+        return {
+            "format": Extracts.BACKUP_FORMAT,
+            "version": Extracts.BACKUP_VERSION
+        }
+
+    @staticmethod
+    def record_data(record):
+        stock = record.stock
+        return {
+            "product": record.product.to_dict(),
+            "stock": {
+                "actual_stock": stock.get_actual_stock(),
+                "minimum_stock": stock.minimum_stock,
+                "maximum_stock": stock.maximum_stock,
+                "opening_stock": stock.opening_stock
+            },
+            "location": record.location.to_dict()
+        }
+
+    @staticmethod
+    def movement_data(movement, applied):
+        return {
+            "Code": movement.product._code,
+            "Quantity": movement.amount,
+            "Type": movement.type,
+            "Actor_ID": movement._actor_id,
+            "Reason": movement.reason,
+            "Timestamp": movement.date.isoformat(),
+            "Bill_ID": movement.bill_id,
+            "Applied": applied
+        }
+
+    @staticmethod
+    def bill_data(bill):
+        data = bill.to_dict()
+        del data["entity"], data["total"]
+        data["date"] = bill.date.isoformat()
+        for item in data["items"]:
+            del item["total"]
+        return data
+
+    @staticmethod
+    def iter_backup_records(system):
+        return (
+            Extracts.record_data(record) for record in system.records.values()
+        )
+
+    @staticmethod
+    def iter_backup_movements(system):
+        heads = {}
+        for movement in system.movements:
+            code = movement.product._code
+            head = heads.get(code)
+            if head is None:
+                record = system.records.get(code)
+                history = iter(record.stock._record if record else ())
+                head = heads[code] = [history, Extracts._next_seq(history)]
+            while head[1] is not None and head[1] < movement._seq:
+                head[1] = Extracts._next_seq(head[0])
+            applied = head[1] == movement._seq
+            if applied:
+                head[1] = Extracts._next_seq(head[0])
+            yield Extracts.movement_data(movement, applied)
+
+    @staticmethod
+    def _next_seq(history):
+        for movement in history:
+            seq = getattr(movement, "_seq", None)
+            if seq is not None:
+                return seq
+        return None
+
+    @staticmethod
+    def iter_backup_bills(system):
+        return (Extracts.bill_data(bill) for bill in system.bills.values())
+
+    @staticmethod
+    def iter_full_system(system):
+        sections = (
+            ("customer", Extracts.iter_customers),
+            ("supplier", Extracts.iter_suppliers),
+            ("record", Extracts.iter_backup_records),
+            ("movement", Extracts.iter_backup_movements),
+            ("bill", Extracts.iter_backup_bills)
+        )
+        return itertools.chain(
+            [{"type": "header", "data": Extracts.backup_header()}],
+            itertools.chain.from_iterable(
+                ({"type": kind, "data": row} for row in rows(system))
+                for kind, rows in sections
+            )
+        )
+
+    @staticmethod
+    def export_full_system_ndjson(
+        system, filename="full_backup.ndjson", compression=None,
+        chunk_size=1000
+    ):
+        return Extracts.write_ndjson(
+            Extracts.iter_full_system(system), filename,
+            compression, chunk_size
+        )
+
+    @staticmethod
+    def read_full_system_ndjson(filename, compression=None):
+        data = {section: [] for section in Extracts.BACKUP_SECTIONS}
+        for row in Extracts.iter_json_rows(filename, compression):
+            if row["type"] == "header":
+                data.update(row["data"])
+            else:
+                data[row["type"] + "s"].append(row["data"])
+        return data
+
+    @staticmethod
+    def get_full_system(system):
+        data = Extracts.backup_header()
+        data.update({
             "customers": Extracts.get_customers(system),
-            "suppliers": Extracts.get_suppliers(system)
+            "suppliers": Extracts.get_suppliers(system),
+            "records": list(Extracts.iter_backup_records(system)),
+            "movements": list(Extracts.iter_backup_movements(system)),
+            "bills": list(Extracts.iter_backup_bills(system))
+        })
+        return data
+
+    @staticmethod
+    def export_full_system(system, filename="full_backup.json"):
+        Extracts.export_to_json(Extracts.get_full_system(system), filename)
+
+    @staticmethod
+    def _v1_movement_key(data):
+        return (
+            data["Code"], data["Quantity"], data["Type"], data["Actor_ID"],
+            data["Reason"], data["Date"]
+        )
+
+    @staticmethod
+    def migrate_backup_v1(data):
+        migrated = {
+            key: value for key, value in data.items()
+            if key not in Extracts.BACKUP_SECTIONS
         }
-        Extracts.export_to_json(data, filename)
+        migrated.update(Extracts.backup_header())
+        migrated["customers"] = data["customers"]
+        migrated["suppliers"] = data["suppliers"]
+
+        applied = Counter()
+        migrated["records"] = []
+        for record_data in data["records"]:
+            stock = dict(record_data["stock"])
+            for movement_data in stock.pop("record", ()):
+                applied[Extracts._v1_movement_key(movement_data)] += 1
+            migrated["records"].append(dict(record_data, stock=stock))
+
+        migrated["movements"] = []
+        unbilled = {}
+        for movement_data in data["movements"]:
+            key = Extracts._v1_movement_key(movement_data)
+            was_applied = applied[key] > 0
+            if was_applied:
+                applied[key] -= 1
+            date = datetime.strptime(movement_data["Date"], "%Y-%m-%d")
+            movement = {
+                "Code": movement_data["Code"],
+                "Quantity": movement_data["Quantity"],
+                "Type": movement_data["Type"],
+                "Actor_ID": movement_data["Actor_ID"],
+                "Reason": movement_data["Reason"],
+                "Timestamp": date.isoformat(),
+                "Bill_ID": None,
+                "Applied": was_applied
+            }
+            migrated["movements"].append(movement)
+            unbilled.setdefault(
+                (movement["Code"], movement["Quantity"], movement["Actor_ID"]),
+                deque()
+            ).append(movement)
+
+        migrated["bills"] = []
+        for bill_data in data.get("bills", []):
+            bill = {
+                key: value for key, value in bill_data.items()
+                if key not in ("entity", "total")
+            }
+            bill["items"] = [
+                {
+                    key: value for key, value in item.items()
+                    if key != "total"
+                }
+                for item in bill_data["items"]
+            ]
+            for item in bill["items"]:
+                pending = unbilled.get((
+                    item["product"]["_code"], item["quantity"],
+                    bill["entity_id"]
+                ))
+                if pending:
+                    pending.popleft()["Bill_ID"] = bill["bill_id"]
+            migrated["bills"].append(bill)
+        return migrated
 
     @staticmethod
-    def import_all_products(filename):
-        with open(filename, 'r') as f:
+    def upgrade_backup(data):
+        version = data.get("version", 1)
+        if version == 1:
+            return Extracts.migrate_backup_v1(data)
+        if version != Extracts.BACKUP_VERSION:
+            raise ValueError(f"Unsupported backup version: {version}")
+        return data
+
+    @staticmethod
+    def migrate_backup(path, filename):
+        with open(path, "r", encoding="utf-8") as f:
             data = json.load(f)
-        return [Extracts.dict_to_product(d) for d in data]
+        Extracts.export_to_json(Extracts.upgrade_backup(data), filename)
+
+    @staticmethod
+    def import_all_products(filename):
+        return [
+            Extracts.dict_to_product(d)
+            for d in Extracts.iter_json_rows(filename)
+        ]
+
+    @staticmethod
+    def iter_json_rows(
+        filename, compression=None, read_size=65536, keep_errors=False
+    ):
+        decoder = json.JSONDecoder()
+        with Extracts.open_stream(filename, "rt", compression) as f:
+            buffer = f.read(read_size)
+            start = len(buffer) - len(buffer.lstrip())
+            if not buffer[start:start + 1] == "[":
+                yield from Extracts._iter_ndjson(buffer, f, keep_errors)
+                return
+
+            pos = start + 1
+            eof = False
+            while True:
+                while pos < len(buffer) and buffer[pos] in " \t\r\n,":
+                    pos += 1
+                if pos < len(buffer) and buffer[pos] == "]":
+                    return
+                try:
+                    if pos == len(buffer):
+                        raise json.JSONDecodeError(
+                            "need data", buffer, len(buffer)
+                        )
+                    row, end = decoder.raw_decode(buffer, pos)
+                    if end == len(buffer) and not eof:
+                        raise json.JSONDecodeError(
+                            "need data", buffer, len(buffer)
+                        )
+                except json.JSONDecodeError as e:
+                    # JSON strings can't hold a raw newline, so an error
+                    # followed by one in the buffer is a bad element rather
+                    # than one cut off at the end of the chunk.
+                    if not eof and buffer.find("\n", e.pos) < 0:
+                        chunk = f.read(read_size)
+                        eof = not chunk
+                        buffer = buffer[pos:] + chunk
+                        pos = 0
+                        continue
+                    if eof and e.pos >= len(buffer.rstrip()):
+                        raise ValueError(f"Truncated JSON array in {filename}")
+                    if not keep_errors:
+                        raise
+                    skip = _ELEMENT_START.search(buffer, e.pos)
+                    bad = buffer[pos:skip.start() if skip else len(buffer)]
+                    yield json.JSONDecodeError(
+                        e.msg, bad.strip().rstrip(","), e.pos - pos
+                    )
+                    buffer, pos, eof = Extracts._skip_element(
+                        buffer, e.pos, f, read_size, eof
+                    )
+                    continue
+                yield row
+                pos = end
+
+    @staticmethod
+    def _skip_element(buffer, pos, f, read_size, eof):
+        # Resynchronise on the next line that opens an element or closes
+        # the array.
+        while True:
+            match = _ELEMENT_START.search(buffer, pos)
+            if match:
+                return buffer, match.end() - 1, eof
+            if eof:
+                return buffer, len(buffer), eof
+            tail = buffer.rfind("\n", pos)
+            chunk = f.read(read_size)
+            eof = not chunk
+            buffer = (buffer[tail:] if tail >= 0 else "") + chunk
+            pos = 0
+
+    @staticmethod
+    def _iter_ndjson(head, f, keep_errors=False):
+        pending = head
+        for line in itertools.chain(f, [""]):
+            pending += line
+            if line and not pending.endswith("\n"):
+                continue
+            for row in pending.split("\n"):
+                if not row.strip():
+                    continue
+                try:
+                    yield json.loads(row)
+                except json.JSONDecodeError as e:
+                    if not keep_errors:
+                        raise
+                    yield e
+            pending = ""
 
     @staticmethod
     def dict_to_product(data):
@@ -111,7 +479,9 @@ class Extracts:
         min_stock = data["minimum_stock"]
         max_stock = data["maximum_stock"]
         
-        stock = Stock(actual, min_stock, max_stock)
+        opening = data.get("opening_stock")
+
+        stock = Stock(actual, min_stock, max_stock, opening)
 
         if system and "record" in data:
             seen = set()
@@ -133,6 +503,8 @@ class Extracts:
                         raise ValueError(
                             f"Couldn't load movement for {code}: {e}"
                         )
+            if opening is None:
+                stock.derive_opening_stock()
 
         return stock
         
@@ -168,7 +540,10 @@ class Extracts:
         if actor is None:
             raise ValueError(f"Actor with ID {actor_id} not found in system")
 
-        return Movement(product, amount, actor, reason)
+        movement = Movement(product, amount, actor, reason)
+        if "Timestamp" in data:
+            movement.date = datetime.fromisoformat(data["Timestamp"])
+        return movement
     
     @staticmethod
     def dict_to_inventory_record(data, system):
@@ -204,7 +579,7 @@ class Extracts:
 
         bill = Bill(entity, payment)
         bill._bill_id = bill_id
-        bill.date = datetime.strptime(date, "%Y-%m-%d")
+        bill.date = datetime.fromisoformat(date)
 
         for item_data in data["items"]:
             product_code = item_data["product"]["_code"]
@@ -217,87 +592,31 @@ class Extracts:
     
     @staticmethod
     def load_inventory_records(path, system):
-        with open(path, "r", encoding="utf-8") as file:
-            data = json.load(file)
-
-        for record_data in data:
+        loaded = []
+        for record_data in Extracts.iter_json_rows(path):
             record = Extracts.dict_to_inventory_record(record_data, system)
             system.add_record(record)
-        Location.sync_from_inventory(system.records.values())
+            loaded.append(record)
 
-        print(f"{len(data)} inventory records loaded into system.")
+        print(f"{len(loaded)} inventory records loaded into system.")
 
     @staticmethod
-    def load_full_backup(path, system):
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-
-        for customer in data["customers"]:
-            system.add_customer(Extracts.dict_to_customer(customer))
-        for supplier in data["suppliers"]:
-            existing = next(
-                (
-                    x for x in system.suppliers.values() 
-                    if x.name == supplier["name"] 
-                    and x.contact_number == supplier["contact_number"]
-                ), None
-            )
-            if not existing:
-                system.add_supplier(Extracts.dict_to_supplier(supplier))
-        for record in data["records"]:
-            product_code = record["product"]["code"]
-            if product_code in system.records:
-                old_stock = system.records[product_code].stock
-                new_stock = Extracts.dict_to_stock(record["stock"], system)
-                existing_keys = {
-                    (
-                        m.product._code, m.amount, m.actor._id,
-                        m.date.isoformat()
-                    )
-                    for m in old_stock._record
-                }
-                for m in new_stock._record:
-                    key = (
-                        m.product._code, m.amount, m.actor._id, 
-                        m.date.isoformat()
-                    )
-                    if key not in existing_keys:
-                        old_stock._record.append(m)
-            else:
-                record = Extracts.dict_to_inventory_record(record, system)
-                system.add_record(record)
-
-        Location.sync_from_inventory(system.records.values())
-
-        for movement_data in data["movements"]:
-            movement = Extracts.dict_to_movement(movement_data, system)
-            system.add_movement(movement, apply_stock=False)
-            for movement1 in system.movements:
-                code = movement1.product._code
-                stock = system.records[code].stock
-                key = (movement1.product._code, movement1.amount,
-                    movement1.actor._id, movement1.date.isoformat())
-                seen = {
-                    (
-                        movement_stock.product._code, movement_stock.amount,
-                        movement_stock.actor._id, 
-                        movement_stock.date.isoformat()
-                    )
-                    for movement_stock in stock._record
-                }
-                if key not in seen:
-                    stock._record.append(movement)
+    def load_full_backup(path, system, progress=None):
+        from Inventory_System.Operantions_Center.restore import BulkRestore
 
+        if path.endswith(Extracts.NDJSON_SUFFIXES):
+            data = Extracts.read_full_system_ndjson(path)
+        else:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
 
-        for bill_data in data.get("bills", []):
-            bill = Extracts.dict_to_bill(bill_data, system)
-            system.bills[bill._bill_id] = bill
-            for m in system.movements:
-                for item in bill.items:
-                    if (m.product._code == item.product._code
-                        and m.amount == item.quantity
-                        and m.actor._id == bill.entity._id):
-                        m._bill_id = bill._bill_id
-                        break
+        report = BulkRestore(system, progress).apply(data)
 
         print(f"Backup loaded successfully from {path}")
+        print(
+            f"{report['customers']} customers, {report['suppliers']} "
+            f"suppliers, {report['records']} records, "
+            f"{report['movements']} movements and {report['bills']} bills "
+            f"restored in {report['seconds']['total']:.3f}s"
+        )
+        return report
@@ -0,0 +1,200 @@
+import json
+import os
+
+from Inventory_System.Inventory_Management.inventory_record import InventoryRecord
+from Inventory_System.Inventory_Management.stock import Stock
+from Inventory_System.Operantions_Center.extracts import Extracts
+
+
+class BatchImporter:
+    def __init__(
+        self, system, batch_size=1000, checkpoint_path=None,
+        rejects_path=None, progress=None
+    ):
+        self.system = system
+        self.batch_size = batch_size
+        self.checkpoint_path = checkpoint_path
+        self.rejects_path = rejects_path
+        self.progress = progress or BatchImporter.print_progress
+
+    @staticmethod
+    def print_progress(report):
+        print(
+            f"{report['read']} rows read, {report['imported']} imported, "
+            f"{report['rejected']} rejected"
+        )
+
+    def import_products(self, path, compression=None):
+        return self._run(
+            path, compression, "product",
+            Extracts.dict_to_product, self._apply_each(self._add_product)
+        )
+
+    def import_records(self, path, compression=None):
+        return self._run(
+            path, compression, "record",
+            lambda data: Extracts.dict_to_inventory_record(data, self.system),
+            self._apply_each(self._add_record)
+        )
+
+    def import_movements(self, path, compression=None):
+        return self._run(
+            path, compression, "movement",
+            lambda data: Extracts.dict_to_movement(data, self.system),
+            self._apply_movements
+        )
+
+    def _add_product(self, product):
+        if product._code in self.system.records:
+            raise ValueError(f"Product code {product._code} already exists.")
+        location = self.system.locations.assign(
+            product.category, product._code
+        )
+        self.system.add_record(
+            InventoryRecord(product, Stock(0, 20, 200), location)
+        )
+
+    def _add_record(self, record):
+        if record.product._code in self.system.records:
+            raise ValueError(
+                f"Product code {record.product._code} already exists."
+            )
+        self.system.add_record(record)
+
+    def _apply_each(self, add):
+        def apply(batch, rejects, checkpoint):
+            imported = 0
+            for index, data, item in batch:
+                try:
+                    add(item)
+                    imported += 1
+                except Exception as e:
+                    rejects.append(
+                        {"row": index, "error": str(e), "data": data}
+                    )
+            return imported
+        return apply
+
+    def _apply_movements(self, batch, rejects, checkpoint):
+        totals = {}
+        accepted = []
+        for index, data, movement in batch:
+            code = movement.product._code
+            total = totals.get(code, 0) + movement.get_delta()
+            if not self.system.records[code].stock.is_valid_update(total):
+                rejects.append({
+                    "row": index, "data": data,
+                    "error": "Movement exceeds the stock limits."
+                })
+                continue
+            totals[code] = total
+            accepted.append(movement)
+        if not accepted:
+            return 0
+
+        # The batch lands as one journal entry, so recording where it will
+        # start lets a resumed import tell whether it got in.
+        checkpoint(
+            seq=len(self.system.movements),
+            movement=self._movement_key(accepted[0]),
+            imported=len(accepted), rejects=list(rejects)
+        )
+        self.system.apply_movements(accepted)
+        return len(accepted)
+
+    @staticmethod
+    def _movement_key(movement):
+        return [
+            movement.product._code, movement.amount, movement._actor_id,
+            movement.date.isoformat()
+        ]
+
+    def _landed(self, pending):
+        seq = pending["seq"]
+        if seq >= len(self.system.movements):
+            return False
+        movement = self.system.movements[seq]
+        return self._movement_key(movement) == pending["movement"]
+
+    def _run(self, path, compression, kind, convert, apply):
+        report = {"path": path, "read": 0, "imported": 0, "rejected": 0}
+        report.update(self._load_checkpoint(path))
+        skip = report["read"]
+
+        batch = []
+        rejects = []
+        rows = Extracts.iter_json_rows(path, compression, keep_errors=True)
+        for index, data in enumerate(rows):
+            if index < skip:
+                continue
+            try:
+                if isinstance(data, json.JSONDecodeError):
+                    raise data
+                if not isinstance(data, dict):
+                    raise ValueError("Row is not a JSON object.")
+                if "type" in data and "data" in data:
+                    if data["type"] != kind:
+                        report["read"] += 1
+                        continue
+                    data = data["data"]
+                batch.append((index, data, convert(data)))
+            except Exception as e:
+                if isinstance(data, json.JSONDecodeError):
+                    data = data.doc
+                rejects.append({"row": index, "error": str(e), "data": data})
+            report["read"] += 1
+
+            if report["read"] - skip >= self.batch_size:
+                self._apply_batch(batch, rejects, apply, report, skip)
+                skip = report["read"]
+
+        self._apply_batch(batch, rejects, apply, report, skip)
+        self._clear_checkpoint()
+        return report
+
+    def _apply_batch(self, batch, rejects, apply, report, skip):
+        def checkpoint(**pending):
+            pending["read"] = report["read"]
+            self._save_checkpoint(dict(report, read=skip, pending=pending))
+
+        report["imported"] += apply(batch, rejects, checkpoint)
+        report["rejected"] += len(rejects)
+        self._write_rejects(rejects)
+        self._save_checkpoint(report)
+        batch.clear()
+        rejects.clear()
+        self.progress(report)
+
+    def _write_rejects(self, rejects):
+        if not rejects or not self.rejects_path:
+            return
+        with open(self.rejects_path, "a", encoding="utf-8") as f:
+            for reject in rejects:
+                f.write(json.dumps(reject, ensure_ascii=False) + "\n")
+
+    def _load_checkpoint(self, path):
+        if not self.checkpoint_path or not os.path.exists(self.checkpoint_path):
+            return {}
+        with open(self.checkpoint_path, "r", encoding="utf-8") as f:
+            checkpoint = json.load(f)
+        if checkpoint.get("path") != path:
+            return {}
+        pending = checkpoint.pop("pending", None)
+        if pending and self._landed(pending):
+            checkpoint["read"] = pending["read"]
+            checkpoint["imported"] += pending["imported"]
+            checkpoint["rejected"] += len(pending["rejects"])
+            self._write_rejects(pending["rejects"])
+        return checkpoint
+
+    def _save_checkpoint(self, report):
+        if not self.checkpoint_path:
+            return
+        temp_path = self.checkpoint_path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(report, f)
+        os.replace(temp_path, self.checkpoint_path)
+
+    def _clear_checkpoint(self):
+        if self.checkpoint_path and os.path.exists(self.checkpoint_path):
+            os.remove(self.checkpoint_path)
@@ -0,0 +1,312 @@
+import json
+import os
+import threading
+import time
+
+from Inventory_System.Operantions_Center.extracts import Extracts
+from Inventory_System.Operantions_Center.restore import BulkRestore
+from Inventory_System.Operantions_Center.snapshot import Snapshot
+
+
+class Journal:
+    def __init__(
+        self, path="inventory.journal", snapshot_path="inventory.snap",
+        compact_every=1000, sync=True
+    ):
+        self.path = path
+        self.snapshot_path = snapshot_path
+        self.compact_every = compact_every
+        self.sync = sync
+        self.system = None
+        self._file = None
+        self._seq = 0
+        self._since_compaction = 0
+        self._good_offset = 0
+        self._synced_at = 0.0
+        self._written = 0
+        self._synced = 0
+        self._sync_lock = threading.Lock()
+
+    def open(self, system, replay=True):
+        self.system = system
+        if not replay:
+            caught_up = self.catch_up(system)
+            self._seq = 0
+            self.compact()
+            system.journal = self
+            print(
+                f"Journal at {self.path} rebased on the repository state "
+                f"({caught_up} entries caught up)"
+            )
+            return caught_up
+        replayed = self.recover(system)
+        self._file = open(self.path, "a", encoding="utf-8")
+        system.journal = self
+        print(f"Journal opened at {self.path} ({replayed} entries replayed)")
+        return replayed
+
+    def close(self):
+        if self._file:
+            with self._sync_lock:
+                if self.sync:
+                    self._fsync()
+                self._file.close()
+            self._file = None
+        if self.system is not None and self.system.journal is self:
+            self.system.journal = None
+
+    def append(self, kind, data, defer_sync=False):
+        # Called under the system's write_lock, which keeps entries in seq
+        # order. With defer_sync the caller releases that lock and then calls
+        # sync_through(), so concurrent writers share one fsync.
+        self._seq += 1
+        entry = {"seq": self._seq, "kind": kind, "data": data}
+        self._file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        self._file.flush()
+        self._written = seq = self._seq
+        if not defer_sync:
+            self.sync_through(seq)
+
+        self._since_compaction += 1
+        if self.compact_every and self._since_compaction >= self.compact_every:
+            self.compact()
+        return seq
+
+    def sync_through(self, seq):
+        # sync=True syncs every entry before the write returns; a number of
+        # seconds groups the entries written within that interval instead.
+        if not self.sync:
+            return
+        with self._sync_lock:
+            if seq <= self._synced:
+                return
+            if (
+                self.sync is not True and
+                time.monotonic() - self._synced_at < self.sync
+            ):
+                return
+            self._fsync()
+
+    def _fsync(self):
+        written = self._written
+        os.fsync(self._file.fileno())
+        self._synced = written
+        self._synced_at = time.monotonic()
+
+    def record_customer(self, customer):
+        self.append("customer", customer.to_dict())
+
+    def record_supplier(self, supplier):
+        self.append("supplier", supplier.to_dict())
+
+    def record_record(self, record):
+        self.append("record", Extracts.record_data(record))
+
+    def record_removal(self, code):
+        self.append("remove", {"code": code})
+
+    def record_limits(self, code, new_min, new_max):
+        self.append(
+            "limits", {"code": code, "minimum": new_min, "maximum": new_max}
+        )
+
+    @staticmethod
+    def movement_data(movement, applied):
+        data = movement.to_dict()
+        data["Timestamp"] = movement.date.isoformat()
+        data["Bill_ID"] = movement.bill_id
+        data["Applied"] = applied
+        data["Seq"] = movement._seq
+        return data
+
+    def record_movement(self, movement, applied, defer_sync=False):
+        return self.append(
+            "movement", self.movement_data(movement, applied), defer_sync
+        )
+
+    def record_movements(self, movements, applied, defer_sync=False):
+        return self.append("movements", {
+            "applied": applied,
+            "movements": [
+                self.movement_data(movement, applied) for movement in movements
+            ]
+        }, defer_sync)
+
+    def record_bill(self, bill, movements):
+        data = bill.to_dict()
+        data["date"] = bill.date.isoformat()
+        data["movements"] = [
+            m._seq for m in movements if getattr(m, "_seq", None) is not None
+        ]
+        self.append("bill", data)
+
+    def _binary_snapshot(self):
+        return self.snapshot_path.endswith(".snap")
+
+    def compact(self):
+        with self.system.write_lock:
+            # Entries may only be dropped once the repository holds them.
+            self.system.repository.flush()
+            if self._binary_snapshot():
+                Snapshot.save(
+                    self.system, self.snapshot_path, {"journal_seq": self._seq}
+                )
+            else:
+                data = Extracts.get_full_system(self.system)
+                data["journal_seq"] = self._seq
+
+                temp_path = self.snapshot_path + ".tmp"
+                with open(temp_path, "w", encoding="utf-8") as f:
+                    json.dump(data, f, ensure_ascii=False)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(temp_path, self.snapshot_path)
+
+            with self._sync_lock:
+                if self._file:
+                    self._file.close()
+                self._file = open(self.path, "w", encoding="utf-8")
+                # The snapshot holds every entry written so far.
+                self._synced = self._written = self._seq
+            self._since_compaction = 0
+
+    def load_snapshot(self, system):
+        if os.path.exists(self.snapshot_path) and self._binary_snapshot():
+            meta = Snapshot.load(self.snapshot_path, system)
+            return meta.get("journal_seq", 0)
+        if os.path.exists(self.snapshot_path):
+            with open(self.snapshot_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            BulkRestore(system).apply(data)
+            return data.get("journal_seq", 0)
+        return 0
+
+    def entries(self):
+        self._good_offset = 0
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, "rb") as f:
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    break
+                self._good_offset += len(line)
+                yield entry
+
+    def replay(self, system):
+        snapshot_seq = self.load_snapshot(system)
+        self._seq = snapshot_seq
+        replayed = 0
+        for entry in self.entries():
+            if entry["seq"] <= snapshot_seq:
+                continue
+            Journal.apply_entry(system, entry["kind"], entry["data"])
+            self._seq = entry["seq"]
+            replayed += 1
+        return replayed
+
+    def catch_up(self, system):
+        # The repository commits before each entry is appended, so what it
+        # can be missing is a tail of the journal; earlier entries it already
+        # holds are skipped.
+        caught_up = 0
+        for entry in self.entries():
+            kind, data = entry["kind"], entry["data"]
+            if kind == "movements":
+                data = dict(data, movements=[
+                    movement for movement in data["movements"]
+                    if Journal._missing_movement(system, movement)
+                ])
+                if not data["movements"]:
+                    continue
+            elif not Journal._missing_entry(system, kind, data):
+                continue
+            Journal.apply_entry(system, kind, data)
+            caught_up += 1
+        return caught_up
+
+    @staticmethod
+    def _missing_movement(system, data):
+        return data.get("Seq", -1) >= len(system.movements)
+
+    @staticmethod
+    def _missing_entry(system, kind, data):
+        if kind == "customer":
+            return data["_id"] not in system.customers
+        if kind == "supplier":
+            return data["_id"] not in system.suppliers
+        if kind == "record":
+            return data["product"]["code"] not in system.records
+        if kind in ("remove", "limits"):
+            return data["code"] in system.records
+        if kind == "movement":
+            return Journal._missing_movement(system, data)
+        if kind == "bill":
+            return data["bill_id"] not in system.bills
+        return True
+
+    def recover(self, system):
+        replayed = self.replay(system)
+        if (
+            os.path.exists(self.path) and
+            self._good_offset < os.path.getsize(self.path)
+        ):
+            with open(self.path, "r+b") as f:
+                f.truncate(self._good_offset)
+            print("Journal had a torn tail; it was truncated.")
+
+        self._since_compaction = replayed
+        return replayed
+
+    @classmethod
+    def rebuild(cls, path="inventory.journal", snapshot_path="inventory.snap"):
+        from Inventory_System.Operantions_Center.system import System
+
+        system = System()
+        replayed = cls(path, snapshot_path).replay(system)
+        return system, replayed
+
+    @staticmethod
+    def movement_from_data(system, data):
+        movement = Extracts.dict_to_movement(data, system)
+        movement._bill_id = data["Bill_ID"]
+        return movement
+
+    @staticmethod
+    def apply_entry(system, kind, data):
+        if kind == "customer":
+            system.add_customer(Extracts.dict_to_customer(data))
+        elif kind == "supplier":
+            system.add_supplier(Extracts.dict_to_supplier(data))
+        elif kind == "record":
+            system.add_record(Extracts.dict_to_inventory_record(data, system))
+        elif kind == "remove":
+            system.remove_record(data["code"])
+        elif kind == "limits":
+            system.update_stock_limits(
+                data["code"], data["minimum"], data["maximum"]
+            )
+        elif kind == "movement":
+            system.add_movement(
+                Journal.movement_from_data(system, data),
+                apply_stock=data["Applied"]
+            )
+        elif kind == "movements":
+            system.add_movements(
+                [
+                    Journal.movement_from_data(system, movement)
+                    for movement in data["movements"]
+                ],
+                apply_stock=data["applied"]
+            )
+        elif kind == "bill":
+            bill = Extracts.dict_to_bill(data, system)
+            for seq in data["movements"]:
+                system.mark_billed(system.movements[seq], bill._bill_id)
+            system.bills[bill._bill_id] = bill
+            system.repository.save_bill(bill)
+        else:
+            raise ValueError(f"Unknown journal entry: {kind}")
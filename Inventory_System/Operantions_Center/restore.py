@@ -0,0 +1,129 @@
+import time
+from collections import Counter
+
+from Inventory_System.Operantions_Center.extracts import Extracts
+
+
+class BulkRestore:
+    PHASES = ("customers", "suppliers", "records", "movements", "bills")
+
+    def __init__(self, system, progress=None):
+        self.system = system
+        self.progress = progress
+        self._stock_keys = {}
+        self._billed = []
+        self._no_opening = []
+        self.report = {
+            "customers": 0,
+            "suppliers": 0,
+            "suppliers_skipped": 0,
+            "records": 0,
+            "records_merged": 0,
+            "movements": 0,
+            "bills": 0,
+            "seconds": {}
+        }
+
+    @staticmethod
+    def movement_key(movement):
+        return (
+            movement.product._code, movement.amount,
+            movement.actor._id, movement.date.isoformat()
+        )
+
+    def apply(self, data):
+        start = time.perf_counter()
+        data = Extracts.upgrade_backup(data)
+        self._timed("customers", self.load_customers, data["customers"])
+        self._timed("suppliers", self.load_suppliers, data["suppliers"])
+        self._timed("records", self.load_records, data["records"])
+        self._timed("movements", self.load_movements, data["movements"])
+        self._timed("bills", self.load_bills, data.get("bills", []))
+        self.report["seconds"]["total"] = time.perf_counter() - start
+        return self.report
+
+    def _timed(self, phase, step, items):
+        if self.progress:
+            self.progress(self.PHASES.index(phase), len(self.PHASES), phase)
+        start = time.perf_counter()
+        step(items)
+        self.report["seconds"][phase] = time.perf_counter() - start
+        if self.progress and phase == self.PHASES[-1]:
+            self.progress(len(self.PHASES), len(self.PHASES), "done")
+
+    def _keys_for(self, code):
+        keys = self._stock_keys.get(code)
+        if keys is None:
+            stock = self.system.records[code].stock
+            keys = Counter(self.movement_key(m) for m in stock._record)
+            self._stock_keys[code] = keys
+        return keys
+
+    def load_customers(self, customers):
+        for customer in customers:
+            self.system.add_customer(Extracts.dict_to_customer(customer))
+            self.report["customers"] += 1
+
+    def load_suppliers(self, suppliers):
+        directory = self.system.supplier_directory
+        for supplier_data in suppliers:
+            if directory.find_duplicate(
+                supplier_data["name"], supplier_data["contact_number"],
+                exact=True
+            ):
+                self.report["suppliers_skipped"] += 1
+                continue
+
+            supplier = Extracts.dict_to_supplier(supplier_data)
+            if supplier._id not in self.system.suppliers:
+                self.report["suppliers"] += 1
+            self.system.add_supplier(supplier)
+
+    def load_records(self, records):
+        for record_data in records:
+            product_code = record_data["product"]["code"]
+            if product_code in self.system.records:
+                self.report["records_merged"] += 1
+            else:
+                record = Extracts.dict_to_inventory_record(
+                    record_data, self.system
+                )
+                self.system.add_record(record)
+                if "opening_stock" not in record_data["stock"]:
+                    self._no_opening.append(record.stock)
+                self.report["records"] += 1
+
+    def load_movements(self, movements):
+        loaded = [
+            Extracts.dict_to_movement(movement_data, self.system)
+            for movement_data in movements
+        ]
+        if loaded:
+            self.system.add_movements(loaded, apply_stock=False)
+
+        applied = []
+        for movement, movement_data in zip(loaded, movements):
+            if movement_data["Bill_ID"] is not None:
+                self._billed.append((movement, movement_data["Bill_ID"]))
+            if movement_data["Applied"]:
+                code = movement.product._code
+                keys = self._keys_for(code)
+                key = self.movement_key(movement)
+                if keys[key]:
+                    keys[key] -= 1
+                else:
+                    applied.append(movement)
+        if applied:
+            self.system.attach_applied(applied)
+        for stock in self._no_opening:
+            stock.derive_opening_stock()
+        self.report["movements"] += len(loaded)
+
+    def load_bills(self, bills):
+        for bill_data in bills:
+            bill = Extracts.dict_to_bill(bill_data, self.system)
+            self.system.bills[bill._bill_id] = bill
+            self.system.repository.save_bill(bill)
+            self.report["bills"] += 1
+        for movement, bill_id in self._billed:
+            self.system.mark_billed(movement, bill_id)
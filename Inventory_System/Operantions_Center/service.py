@@ -0,0 +1,448 @@
+import asyncio
+import json
+from datetime import datetime
+from http import HTTPStatus
+from urllib.parse import parse_qs, urlsplit
+
+from Inventory_System.Operantions_Center.extracts import Extracts
+from Inventory_System.Transactions.movements import Movement
+from Inventory_System.Transactions.payment import Card, Cash
+
+
+class ServiceError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+class InventoryService:
+    def __init__(
+        self, system, host="127.0.0.1", port=8080, max_batch=256,
+        idle_timeout=30, max_body=10 * 1024 * 1024
+    ):
+        self.system = system
+        self.host = host
+        self.port = port
+        self.max_batch = max_batch
+        self.idle_timeout = idle_timeout
+        self.max_body = max_body
+        self.server = None
+        self.writes = None
+        self._writer_task = None
+        self.reads = {
+            "health": self.get_health,
+            "products": self.get_products,
+            "records": self.get_record,
+            "stock": self.get_stock,
+            "restock": self.get_restock,
+            "movements": self.get_movements,
+            "history": self.get_history,
+            "sales": self.get_sales
+        }
+        self.writers = {
+            "sales": self.post_sale,
+            "entries": self.post_entry,
+            "bills": self.post_bill
+        }
+
+    async def start(self):
+        self.writes = asyncio.Queue()
+        self._writer_task = asyncio.create_task(self._writer())
+        self.server = await asyncio.start_server(
+            self._serve_connection, self.host, self.port
+        )
+        self.port = self.server.sockets[0].getsockname()[1]
+        print(f"Inventory service listening on http://{self.host}:{self.port}")
+
+    async def stop(self):
+        if self.server:
+            self.server.close()
+            await self.server.wait_closed()
+            self.server = None
+        if self._writer_task:
+            await self.writes.join()
+            self._writer_task.cancel()
+            try:
+                await self._writer_task
+            except asyncio.CancelledError:
+                pass
+            self._writer_task = None
+
+    async def serve_forever(self):
+        await self.start()
+        try:
+            await self.server.serve_forever()
+        finally:
+            await self.stop()
+
+    def run(self):
+        try:
+            asyncio.run(self.serve_forever())
+        except KeyboardInterrupt:
+            print("Inventory service stopped.")
+
+    async def _serve_connection(self, reader, writer):
+        try:
+            while True:
+                try:
+                    request = await asyncio.wait_for(
+                        self._read_request(reader), self.idle_timeout
+                    )
+                except (asyncio.TimeoutError, asyncio.IncompleteReadError,
+                        ConnectionError):
+                    break
+                except ServiceError as e:
+                    self._write_response(
+                        writer, e.status, {"error": str(e)}, False
+                    )
+                    await writer.drain()
+                    break
+                if request is None:
+                    break
+
+                method, target, keep_alive, body = request
+                status, payload = await self.dispatch(method, target, body)
+                self._write_response(writer, status, payload, keep_alive)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def _read_request(self, reader):
+        line = await reader.readline()
+        if not line:
+            return None
+        try:
+            method, target, version = line.decode("latin-1").split()
+        except ValueError:
+            raise ServiceError(
+                HTTPStatus.BAD_REQUEST, "Malformed request line."
+            )
+
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        length = int(headers.get("content-length", 0) or 0)
+        if length > self.max_body:
+            raise ServiceError(
+                HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "Request body too large."
+            )
+        body = await reader.readexactly(length) if length else b""
+
+        connection = headers.get("connection", "").lower()
+        if version == "HTTP/1.0":
+            keep_alive = connection == "keep-alive"
+        else:
+            keep_alive = connection != "close"
+        return method.upper(), target, keep_alive, body
+
+    @staticmethod
+    def _write_response(writer, status, payload, keep_alive):
+        status = HTTPStatus(status)
+        body = json.dumps(payload, ensure_ascii=False, default=str).encode()
+        head = (
+            f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+            "Content-Type: application/json; charset=utf-8\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+        )
+        writer.write(head.encode("latin-1") + body)
+
+    async def dispatch(self, method, target, body=b""):
+        try:
+            data = json.loads(body) if body else {}
+        except ValueError as e:
+            return HTTPStatus.BAD_REQUEST, {"error": f"Invalid JSON: {e}"}
+        return await self.route(method, target, data)
+
+    async def route(self, method, target, data):
+        try:
+            parts = urlsplit(target)
+            segments = [s for s in parts.path.split("/") if s]
+            if not segments:
+                raise ServiceError(HTTPStatus.NOT_FOUND, "Unknown endpoint.")
+            name, key = segments[0], "/".join(segments[1:]) or None
+            query = {
+                field: values[-1]
+                for field, values in parse_qs(parts.query).items()
+            }
+
+            if method == "GET" and name in self.reads:
+                return HTTPStatus.OK, self.reads[name](key, query)
+            if method == "POST" and name == "batch":
+                return HTTPStatus.OK, await self.post_batch(data)
+            if method == "POST" and name in self.writers:
+                return await self.submit(name, data)
+            raise ServiceError(HTTPStatus.NOT_FOUND, "Unknown endpoint.")
+        except Exception as e:
+            return self._failure(e)
+
+    @staticmethod
+    def _failure(error):
+        if isinstance(error, ServiceError):
+            return error.status, {"error": str(error)}
+        if isinstance(error, KeyError):
+            return HTTPStatus.NOT_FOUND, {"error": f"Not found: {error}"}
+        if isinstance(error, (ValueError, TypeError)):
+            return HTTPStatus.BAD_REQUEST, {"error": str(error)}
+        return HTTPStatus.INTERNAL_SERVER_ERROR, {"error": str(error)}
+
+    def submit(self, name, data):
+        future = asyncio.get_running_loop().create_future()
+        self.writes.put_nowait((name, data, future))
+        return future
+
+    async def post_batch(self, data):
+        requests = data.get("requests") if isinstance(data, dict) else data
+        if not isinstance(requests, list):
+            raise ValueError("A batch needs a list of requests.")
+        results = await asyncio.gather(*(
+            self.route(
+                request.get("method", "GET").upper(), request["path"],
+                request.get("body", {})
+            )
+            for request in requests
+        ))
+        return {
+            "responses": [
+                {"status": int(status), "body": payload}
+                for status, payload in results
+            ]
+        }
+
+    async def _writer(self):
+        while True:
+            jobs = [await self.writes.get()]
+            while len(jobs) < self.max_batch and not self.writes.empty():
+                jobs.append(self.writes.get_nowait())
+            try:
+                self._apply_jobs(jobs)
+            except Exception as e:
+                for _, _, future in jobs:
+                    self._resolve(future, self._failure(e))
+            finally:
+                for _ in jobs:
+                    self.writes.task_done()
+
+    def _apply_jobs(self, jobs):
+        sales = []
+        for job in jobs:
+            if job[0] == "sales":
+                sales.append(job)
+                continue
+            self._apply_sales(sales)
+            sales = []
+            name, data, future = job
+            self._settle(future, self.writers[name], data)
+        self._apply_sales(sales)
+
+    @staticmethod
+    def _resolve(future, result):
+        if not future.done():
+            future.set_result(result)
+
+    def _settle(self, future, func, *args):
+        try:
+            result = func(*args)
+        except Exception as e:
+            self._resolve(future, self._failure(e))
+        else:
+            self._resolve(future, (HTTPStatus.OK, result))
+
+    def _apply_sales(self, jobs):
+        pending = []
+        for name, data, future in jobs:
+            try:
+                pending.append((self._sale_movement(data), future))
+            except Exception as e:
+                self._resolve(future, self._failure(e))
+        if not pending:
+            return
+
+        try:
+            self.system.apply_movements(movement for movement, _ in pending)
+        except ValueError:
+            for movement, future in pending:
+                self._settle(future, self._apply_sale, movement)
+        except Exception as e:
+            for _, future in pending:
+                self._resolve(future, self._failure(e))
+        else:
+            for movement, future in pending:
+                self._resolve(
+                    future, (HTTPStatus.OK, self._sale_result(movement))
+                )
+
+    def _apply_sale(self, movement):
+        try:
+            self.system.apply_movements([movement])
+        except ValueError as e:
+            raise ServiceError(HTTPStatus.CONFLICT, str(e))
+        return self._sale_result(movement)
+
+    def _sale_movement(self, data):
+        record = self.system.records[self._field(data, "product")]
+        customer = self.system.customers[self._field(data, "customer")]
+        amount = self._field(data, "amount")
+        if not isinstance(amount, int) or amount <= 0:
+            raise ValueError("Amount must be a positive integer.")
+        return Movement(
+            record.product, amount, customer, data.get("reason", "Sale")
+        )
+
+    def _sale_result(self, movement):
+        return {
+            "seq": movement._seq,
+            "stock": self.system.records[movement.product._code]
+                .stock.get_actual_stock()
+        }
+
+    @staticmethod
+    def _movement_data(movement):
+        data = movement.to_dict()
+        data["Seq"] = movement._seq
+        data["Timestamp"] = movement.date.isoformat()
+        data["Bill_ID"] = movement.bill_id
+        return data
+
+    @staticmethod
+    def _field(data, name):
+        if not isinstance(data, dict) or name not in data:
+            raise ValueError(f"Missing field: {name}")
+        return data[name]
+
+    @staticmethod
+    def _limit(query, default=100, maximum=1000):
+        return min(int(query.get("limit", default)), maximum)
+
+    def post_sale(self, data):
+        return self._apply_sale(self._sale_movement(data))
+
+    def post_entry(self, data):
+        product = Extracts.dict_to_product(self._field(data, "product"))
+        supplier = self.system.suppliers[self._field(data, "supplier")]
+        amount = self._field(data, "amount")
+        if not isinstance(amount, int) or amount <= 0:
+            raise ValueError("Amount must be a positive integer.")
+        self.system.entry_record(
+            product, amount, supplier, data.get("reason", "Entry")
+        )
+        return self.system.records[product._code].to_dict()
+
+    def post_bill(self, data):
+        actor_id = self._field(data, "actor")
+        actor = (
+            self.system.customers.get(actor_id) or
+            self.system.suppliers[actor_id]
+        )
+        if "movements" in data:
+            movements = [
+                self.system.movements[seq] for seq in data["movements"]
+            ]
+            if any(movement.bill_id for movement in movements):
+                raise ServiceError(
+                    HTTPStatus.CONFLICT, "A movement is already billed."
+                )
+        else:
+            movements = self.system.get_unbilled_movements(actor_id)
+        if not movements:
+            raise ValueError("There are no movements to bill.")
+
+        payment = data.get("payment", {})
+        method = payment.get("method", "cash").lower()
+        if method == "card":
+            payment_method = Card(payment["number"], payment["cvv"])
+        elif method == "cash":
+            if "cash_given" not in payment:
+                raise ValueError("Cash payments need cash_given.")
+            payment_method = Cash(payment["cash_given"])
+        else:
+            raise ValueError(f"Unknown payment method: {method}")
+
+        bill = self.system.create_bill(actor, movements, payment_method)
+        if bill is None:
+            raise ServiceError(HTTPStatus.PAYMENT_REQUIRED, "Payment failed.")
+        return bill.to_dict()
+
+    def get_health(self, key, query):
+        return {
+            "records": len(self.system.records),
+            "movements": len(self.system.movements),
+            "pending_writes": self.writes.qsize()
+        }
+
+    def get_products(self, key, query):
+        return [
+            self.system.records[product._code].to_dict()
+            for product in self.system.search_products(
+                query.get("q", ""), self._limit(query, 20)
+            )
+        ]
+
+    def get_record(self, key, query):
+        if not key:
+            raise ValueError("A product code is required.")
+        return self.system.records[key].to_dict()
+
+    def get_stock(self, key, query):
+        if not key:
+            raise ValueError("A product code is required.")
+        if "at" in query:
+            stock = self.system.stock_at(
+                key, datetime.fromisoformat(query["at"])
+            )
+        else:
+            stock = self.system.records[key].stock.get_actual_stock()
+        return {"code": key, "stock": stock}
+
+    def get_restock(self, key, query):
+        return self.system.restock_suggestions(
+            self._limit(query), int(query.get("offset", 0))
+        )
+
+    def get_movements(self, key, query):
+        limit = self._limit(query)
+        start, end = query.get("start"), query.get("end")
+        movements = list(self.system.query_movements(
+            start=start and datetime.fromisoformat(start),
+            end=end and datetime.fromisoformat(end),
+            product=query.get("product"), actor=query.get("actor"),
+            type=query.get("type"), cursor=query.get("cursor"),
+            limit=limit
+        ))
+        return {
+            "movements": [self._movement_data(m) for m in movements],
+            "next": (
+                self.system.movement_cursor(movements[-1])
+                if len(movements) == limit else None
+            )
+        }
+
+    def get_history(self, key, query):
+        if key not in self.system.customers:
+            if key not in self.system.suppliers:
+                raise KeyError(key)
+        query = dict(query, actor=key)
+        return self.get_movements(None, query)
+
+    def get_sales(self, key, query):
+        if key == "top":
+            return [
+                {"code": product._code, "name": product.name, "value": value}
+                for product, value in self.system.top_sellers(
+                    self._limit(query, 10), query.get("by", "qty")
+                )
+            ]
+        product_code = query.get("product")
+        return {
+            "products": self.system.sales_summary(product_code),
+            "totals": self.system.sales_totals()
+        }
@@ -0,0 +1,313 @@
+import heapq
+import multiprocessing
+import os
+import sys
+import zlib
+from itertools import islice
+
+
+class ShardWorker:
+    def __init__(self, index, journal_dir=None, quiet=True):
+        self.index = index
+        self.journal_dir = journal_dir
+        self.quiet = quiet
+        self.system = None
+
+    def run(self, connection):
+        if self.quiet:
+            sys.stdout = open(os.devnull, "w")
+        from Inventory_System.Operantions_Center.system import System
+
+        self.system = System(warehouse=f"shard-{self.index}")
+        if self.journal_dir:
+            self.system.open_journal(
+                os.path.join(self.journal_dir, f"shard-{self.index}.journal"),
+                os.path.join(self.journal_dir, f"shard-{self.index}.snap")
+            )
+
+        while True:
+            operation, args = connection.recv()
+            if operation == "close":
+                break
+            try:
+                result = getattr(self, f"op_{operation}")(*args)
+            except Exception as e:
+                connection.send(("error", e))
+            else:
+                connection.send(("ok", result))
+        self.system.close()
+        connection.send(("ok", None))
+        connection.close()
+
+    def op_actors(self):
+        return self.system.customers, self.system.suppliers
+
+    def op_codes(self):
+        return list(self.system.records)
+
+    def op_counts(self):
+        return len(self.system.records), len(self.system.movements)
+
+    def op_add_customer(self, customer):
+        self.system.add_customer(customer)
+
+    def op_add_supplier(self, supplier):
+        self.system.add_supplier(supplier)
+
+    def op_add_record(self, record):
+        self.system.add_record(record)
+
+    def op_entry_record(self, product, amount, supplier_id, reason):
+        supplier = self.system.suppliers[supplier_id]
+        self.system.entry_record(product, amount, supplier, reason)
+        return self.system.records[product._code].location.to_dict()
+
+    def op_make_sales(self, sales):
+        customers = self.system.customers
+        return [
+            self.system.make_sale(code, amount, customers[actor_id], reason)
+            for code, amount, actor_id, reason in sales
+        ]
+
+    def op_record(self, code):
+        return self.system.records[code].to_dict()
+
+    def op_stock(self, code):
+        return self.system.records[code].stock.get_actual_stock()
+
+    def op_sales_summary(self, product_code):
+        return self.system.sales_summary(product_code)
+
+    def op_sales_totals(self):
+        return self.system.sales_totals()
+
+    def op_top_sellers(self, n, by):
+        return [
+            (product._code, product.name, value)
+            for product, value in self.system.top_sellers(n, by)
+        ]
+
+    def op_restock(self, limit):
+        return self.system.restock_suggestions(limit)
+
+    def op_movements(self, start, end, product, actor, type, limit):
+        rows = []
+        for movement in self.system.query_movements(
+            start, end, product, actor, type, limit=limit
+        ):
+            data = movement.to_dict()
+            data["Timestamp"] = movement.date.isoformat()
+            data["Shard"] = self.index
+            rows.append((movement.date.timestamp(), movement._seq, data))
+        return rows
+
+
+def _run_shard(connection, index, journal_dir, quiet):
+    ShardWorker(index, journal_dir, quiet).run(connection)
+
+
+class ShardedSystem:
+    def __init__(self, shards=None, by="category", journal_dir=None,
+                 quiet=True):
+        if by not in ("category", "code"):
+            raise ValueError("Shards are keyed by 'category' or 'code'.")
+        self.shards = shards or os.cpu_count() or 1
+        self.by = by
+        self.customers = {}
+        self.suppliers = {}
+        self._owners = {}
+        self._connections = []
+        self._processes = []
+        for index in range(self.shards):
+            parent, child = multiprocessing.Pipe()
+            process = multiprocessing.Process(
+                target=_run_shard, args=(child, index, journal_dir, quiet),
+                daemon=True
+            )
+            process.start()
+            child.close()
+            self._connections.append(parent)
+            self._processes.append(process)
+
+        for index, codes in enumerate(self._gather("codes")):
+            for code in codes:
+                self._owners[code] = index
+        self.customers, self.suppliers = self._call(0, "actors")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        for connection in self._connections:
+            connection.send(("close", ()))
+        for connection in self._connections:
+            self._receive(connection)
+            connection.close()
+        for process in self._processes:
+            process.join()
+        self._connections = []
+        self._processes = []
+
+    @staticmethod
+    def _receive(connection):
+        return ShardedSystem._unwrap([connection.recv()])[0]
+
+    @staticmethod
+    def _unwrap(replies):
+        for status, result in replies:
+            if status == "error":
+                raise result
+        return [result for _, result in replies]
+
+    def _call(self, index, operation, *args):
+        connection = self._connections[index]
+        connection.send((operation, args))
+        return self._receive(connection)
+
+    def _gather(self, operation, *args, shards=None):
+        shards = range(self.shards) if shards is None else shards
+        for index in shards:
+            self._connections[index].send((operation, args))
+        return self._unwrap(
+            [self._connections[index].recv() for index in shards]
+        )
+
+    def _scatter(self, operation, requests):
+        for index, args in requests.items():
+            self._connections[index].send((operation, args))
+        replies = [self._connections[index].recv() for index in requests]
+        return dict(zip(requests, self._unwrap(replies)))
+
+    def shard_for(self, category, code):
+        key = category if self.by == "category" else code
+        return zlib.crc32(key.encode("utf-8")) % self.shards
+
+    def owner(self, product_code):
+        if product_code not in self._owners:
+            raise ValueError("Product code not found in inventory.")
+        return self._owners[product_code]
+
+    def add_customer(self, customer):
+        self._gather("add_customer", customer)
+        self.customers[customer._id] = customer
+
+    def add_supplier(self, supplier):
+        self._gather("add_supplier", supplier)
+        self.suppliers[supplier._id] = supplier
+
+    def add_record(self, record):
+        code = record.product._code
+        index = self.shard_for(record.product.category, code)
+        self._call(index, "add_record", record)
+        self._owners.setdefault(code, index)
+
+    def entry_record(self, product, amount, supplier, reason):
+        code = product._code
+        if code in self._owners:
+            raise ValueError(f"Product code {code} is already in inventory.")
+        index = self.shard_for(product.category, code)
+        location = self._call(
+            index, "entry_record", product, amount, supplier._id, reason
+        )
+        self._owners[code] = index
+        return location
+
+    def make_sale(self, product_code, amount, customer, reason):
+        return self._call(
+            self.owner(product_code), "make_sales",
+            [(product_code, amount, customer._id, reason)]
+        )[0]
+
+    def make_sales(self, sales):
+        requests = {}
+        positions = {}
+        for position, (code, amount, customer, reason) in enumerate(sales):
+            index = self.owner(code)
+            requests.setdefault(index, []).append(
+                (code, amount, customer._id, reason)
+            )
+            positions.setdefault(index, []).append(position)
+
+        results = [None] * sum(len(batch) for batch in requests.values())
+        replies = self._scatter(
+            "make_sales",
+            {index: (batch,) for index, batch in requests.items()}
+        )
+        for index, reply in replies.items():
+            for position, result in zip(positions[index], reply):
+                results[position] = result
+        return results
+
+    def get_record(self, product_code):
+        return self._call(self.owner(product_code), "record", product_code)
+
+    def get_stock(self, product_code):
+        return self._call(self.owner(product_code), "stock", product_code)
+
+    def counts(self):
+        records, movements = 0, 0
+        for shard_records, shard_movements in self._gather("counts"):
+            records += shard_records
+            movements += shard_movements
+        return records, movements
+
+    def sales_summary(self, product_code=None):
+        if product_code:
+            return self._call(
+                self.owner(product_code), "sales_summary", product_code
+            )
+        summary = {}
+        for shard_summary in self._gather("sales_summary", None):
+            summary.update(shard_summary)
+        return summary
+
+    def sales_totals(self):
+        totals = self._gather("sales_totals")
+        return {
+            "name": "Total",
+            "in": {
+                "qty": sum(entry["in"]["qty"] for entry in totals),
+                "cost": sum(entry["in"]["cost"] for entry in totals)
+            },
+            "out": {
+                "qty": sum(entry["out"]["qty"] for entry in totals),
+                "cost": sum(entry["out"]["cost"] for entry in totals)
+            }
+        }
+
+    def top_sellers(self, n=10, by="qty"):
+        rows = [
+            row for shard_rows in self._gather("top_sellers", n, by)
+            for row in shard_rows
+        ]
+        return heapq.nlargest(n, rows, key=lambda row: row[2])
+
+    def restock_suggestions(self, limit=None):
+        def shortage(row):
+            return row["Minimum Required"] - row["Current Stock"]
+
+        rows = [
+            row for shard_rows in self._gather("restock", limit)
+            for row in shard_rows
+        ]
+        if limit is None:
+            return sorted(rows, key=shortage, reverse=True)
+        return heapq.nlargest(limit, rows, key=shortage)
+
+    def query_movements(
+        self, start=None, end=None, product=None, actor=None, type=None,
+        limit=None
+    ):
+        args = (start, end, product, actor, type, limit)
+        if product is not None:
+            shards = [self.owner(product)]
+        else:
+            shards = None
+        merged = heapq.merge(
+            *self._gather("movements", *args, shards=shards),
+            key=lambda row: (row[0], row[2]["Shard"], row[1])
+        )
+        return [data for _, _, data in islice(merged, limit)]
@@ -0,0 +1,125 @@
+import gc
+import io
+import os
+import pickle
+import struct
+
+MAGIC = b"STOKSNAP"
+VERSION = 1
+HEADER = struct.Struct("<8sHI")
+LENGTH = struct.Struct("<Q")
+TRANSIENT = (
+    "journal", "repository", "record_locks", "write_lock", "locations"
+)
+
+
+class _SystemPickler(pickle.Pickler):
+    def __init__(self, file, system, **kwargs):
+        super().__init__(file, **kwargs)
+        self.system = system
+
+    def persistent_id(self, obj):
+        if obj is self.system:
+            return "system"
+        return None
+
+
+class _SystemUnpickler(pickle.Unpickler):
+    def __init__(self, file, system, **kwargs):
+        super().__init__(file, **kwargs)
+        self.system = system
+
+    def persistent_load(self, pid):
+        if pid == "system":
+            return self.system
+        raise pickle.UnpicklingError(f"Unknown persistent id: {pid}")
+
+
+class Snapshot:
+    @staticmethod
+    def save(system, path="inventory.snap", meta=None):
+        payload = {
+            "meta": meta or {},
+            "system": {
+                key: value for key, value in vars(system).items()
+                if key not in TRANSIENT
+            },
+            "locations": system.locations.export_state()
+        }
+
+        buffers = []
+        temp_path = path + ".tmp"
+        with open(temp_path, "w+b") as f:
+            f.write(HEADER.pack(MAGIC, VERSION, 0))
+            f.write(LENGTH.pack(0))
+            start = f.tell()
+            _SystemPickler(
+                f, system, protocol=5, buffer_callback=buffers.append
+            ).dump(payload)
+            end = f.tell()
+
+            for buffer in buffers:
+                raw = buffer.raw()
+                f.write(LENGTH.pack(raw.nbytes))
+                f.write(raw)
+
+            f.seek(0)
+            f.write(HEADER.pack(MAGIC, VERSION, len(buffers)))
+            f.write(LENGTH.pack(end - start))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+        return len(system.movements)
+
+    @staticmethod
+    def load(path, system):
+        with open(path, "rb") as f:
+            magic, version, buffer_count = HEADER.unpack(
+                f.read(HEADER.size)
+            )
+            if magic != MAGIC:
+                raise ValueError(f"{path} is not an inventory snapshot.")
+            if version != VERSION:
+                raise ValueError(f"Unsupported snapshot version: {version}")
+
+            (size,) = LENGTH.unpack(f.read(LENGTH.size))
+            data = f.read(size)
+            buffers = []
+            for _ in range(buffer_count):
+                (length,) = LENGTH.unpack(f.read(LENGTH.size))
+                buffers.append(f.read(length))
+
+        # Collection stays off until the state is installed; re-enabling it
+        # any earlier lets the next allocation trigger a full pass over
+        # everything just unpickled.
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            payload = _SystemUnpickler(
+                io.BytesIO(data), system, buffers=buffers
+            ).load()
+            vars(system).update(payload["system"])
+            system.locations.import_state(payload["locations"])
+            if "_critical" not in payload["system"]:
+                system.rebuild_critical()
+        finally:
+            if gc_enabled:
+                gc.enable()
+        return payload["meta"]
+
+    @staticmethod
+    def from_json(json_path, snapshot_path="inventory.snap"):
+        from Inventory_System.Operantions_Center.system import System
+
+        system = System()
+        system.load_full_backup(json_path)
+        Snapshot.save(system, snapshot_path)
+        print(f"Snapshot written to {snapshot_path}")
+
+    @staticmethod
+    def to_json(snapshot_path, json_path="full_backup.json"):
+        from Inventory_System.Operantions_Center.system import System
+
+        system = System()
+        Snapshot.load(snapshot_path, system)
+        system.export_full_system(json_path)
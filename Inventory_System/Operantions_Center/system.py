@@ -1,35 +1,69 @@
+from functools import partial
+from itertools import chain, islice
+
+from Inventory_System.Inventory_Management.allocator import LocationAllocator
 from Inventory_System.Inventory_Management.inventory import Inventory
 from Inventory_System.Inventory_Management.inventory_record import InventoryRecord
-from Inventory_System.Inventory_Management.location import Location
 from Inventory_System.Inventory_Management.stock import Stock
 from Inventory_System.Transactions.movements import Movement
 from Inventory_System.Transactions.bills import Bill
+from Inventory_System.Transactions.time_index import MovementTimeIndex
 from Inventory_System.Operantions_Center.extracts import Extracts
-from Inventory_System.Operantions_Center.generatepdf import (
-    ActorHistoryPDF, BillPDF, CriticalStockPDF,
-    InventoryReportPDF, MovementsReportPDF, SalesSummaryPDF
-)   
+from Inventory_System.Operantions_Center.journal import Journal
+from Inventory_System.Operantions_Center.snapshot import Snapshot
+from Inventory_System.People.directory import ActorDirectory
+from Inventory_System.Storage.memory_repository import MemoryRepository
 
 class System(Inventory):
-    def __init__(self):
-        super().__init__()
+    def __init__(self, columnar=False, repository=None, warehouse="main"):
+        super().__init__(columnar)
+        self.locations = LocationAllocator(warehouse)
         self.bills = {}
         self.customers = {}
         self.suppliers = {}
+        self.customer_directory = ActorDirectory("number_id")
+        self.supplier_directory = ActorDirectory("contact_number")
+        self.repository = MemoryRepository(self)
+        if repository:
+            repository.load(self)
+            self.repository = repository
 
     def entry_record(self, product, amount, supplier, reason):
         code = product._code
-        if code in self.records:
-            raise ValueError(f"Product code {code} is already in inventory.")
-        
-        location = Location.assign_location(product.category, product._code)
-        stock = Stock(0, 20, 200)
-        record = InventoryRecord(product, stock, location)
-        self.add_record(record)
-        movement = Movement(product, amount, supplier, reason)
-        self.add_movement(movement)
+        with self.record_locks.lock_for(code), self.write_lock:
+            if code in self.records:
+                raise ValueError(
+                    f"Product code {code} is already in inventory."
+                )
+
+            location = self.locations.assign(product.category, code)
+            stock = Stock(0, 20, 200)
+            record = InventoryRecord(product, stock, location)
+            self.add_record(record)
+            movement = Movement(product, amount, supplier, reason)
+            self.add_movement(movement)
         print(f"Product {product.name} added at {location.to_dict()}")
 
+    def add_record(self, record):
+        code = record.product._code
+        with self.write_lock:
+            super().add_record(record)
+            if self.records.get(code) is record:
+                self.locations.place(
+                    record.product.category, code, record.location
+                )
+
+    def remove_record(self, code):
+        with self.record_locks.lock_for(code), self.write_lock:
+            record = self.records.get(code)
+            super().remove_record(code)
+            if record is not None:
+                self.locations.release(record.product.category, code)
+
+    def record_at(self, aisle, shelf):
+        code = self.locations.occupant(aisle, shelf)
+        return self.records.get(code) if code is not None else None
+
     def make_sale(self, product_code, amount, customer, reason):
         if product_code not in self.records:
             raise ValueError("Product code not found in inventory.")
@@ -39,68 +73,150 @@ class System(Inventory):
         delta = movement.get_delta()
         stock = record.stock
 
-        if not stock.is_valid_update(delta):
-            print(
-                f"Movement for {record.product.name} failed due "
-                  "to insufficient stock."
-            )
-            return False
+        # add_movement re-enters this stripe, so no other writer can change
+        # the product's stock between the check and the update.
+        with self.record_locks.lock_for(product_code):
+            if not stock.is_valid_update(delta):
+                print(
+                    f"Movement for {record.product.name} failed due "
+                      "to insufficient stock."
+                )
+                return False
 
-        self.add_movement(movement) 
+            self.add_movement(movement)
         print(f"Movement for {record.product.name} recorded successfully.")
         return True
     
+    def apply_movements(self, batch):
+        movements = list(batch)
+        totals, lows, highs = {}, {}, {}
+        for movement in movements:
+            if not isinstance(movement, Movement):
+                raise TypeError("Only Movement instances can be applied.")
+            code = movement.product._code
+            total = totals.get(code, 0) + movement.get_delta()
+            totals[code] = total
+            if total < lows.get(code, 0):
+                lows[code] = total
+            elif total > highs.get(code, 0):
+                highs[code] = total
+
+        with self.record_locks.hold(totals):
+            for code in totals:
+                if code not in self.records:
+                    raise ValueError(
+                        f"Product code {code} not found in inventory."
+                    )
+                stock = self.records[code].stock
+                if not (
+                    stock.is_valid_update(lows.get(code, 0)) and
+                    stock.is_valid_update(highs.get(code, 0))
+                ):
+                    raise ValueError(
+                        f"Movements for {self.records[code].product.name} "
+                        "exceed the stock limits."
+                    )
+
+            if movements:
+                self.add_movements(movements)
+        print(
+            f"{len(movements)} movements recorded for "
+            f"{len(totals)} products."
+        )
+        return movements
+
     def add_customer(self, customer):
-        if customer._id in self.customers:
-            print(f"Customer '{customer.name}' already exists.")
-        else:
+        with self.write_lock:
+            if customer._id in self.customers:
+                print(f"Customer '{customer.name}' already exists.")
+                return
             self.customers[customer._id] = customer
-            print(f"Customer '{customer.name}' added.")
+            self.customer_directory.add(customer)
+            self.repository.save_customer(customer)
+            if self.journal:
+                self.journal.record_customer(customer)
+        print(f"Customer '{customer.name}' added.")
 
     def add_supplier(self, supplier):
-        if supplier._id in self.suppliers:
-            print(f"Supplier '{supplier.name}' already exists.")
-        else:
+        with self.write_lock:
+            if supplier._id in self.suppliers:
+                print(f"Supplier '{supplier.name}' already exists.")
+                return
             self.suppliers[supplier._id] = supplier
-            print(f"Supplier '{supplier.name}' added.")
+            self.supplier_directory.add(supplier)
+            self.repository.save_supplier(supplier)
+            if self.journal:
+                self.journal.record_supplier(supplier)
+        print(f"Supplier '{supplier.name}' added.")
+
+    def search_products(self, query, limit=20):
+        return self.search_index.search(query, limit)
+
+    def actor_directory(self, actor_type):
+        if actor_type == "customer":
+            return self.customer_directory
+        return self.supplier_directory
+
+    def find_customer(self, name):
+        return self.customer_directory.first(name)
+
+    def find_supplier(self, name):
+        return self.supplier_directory.first(name)
+
+    def search_actors(self, prefix, actor_type, limit=None):
+        return self.actor_directory(actor_type).search(prefix, limit)
+
+    def query_movements(
+        self, start=None, end=None, product=None, actor=None, type=None,
+        cursor=None, limit=None
+    ):
+        movements = self.repository.query_movements(
+            start, end, product, actor, type, cursor
+        )
+        return islice(movements, limit)
+
+    @staticmethod
+    def movement_cursor(movement):
+        return MovementTimeIndex.cursor(movement)
 
     def generate_customer_history(self, customer_id):
         if customer_id not in self.customers:
             raise ValueError(f"Customer not found")
         return [
-            movement.to_dict() for movement in self.movements
-                if (
-                    movement._actor_id == customer_id and 
-                    movement.actor_type == "customer"
-                )
+            movement.to_dict() for movement in
+                self.repository.movements_by_actor(customer_id, "customer")
         ]
         
     def generate_supplier_history(self, supplier_id):
         if supplier_id not in self.suppliers:
             raise ValueError(f"Supplier not found")
         return [
-            movement.to_dict() for movement in self.movements
-                if (movement._actor_id == supplier_id 
-                    and movement.actor_type == "supplier"
-                )
+            movement.to_dict() for movement in
+                self.repository.movements_by_actor(supplier_id, "supplier")
         ]
     
     def create_bill(self, entity, movements, payment_method):
         bill = Bill(entity, payment_method)
 
-        for movement in movements:
-            if movement.actor._id != entity._id:
-                raise ValueError("Movement does not belong to this entity.")
-
-            sale_price = movement.final_price
-            bill.add_item(
-                movement.product,
-                movement.amount,
-                sale_price
-            )
-            movement._bill_id = bill._bill_id
+        with self.write_lock, self.repository.batch():
+            for movement in movements:
+                if movement.actor._id != entity._id:
+                    raise ValueError(
+                        "Movement does not belong to this entity."
+                    )
+
+                sale_price = movement.final_price
+                bill.add_item(
+                    movement.product,
+                    movement.amount,
+                    sale_price
+                )
+                self.mark_billed(movement, bill._bill_id)
 
-        self.bills[bill._bill_id] = bill
+            self.bills[bill._bill_id] = bill
+            self.repository.save_bill(bill)
+            if self.journal:
+                self.journal.record_bill(bill, movements)
 
         total = bill.calculate_total()
         if not payment_method.pay(total):
@@ -111,21 +227,81 @@ class System(Inventory):
         return bill
 
     def export_full_system(self, path="full_backup.json"):
-        Extracts.export_full_system(self, path)
+        if path.endswith(Extracts.NDJSON_SUFFIXES):
+            Extracts.export_full_system_ndjson(self, path)
+        else:
+            Extracts.export_full_system(self, path)
+
+    def load_full_backup(self, path="full_backup.json", progress=None):
+        # The backup is loaded into a fresh system, so a failed or cancelled
+        # restore leaves this one untouched.
+        restored = System(self.columnar, warehouse=self.locations.warehouse)
+        report = Extracts.load_full_backup(path, restored, progress)
+        with self.write_lock:
+            self._adopt(restored)
+        self.repository.save_system(self)
+        if self.journal:
+            self.journal.compact()
+        return report
+
+    def rebuild_aggregates(self):
+        with self.write_lock:
+            super().rebuild_aggregates()
+        # The snapshot still holds the old aggregates until it is rewritten.
+        self.repository.flush()
+        if self.journal:
+            self.journal.compact()
+
+    def _adopt(self, other):
+        kept = ("journal", "repository", "record_locks", "write_lock")
+        vars(self).update({
+            key: value for key, value in vars(other).items()
+            if key not in kept
+        })
+        for code, record in self.records.items():
+            record.stock._listener = partial(self._refresh_critical, code)
+
+    def save_snapshot(self, path="inventory.snap"):
+        Snapshot.save(self, path)
+
+    def load_snapshot(self, path="inventory.snap"):
+        return Snapshot.load(path, self)
+
+    def open_journal(
+        self, path="inventory.journal", snapshot_path="inventory.snap",
+        compact_every=1000, sync=True
+    ):
+        journal = Journal(path, snapshot_path, compact_every, sync)
+        journal.open(
+            self, replay=isinstance(self.repository, MemoryRepository)
+        )
+        return journal
 
-    def load_full_backup(self, path="full_backup.json"):
-        Extracts.load_full_backup(path, self)
+    def close(self):
+        self.repository.close()
+        if self.journal:
+            self.journal.close()
 
     def export_inventory_pdf(self, filename="inventory_report.pdf"):
+        from Inventory_System.Operantions_Center.generatepdf import (
+            InventoryReportPDF
+        )
+
         data = [r.to_dict() for r in self.records.values()]
         pdf = InventoryReportPDF()
         pdf.generate(data)
         pdf.output(filename)
+        return True
 
     def export_movements_pdf(self, filename="movements_report.pdf"):
-        data = [movement.to_dict() for movement in self.movements]
+        from Inventory_System.Operantions_Center.generatepdf import (
+            MovementsReportPDF
+        )
+
+        data = (movement.to_dict() for movement in self.query_movements())
         pdf = MovementsReportPDF()
-        pdf.generate(data)
+        pdf.generate(data, filename)
+        return True
 
     def export_bill_pdf(self, bill_id: str, filename="bill_report.pdf"):
         try:
@@ -136,18 +312,26 @@ class System(Inventory):
             if not filename.lower().endswith(".pdf"):
                 filename += ".pdf"
 
+            from Inventory_System.Operantions_Center.generatepdf import BillPDF
+
             pdf = BillPDF()
             pdf.generate(bill, filename)
             print(f"Bill exported: {filename}")
+            return True
 
         except Exception as e:
             print(f"Error generating PDF Bill: {e}")
+            return False
 
     def export_critical_stock_pdf(self, filename="critical_stock.pdf"):
-        critical = super().get_critical_records()
+        critical = self.repository.critical_records()
         if not critical:
             print("No hay stocks críticos.")
             return False
+        from Inventory_System.Operantions_Center.generatepdf import (
+            CriticalStockPDF
+        )
+
         pdf = CriticalStockPDF()
         pdf.generate(critical, filename)
         return True
@@ -166,56 +350,41 @@ class System(Inventory):
             )
             actor_name = actor.name
 
-            filtered_movements = [
-                m for m in self.movements if m._actor_id == actor_id
-            ]
+            filtered_movements = self.query_movements(actor=actor_id)
+            first = next(filtered_movements, None)
 
-            if not filtered_movements:
+            if first is None:
                 print(f"No movements found for {actor_type} '{actor_name}'.")
-                return
+                return False
+            filtered_movements = chain([first], filtered_movements)
 
             if not filename:
                 filename = (
                     f"{actor_type}_{actor_name.replace(' ', '_')}_history.pdf"
                 )
 
+            from Inventory_System.Operantions_Center.generatepdf import (
+                ActorHistoryPDF
+            )
+
             pdf = ActorHistoryPDF(actor_name, actor_type)
             pdf.generate(filtered_movements, filename)
             print(f"History PDF generated: {filename}")
+            return True
 
         except Exception as e:
             print(f"Error generating actor history PDF: {e}")
+            return False
 
     def export_sales_summary_pdf(
         self, filename="sales_summary.pdf", product_code=None
     ):
         try:
-            movements = self.movements
-            if product_code:
-                movements = [
-                    m for m in movements if m.product._code == product_code
-                ]
+            summary = self.repository.sales_summary(product_code)
 
-            if not movements:
+            if not summary:
                 print("There're no data to make a report.")
-                return
-
-            summary = {}
-            for m in movements:
-                code = m.product._code
-                if code not in summary:
-                    summary[code] = {
-                        "name": m.product.name,
-                        "in": {"qty": 0, "cost": 0.0},
-                        "out": {"qty": 0, "cost": 0.0}
-                    }
-
-                if m.type == "in":  # Compras
-                    summary[code]["in"]["qty"] += m.amount
-                    summary[code]["in"]["cost"] += m.amount * m.product._price
-                else:  # Salidas (ventas)
-                    summary[code]["out"]["qty"] += m.amount
-                    summary[code]["out"]["cost"] += m.amount * m.final_price
+                return False
 
             title = f"Resumen de Ventas y Compras"
             if product_code:
@@ -224,9 +393,15 @@ class System(Inventory):
                     f"({product_code})"
                 )
 
+            from Inventory_System.Operantions_Center.generatepdf import (
+                SalesSummaryPDF
+            )
+
             pdf = SalesSummaryPDF(title)
             pdf.generate(summary, filename)
             print(f"Resumen generado en: {filename}")
+            return True
 
         except Exception as e:
             print(f"Error generando el resumen: {e}")
+            return False
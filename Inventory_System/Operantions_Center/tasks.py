@@ -0,0 +1,230 @@
+import threading
+import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
+from tkinter import ttk
+
+
+class TaskCancelled(Exception):
+    pass
+
+
+class ReadWriteLock:
+    def __init__(self):
+        self._condition = threading.Condition()
+        self._readers = 0
+        self._writing = False
+        self._waiting_writers = 0
+
+    def acquire_read(self):
+        # Waiting writers go first, so a steady stream of readers can't
+        # starve them.
+        with self._condition:
+            while self._writing or self._waiting_writers:
+                self._condition.wait()
+            self._readers += 1
+
+    def release_read(self):
+        with self._condition:
+            self._readers -= 1
+            if not self._readers:
+                self._condition.notify_all()
+
+    def acquire_write(self):
+        with self._condition:
+            self._waiting_writers += 1
+            try:
+                while self._writing or self._readers:
+                    self._condition.wait()
+            finally:
+                self._waiting_writers -= 1
+            self._writing = True
+
+    def release_write(self):
+        with self._condition:
+            self._writing = False
+            self._condition.notify_all()
+
+
+class Task:
+    def __init__(self, name, func, writes=False, on_done=None, on_error=None):
+        self.name = name
+        self.func = func
+        self.writes = writes
+        self.on_done = on_done
+        self.on_error = on_error
+        self.status = "queued"
+        self.done = 0
+        self.total = None
+        self.message = ""
+        self.result = None
+        self.error = None
+        self.future = None
+        self.notified = False
+        self._cancel = threading.Event()
+
+    @property
+    def cancelled(self):
+        return self._cancel.is_set()
+
+    @property
+    def finished(self):
+        return self.status in ("done", "failed", "cancelled")
+
+    def cancel(self):
+        self._cancel.set()
+        if self.future and self.future.cancel():
+            self.status = "cancelled"
+
+    def update(self, done, total=None, message=""):
+        self.done = done
+        self.total = total
+        self.message = message
+        if total is None or done < total:
+            self.check_cancelled()
+
+    def check_cancelled(self):
+        if self.cancelled:
+            raise TaskCancelled(f"{self.name} was cancelled.")
+
+    def progress_text(self):
+        if self.total:
+            return f"{100 * self.done // self.total}% {self.message}".strip()
+        return self.message
+
+
+class TaskRunner:
+    def __init__(self, root, workers=2, poll_ms=100, history=20):
+        self.root = root
+        self.poll_ms = poll_ms
+        self.history = history
+        self.executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="inventory-task"
+        )
+        self.lock = ReadWriteLock()
+        self.tasks = []
+        self.listeners = []
+        self.root.after(self.poll_ms, self._poll)
+
+    def submit(self, name, func, writes=False, on_done=None, on_error=None):
+        task = Task(name, func, writes, on_done, on_error)
+        self.tasks.append(task)
+        task.future = self.executor.submit(self._run, task)
+        return task
+
+    def _run(self, task):
+        if task.cancelled:
+            task.status = "cancelled"
+            return
+
+        acquire, release = (
+            (self.lock.acquire_write, self.lock.release_write)
+            if task.writes else
+            (self.lock.acquire_read, self.lock.release_read)
+        )
+        acquire()
+        try:
+            task.check_cancelled()
+            task.status = "running"
+            task.result = task.func(task)
+            if not task.writes:
+                task.check_cancelled()
+            task.status = "done"
+        except TaskCancelled:
+            task.status = "cancelled"
+        except Exception as e:
+            task.error = e
+            task.status = "failed"
+        finally:
+            release()
+
+    def is_busy(self, writes_only=False):
+        return any(
+            not task.finished and (task.writes or not writes_only)
+            for task in self.tasks
+        )
+
+    def _poll(self):
+        for task in self.tasks:
+            if not task.finished or task.notified:
+                continue
+            task.notified = True
+            if task.status == "done" and task.on_done:
+                task.on_done(task.result)
+            elif task.status == "failed" and task.on_error:
+                task.on_error(task.error)
+            task.result = None
+        self._evict()
+
+        for listener in list(self.listeners):
+            listener()
+        self.root.after(self.poll_ms, self._poll)
+
+    def _evict(self):
+        # Collected tasks are kept only as a short history for the panel.
+        collected = [task for task in self.tasks if task.notified]
+        if len(collected) > self.history:
+            dropped = {
+                id(task) for task in collected[:-self.history or None]
+            }
+            self.tasks = [
+                task for task in self.tasks if id(task) not in dropped
+            ]
+
+    def shutdown(self):
+        for task in self.tasks:
+            task.cancel()
+        self.executor.shutdown(wait=True)
+
+
+class TaskPanel:
+    def __init__(self, root, runner):
+        self.runner = runner
+        self.dialog = tk.Toplevel(root)
+        self.dialog.title("Background Jobs")
+
+        main_frame = ttk.Frame(self.dialog, padding=15)
+        main_frame.pack(fill="both", expand=True)
+
+        cols = ("Job", "Status", "Progress")
+        self.tree = ttk.Treeview(
+            main_frame, columns=cols, show="headings", height=8
+        )
+        for c in cols:
+            self.tree.heading(c, text=c)
+        self.tree.pack(fill="both", expand=True)
+
+        button_frame = ttk.Frame(main_frame)
+        button_frame.pack(pady=10)
+        ttk.Button(
+            button_frame, text="Cancel job", command=self.cancel_selected
+        ).grid(row=0, column=0, padx=5)
+        ttk.Button(
+            button_frame, text="Close", command=self.close
+        ).grid(row=0, column=1, padx=5)
+
+        self.runner.listeners.append(self.refresh)
+        self.dialog.protocol("WM_DELETE_WINDOW", self.close)
+        self.refresh()
+
+    def refresh(self):
+        selected = self.tree.selection()
+        self.tree.delete(*self.tree.get_children())
+        for task in self.runner.tasks:
+            self.tree.insert("", "end", iid=str(id(task)), values=(
+                task.name, task.status, task.progress_text()
+            ))
+        existing = [iid for iid in selected if self.tree.exists(iid)]
+        if existing:
+            self.tree.selection_set(existing)
+
+    def cancel_selected(self):
+        selected = set(self.tree.selection())
+        for task in self.runner.tasks:
+            if str(id(task)) in selected:
+                task.cancel()
+        self.refresh()
+
+    def close(self):
+        if self.refresh in self.runner.listeners:
+            self.runner.listeners.remove(self.refresh)
+        self.dialog.destroy()
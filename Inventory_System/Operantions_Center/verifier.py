@@ -0,0 +1,102 @@
+class StateVerifier:
+    @staticmethod
+    def record_state(record):
+        stock = record.stock
+        return (
+            stock.get_actual_stock(), stock.minimum_stock,
+            stock.maximum_stock, getattr(stock, "opening_stock", None),
+            int(record.location.aisle), int(record.location.shelf)
+        )
+
+    @staticmethod
+    def applied_state(record):
+        return [
+            getattr(movement, "_seq", None) for movement in record.stock._record
+        ]
+
+    @staticmethod
+    def movement_state(movement):
+        return (
+            movement.product._code, movement.amount, movement.type,
+            movement._actor_id, movement.reason, movement.bill_id,
+            movement.date.isoformat()
+        )
+
+    @staticmethod
+    def compare(expected, actual):
+        problems = []
+        for name in ("customers", "suppliers", "bills"):
+            missing = set(getattr(expected, name)) - set(getattr(actual, name))
+            extra = set(getattr(actual, name)) - set(getattr(expected, name))
+            for key in sorted(missing):
+                problems.append(f"{name[:-1]} {key} is missing")
+            for key in sorted(extra):
+                problems.append(f"{name[:-1]} {key} is unexpected")
+
+        for code in sorted(set(expected.records) | set(actual.records)):
+            if code not in actual.records:
+                problems.append(f"record {code} is missing")
+            elif code not in expected.records:
+                problems.append(f"record {code} is unexpected")
+            else:
+                want = StateVerifier.record_state(expected.records[code])
+                got = StateVerifier.record_state(actual.records[code])
+                if want != got:
+                    problems.append(f"record {code}: {got} != {want}")
+                want = StateVerifier.applied_state(expected.records[code])
+                got = StateVerifier.applied_state(actual.records[code])
+                if want != got:
+                    problems.append(
+                        f"record {code}: applied movements {got} != {want}"
+                    )
+
+        if len(expected.movements) != len(actual.movements):
+            problems.append(
+                f"{len(actual.movements)} movements, expected "
+                f"{len(expected.movements)}"
+            )
+        for seq, (want, got) in enumerate(
+            zip(expected.movements, actual.movements)
+        ):
+            want = StateVerifier.movement_state(want)
+            got = StateVerifier.movement_state(got)
+            if want != got:
+                problems.append(f"movement {seq}: {got} != {want}")
+        return problems
+
+    @staticmethod
+    def check(system):
+        problems = []
+        for seq, movement in enumerate(system.movements):
+            if movement._seq != seq:
+                problems.append(f"movement {seq} carries seq {movement._seq}")
+
+        for code, record in system.records.items():
+            stock = record.stock
+            actual = stock.get_actual_stock()
+            if not 0 <= actual <= stock.maximum_stock:
+                problems.append(f"record {code}: stock {actual} out of range")
+            opening = getattr(stock, "opening_stock", None)
+            delta = 0
+            for movement in stock._record:
+                delta += movement.get_delta()
+                seq = getattr(movement, "_seq", None)
+                if seq is None:
+                    continue
+                if (
+                    seq >= len(system.movements) or
+                    system.movements[seq].product._code != code
+                ):
+                    problems.append(
+                        f"record {code}: applied movement {seq} "
+                        "is not in the ledger"
+                    )
+            if opening is not None and opening + delta != actual:
+                problems.append(
+                    f"record {code}: stock {actual} != opening stock "
+                    f"{opening} plus applied movements {delta}"
+                )
+
+        for name, code, actual, expected in system.check_aggregates():
+            problems.append(f"aggregates {name} {code}: {actual} != {expected}")
+        return problems
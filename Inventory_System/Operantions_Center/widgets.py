@@ -0,0 +1,223 @@
+import tkinter as tk
+from tkinter import ttk
+
+
+class VirtualWindow:
+    def setup_window(self, fetch, count, height):
+        self.fetch = fetch
+        self.count = count
+        self.height = height
+        self.offset = 0
+        self.total = 0
+        self.rows = []
+        self.selected = {}
+
+        self.scrollbar = ttk.Scrollbar(
+            self, orient="vertical", command=self.yview
+        )
+        self.scrollbar.grid(row=0, column=1, sticky="ns")
+        self.rowconfigure(0, weight=1)
+        self.columnconfigure(0, weight=1)
+
+    def bind_scrolling(self, widget):
+        widget.bind("<MouseWheel>", self._on_wheel)
+        widget.bind("<Button-4>", lambda event: self.scroll(-3))
+        widget.bind("<Button-5>", lambda event: self.scroll(3))
+
+    def refresh(self):
+        self.total = self.count()
+        self.offset = max(0, min(self.offset, self.total - self.height))
+        self.rows = self.fetch(self.offset, self.height)
+        self.draw()
+        if self.total:
+            self.scrollbar.set(
+                self.offset / self.total,
+                min(1.0, (self.offset + self.height) / self.total)
+            )
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+    def reset(self):
+        self.offset = 0
+        self.selected.clear()
+        self.refresh()
+
+    def scroll(self, rows):
+        self.offset += rows
+        self.refresh()
+        return "break"
+
+    def yview(self, *args):
+        if args[0] == "moveto":
+            self.offset = int(float(args[1]) * self.total)
+            self.refresh()
+        elif args[0] == "scroll":
+            step = int(args[1])
+            if args[2] == "pages":
+                step *= self.height
+            self.scroll(step)
+
+    def _on_wheel(self, event):
+        return self.scroll(-3 if event.delta > 0 else 3)
+
+    def remember_selection(self, visible):
+        for index, row in enumerate(self.rows):
+            if index in visible:
+                self.selected[self.offset + index] = row
+            else:
+                self.selected.pop(self.offset + index, None)
+
+    def selected_rows(self):
+        return [self.selected[index] for index in sorted(self.selected)]
+
+
+class VirtualTreeview(ttk.Frame, VirtualWindow):
+    def __init__(self, parent, columns, fetch, count, render, height=15):
+        super().__init__(parent)
+        self.render = render
+        self.tree = ttk.Treeview(
+            self, columns=columns, show="headings", height=height,
+            style="Treeview"
+        )
+        for c in columns:
+            self.tree.heading(c, text=c)
+            self.tree.column(c, anchor="center")
+        self.tree.grid(row=0, column=0, sticky="nsew")
+
+        self.setup_window(fetch, count, height)
+        self.bind_scrolling(self.tree)
+        self.tree.bind("<<TreeviewSelect>>", self._on_select)
+        self.refresh()
+
+    def draw(self):
+        self.tree.delete(*self.tree.get_children())
+        for index, row in enumerate(self.rows):
+            position = self.offset + index
+            self.tree.insert(
+                "", "end", iid=str(position), values=self.render(position, row)
+            )
+        self.tree.selection_set(
+            [str(index) for index in self.selected if self.tree.exists(
+                str(index)
+            )]
+        )
+
+    def _on_select(self, event):
+        self.remember_selection(
+            {int(iid) - self.offset for iid in self.tree.selection()}
+        )
+
+
+class VirtualListbox(ttk.Frame, VirtualWindow):
+    def __init__(
+        self, parent, fetch, count, render, height=4, width=70,
+        selectmode=tk.EXTENDED
+    ):
+        super().__init__(parent)
+        self.render = render
+        self.listbox = tk.Listbox(
+            self, selectmode=selectmode, width=width, height=height,
+            exportselection=False
+        )
+        self.listbox.grid(row=0, column=0, sticky="nsew")
+
+        self.setup_window(fetch, count, height)
+        self.bind_scrolling(self.listbox)
+        self.listbox.bind("<<ListboxSelect>>", self._on_select)
+        for key in ("<Up>", "<Down>", "<Prior>", "<Next>"):
+            self.listbox.bind(key, self._on_key)
+        self.refresh()
+
+    def draw(self):
+        self.listbox.delete(0, tk.END)
+        for index, row in enumerate(self.rows):
+            self.listbox.insert(tk.END, self.render(self.offset + index, row))
+            if self.offset + index in self.selected:
+                self.listbox.selection_set(index)
+
+    def _on_select(self, event):
+        self.remember_selection(set(self.listbox.curselection()))
+
+    def _on_key(self, event):
+        steps = {
+            "Up": -1, "Down": 1, "Prior": -self.height, "Next": self.height
+        }
+        return self.scroll(steps[event.keysym])
+
+
+class TypeAheadEntry(ttk.Frame):
+    def __init__(
+        self, parent, search, limit=8, delay=150, on_select=None, width=40
+    ):
+        super().__init__(parent)
+        self.search = search
+        self.limit = limit
+        self.delay = delay
+        self.on_select = on_select
+        self.value = None
+        self.matches = []
+        self._pending = None
+
+        self.text = tk.StringVar()
+        self.entry = ttk.Entry(self, textvariable=self.text, width=width)
+        self.entry.pack(fill="x")
+        self.listbox = tk.Listbox(
+            self, height=limit, width=width, exportselection=False
+        )
+        self.listbox.pack(fill="x")
+
+        self.entry.bind("<KeyRelease>", self._on_key)
+        self.entry.bind("<Down>", lambda event: self._move(1))
+        self.entry.bind("<Up>", lambda event: self._move(-1))
+        self.entry.bind("<Return>", lambda event: self._choose())
+        self.listbox.bind("<<ListboxSelect>>", lambda event: self._choose())
+        self.update_matches()
+
+    def _on_key(self, event):
+        if event.keysym in ("Up", "Down", "Return"):
+            return
+        self.value = None
+        if self._pending:
+            self.after_cancel(self._pending)
+        self._pending = self.after(self.delay, self.update_matches)
+
+    def update_matches(self):
+        self._pending = None
+        self.matches = self.search(self.text.get().strip(), self.limit)
+        self.listbox.delete(0, tk.END)
+        for label, value in self.matches:
+            self.listbox.insert(tk.END, label)
+        if self.matches:
+            self.listbox.selection_set(0)
+
+    def _move(self, step):
+        if not self.matches:
+            return "break"
+        current = self.listbox.curselection()
+        index = (current[0] + step) if current else 0
+        index = max(0, min(index, len(self.matches) - 1))
+        self.listbox.selection_clear(0, tk.END)
+        self.listbox.selection_set(index)
+        self.listbox.see(index)
+        return "break"
+
+    def _choose(self):
+        current = self.listbox.curselection()
+        if not current:
+            return
+        label, value = self.matches[current[0]]
+        self.text.set(label)
+        self.value = value
+        if self.on_select:
+            self.on_select(value)
+
+    def set(self, label, value):
+        self.text.set(label)
+        self.value = value
+
+    def get(self):
+        if self.value is None:
+            for label, value in self.matches:
+                if label == self.text.get().strip():
+                    return value
+        return self.value
@@ -1,6 +1,8 @@
 import uuid
 
 class Customer:
+    __slots__ = ("name", "number_id", "_id")
+
     def __init__(self, name, number_id, customer_id=None):
         self.name = name
         self.number_id = number_id
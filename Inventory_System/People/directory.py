@@ -0,0 +1,103 @@
+from bisect import bisect_left
+from itertools import islice
+
+
+class ActorDirectory:
+    def __init__(self, contact_attribute):
+        self.contact_attribute = contact_attribute
+        self._by_name = {}
+        self._by_contact = {}
+        self._sorted_names = []
+        self._sorted = True
+
+    @staticmethod
+    def normalize_name(name):
+        return " ".join(str(name).casefold().split())
+
+    @staticmethod
+    def normalize_contact(contact):
+        return "".join(ch for ch in str(contact).casefold() if ch.isalnum())
+
+    def contact_of(self, actor):
+        return getattr(actor, self.contact_attribute)
+
+    def __len__(self):
+        return sum(len(actors) for actors in self._by_name.values())
+
+    def add(self, actor):
+        name = self.normalize_name(actor.name)
+        if name not in self._by_name:
+            self._by_name[name] = {}
+            self._sorted = False
+        self._by_name[name][actor._id] = actor
+
+        contact = self.normalize_contact(self.contact_of(actor))
+        self._by_contact.setdefault(contact, {})[actor._id] = actor
+
+    def remove(self, actor):
+        name = self.normalize_name(actor.name)
+        actors = self._by_name.get(name, {})
+        actors.pop(actor._id, None)
+        if not actors:
+            self._by_name.pop(name, None)
+            self._sorted = False
+
+        contact = self.normalize_contact(self.contact_of(actor))
+        actors = self._by_contact.get(contact, {})
+        actors.pop(actor._id, None)
+        if not actors:
+            self._by_contact.pop(contact, None)
+
+    def find_by_name(self, name):
+        return list(self._by_name.get(self.normalize_name(name), {}).values())
+
+    def find_by_contact(self, contact):
+        return list(
+            self._by_contact.get(self.normalize_contact(contact), {}).values()
+        )
+
+    def first(self, name):
+        actors = self._by_name.get(self.normalize_name(name))
+        if not actors:
+            return None
+        return next(iter(actors.values()))
+
+    def find_duplicate(self, name, contact, exact=False):
+        for actor in self._by_name.get(self.normalize_name(name), {}).values():
+            if exact:
+                if actor.name == name and self.contact_of(actor) == contact:
+                    return actor
+            elif (
+                self.normalize_contact(self.contact_of(actor)) ==
+                self.normalize_contact(contact)
+            ):
+                return actor
+        return None
+
+    def duplicates(self):
+        groups = {}
+        for name, actors in self._by_name.items():
+            for actor in actors.values():
+                key = (name, self.normalize_contact(self.contact_of(actor)))
+                groups.setdefault(key, []).append(actor)
+        return [actors for actors in groups.values() if len(actors) > 1]
+
+    def _names(self):
+        if not self._sorted:
+            self._sorted_names = sorted(self._by_name)
+            self._sorted = True
+        return self._sorted_names
+
+    def search(self, prefix, limit=None):
+        prefix = self.normalize_name(prefix)
+        names = self._names()
+        start = bisect_left(names, prefix)
+
+        def matches():
+            for index in range(start, len(names)):
+                name = names[index]
+                if not name.startswith(prefix):
+                    return
+                yield from self._by_name[name].values()
+
+        return list(islice(matches(), limit))
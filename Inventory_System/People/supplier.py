@@ -1,6 +1,8 @@
 import uuid
 
 class Supplier:
+    __slots__ = ("name", "contact_number", "_id")
+
     def __init__(self, name, contact_number, supplier_id=None):
         self.name = name
         self.contact_number = contact_number
@@ -1,6 +1,12 @@
+import sys
+
 class Product:
+    __slots__ = ("name", "category", "_code", "_price", "_state")
+
     def __init__(self, name, category, code, price, state):
         self.name = name
+        if isinstance(category, str):
+            category = sys.intern(category)
         self.category = category
         self._code = code
         self._price = price
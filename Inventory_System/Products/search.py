@@ -0,0 +1,202 @@
+import heapq
+import re
+from bisect import bisect_left, insort
+
+TOKEN = re.compile(r"\w+")
+
+
+class ProductSearchIndex:
+    FIELD_WEIGHTS = {"code": 4.0, "name": 3.0, "category": 1.0}
+    EXACT, PREFIX = 1.0, 0.7
+    MAX_EXPANSIONS = 200
+    MIN_SIMILARITY = 0.4
+
+    def __init__(self):
+        self._products = {}
+        self._postings = {}
+        self._grams = {}
+        self._tokens = []
+        self._pending = set()
+
+    def __len__(self):
+        return len(self._products)
+
+    @staticmethod
+    def tokenize(text):
+        return TOKEN.findall(str(text).casefold())
+
+    @staticmethod
+    def trigrams(token):
+        padded = f"  {token} "
+        return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+    def _fields(self, product):
+        fields = {}
+        for field, text in (
+            ("name", product.name), ("category", product.category)
+        ):
+            for token in self.tokenize(text):
+                weight = self.FIELD_WEIGHTS[field]
+                fields[token] = max(fields.get(token, 0.0), weight)
+
+        code = str(product._code).casefold()
+        for token in [code] + self.tokenize(code):
+            fields[token] = self.FIELD_WEIGHTS["code"]
+        return fields
+
+    def add(self, product):
+        code = product._code
+        if code in self._products:
+            self.remove(product)
+        self._products[code] = product
+
+        for token, weight in self._fields(product).items():
+            postings = self._postings.get(token)
+            if postings is None:
+                postings = self._postings[token] = {}
+                self._pending.add(token)
+                for gram in self.trigrams(token):
+                    self._grams.setdefault(gram, set()).add(token)
+            postings.setdefault(weight, set()).add(code)
+
+    def remove(self, product):
+        code = product._code
+        product = self._products.pop(code, None)
+        if product is None:
+            return
+
+        for token, weight in self._fields(product).items():
+            postings = self._postings.get(token)
+            if postings is None:
+                continue
+            codes = postings.get(weight, set())
+            codes.discard(code)
+            if not codes:
+                postings.pop(weight, None)
+            if not postings:
+                del self._postings[token]
+                if token in self._pending:
+                    self._pending.discard(token)
+                else:
+                    index = bisect_left(self._tokens, token)
+                    if (
+                        index < len(self._tokens) and
+                        self._tokens[index] == token
+                    ):
+                        del self._tokens[index]
+                for gram in self.trigrams(token):
+                    tokens = self._grams.get(gram)
+                    if tokens is not None:
+                        tokens.discard(token)
+                        if not tokens:
+                            del self._grams[gram]
+
+    def _sorted_tokens(self):
+        if self._pending:
+            if len(self._pending) > 64:
+                self._tokens = sorted(self._postings)
+            else:
+                for token in self._pending:
+                    insort(self._tokens, token)
+            self._pending.clear()
+        return self._tokens
+
+    def _prefix_matches(self, prefix):
+        tokens = self._sorted_tokens()
+        matches = []
+        for index in range(bisect_left(tokens, prefix), len(tokens)):
+            token = tokens[index]
+            if not token.startswith(prefix):
+                break
+            if token in self._postings:
+                matches.append(token)
+                if len(matches) >= self.MAX_EXPANSIONS:
+                    break
+        return matches
+
+    def _fuzzy_matches(self, term):
+        grams = self.trigrams(term)
+        shared = {}
+        for gram in grams:
+            for token in self._grams.get(gram, ()):
+                shared[token] = shared.get(token, 0) + 1
+
+        matches = []
+        for token, count in shared.items():
+            similarity = 2 * count / (len(grams) + len(self.trigrams(token)))
+            if similarity >= self.MIN_SIMILARITY:
+                matches.append((similarity, token))
+        return heapq.nlargest(self.MAX_EXPANSIONS, matches)
+
+    def _term_tiers(self, term):
+        tiers = {}
+
+        def collect(token, factor):
+            for weight, codes in self._postings[token].items():
+                score = round(weight * factor, 6)
+                tiers.setdefault(score, []).append(codes)
+
+        if term in self._postings:
+            collect(term, self.EXACT)
+        for token in self._prefix_matches(term):
+            if token != term:
+                collect(token, self.PREFIX * len(term) / len(token))
+        if not tiers:
+            for similarity, token in self._fuzzy_matches(term):
+                collect(token, self.PREFIX * similarity)
+
+        return sorted(
+            (
+                (score, groups[0] if len(groups) == 1 else set().union(*groups))
+                for score, groups in tiers.items()
+            ),
+            key=lambda tier: tier[0], reverse=True
+        )
+
+    @staticmethod
+    def _best_score(tiers, code):
+        for score, codes in tiers:
+            if code in codes:
+                return score
+        return 0.0
+
+    def search(self, query, limit=20):
+        terms = set(self.tokenize(query))
+        if not terms:
+            return []
+
+        term_tiers = [self._term_tiers(term) for term in terms]
+        if not all(term_tiers):
+            return []
+
+        if len(term_tiers) == 1:
+            ranked = []
+            seen = set()
+            for score, codes in term_tiers[0]:
+                fresh = codes - seen if seen else codes
+                if limit is None:
+                    ranked.extend(sorted(fresh))
+                else:
+                    ranked.extend(heapq.nsmallest(limit - len(ranked), fresh))
+                    if len(ranked) >= limit:
+                        break
+                seen = seen | fresh
+            return [self._products[code] for code in ranked]
+
+        matches = sorted(
+            (set().union(*(codes for score, codes in tiers))
+             for tiers in term_tiers),
+            key=len
+        )
+        candidates = matches[0].intersection(*matches[1:])
+        def rank(code):
+            return (
+                -sum(self._best_score(tiers, code) for tiers in term_tiers),
+                code
+            )
+
+        if limit is None:
+            ranked = sorted(candidates, key=rank)
+        else:
+            ranked = heapq.nsmallest(limit, candidates, key=rank)
+        return [self._products[code] for code in ranked]
@@ -1,9 +1,30 @@
 import datetime
+import sys
 
 class State:
-    def __init__(self, condition = None, expiration_date = None):
-        self._condition = condition
-        self._expiration_date = expiration_date
+    __slots__ = ("_condition", "_expiration_date")
+    _shared = {}
+
+    def __new__(cls, condition = None, expiration_date = None):
+        if isinstance(condition, str):
+            condition = sys.intern(condition)
+        if expiration_date is not None:
+            expiration_date = tuple(expiration_date)
+
+        key = (condition, expiration_date)
+        state = cls._shared.get(key)
+        if state is None:
+            state = super().__new__(cls)
+            object.__setattr__(state, "_condition", condition)
+            object.__setattr__(state, "_expiration_date", expiration_date)
+            cls._shared[key] = state
+        return state
+
+    def __setattr__(self, name, value):
+        raise AttributeError("State instances are immutable.")
+
+    def __reduce__(self):
+        return (State, (self._condition, self._expiration_date))
 
     def is_expired(self):
         if self._expiration_date:
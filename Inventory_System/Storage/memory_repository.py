@@ -0,0 +1,65 @@
+from Inventory_System.Storage.repository import Repository
+
+
+class MemoryRepository(Repository):
+    def __init__(self, system=None):
+        self.system = system
+
+    def load(self, system):
+        self.system = system
+
+    def save_customer(self, customer):
+        pass
+
+    def save_supplier(self, supplier):
+        pass
+
+    def save_record(self, record):
+        pass
+
+    def remove_record(self, code):
+        pass
+
+    def save_limits(self, record):
+        pass
+
+    def save_system(self, system):
+        pass
+
+    def save_movement(self, movement, applied):
+        pass
+
+    def save_movements(self, movements, applied):
+        pass
+
+    def mark_applied(self, movements):
+        pass
+
+    def mark_billed(self, movement, bill_id):
+        pass
+
+    def save_bill(self, bill):
+        pass
+
+    def movements_by_code(self, code):
+        return self.system.get_movements_by_code(code)
+
+    def movements_by_actor(self, actor_id, actor_type=None):
+        return self.system.get_movements_by_actor(actor_id, actor_type)
+
+    def unbilled_movements(self, actor_id):
+        return self.system.get_unbilled_movements(actor_id)
+
+    def query_movements(
+        self, start=None, end=None, product=None, actor=None, type=None,
+        cursor=None
+    ):
+        return self.system.scan_movements(
+            start, end, product, actor, type, cursor
+        )
+
+    def sales_summary(self, product_code=None):
+        return self.system.sales_summary(product_code)
+
+    def critical_records(self, limit=None):
+        return self.system.get_critical_records(limit)
@@ -0,0 +1,119 @@
+from contextlib import contextmanager
+
+
+class Repository:
+    def load(self, system):
+        raise NotImplementedError(
+            "Subclasses must implement the load() method."
+        )
+
+    def save_customer(self, customer):
+        raise NotImplementedError(
+            "Subclasses must implement the save_customer() method."
+        )
+
+    def save_supplier(self, supplier):
+        raise NotImplementedError(
+            "Subclasses must implement the save_supplier() method."
+        )
+
+    def save_record(self, record):
+        raise NotImplementedError(
+            "Subclasses must implement the save_record() method."
+        )
+
+    def remove_record(self, code):
+        raise NotImplementedError(
+            "Subclasses must implement the remove_record() method."
+        )
+
+    def save_limits(self, record):
+        raise NotImplementedError(
+            "Subclasses must implement the save_limits() method."
+        )
+
+    def save_movement(self, movement, applied):
+        raise NotImplementedError(
+            "Subclasses must implement the save_movement() method."
+        )
+
+    def save_movements(self, movements, applied):
+        for movement in movements:
+            self.save_movement(movement, applied)
+
+    def save_system(self, system):
+        with self.batch():
+            for customer in system.customers.values():
+                self.save_customer(customer)
+            for supplier in system.suppliers.values():
+                self.save_supplier(supplier)
+            for record in system.records.values():
+                self.save_record(record)
+            self.save_movements(system.movements, False)
+            self.mark_applied([
+                movement
+                for record in system.records.values()
+                for movement in record.stock._record
+                if getattr(movement, "_seq", None) is not None
+            ])
+            for bill in system.bills.values():
+                self.save_bill(bill)
+
+    def mark_applied(self, movements):
+        raise NotImplementedError(
+            "Subclasses must implement the mark_applied() method."
+        )
+
+    def mark_billed(self, movement, bill_id):
+        raise NotImplementedError(
+            "Subclasses must implement the mark_billed() method."
+        )
+
+    def save_bill(self, bill):
+        raise NotImplementedError(
+            "Subclasses must implement the save_bill() method."
+        )
+
+    def movements_by_code(self, code):
+        raise NotImplementedError(
+            "Subclasses must implement the movements_by_code() method."
+        )
+
+    def movements_by_actor(self, actor_id, actor_type=None):
+        raise NotImplementedError(
+            "Subclasses must implement the movements_by_actor() method."
+        )
+
+    def unbilled_movements(self, actor_id):
+        raise NotImplementedError(
+            "Subclasses must implement the unbilled_movements() method."
+        )
+
+    def query_movements(
+        self, start=None, end=None, product=None, actor=None, type=None,
+        cursor=None
+    ):
+        raise NotImplementedError(
+            "Subclasses must implement the query_movements() method."
+        )
+
+    def sales_summary(self, product_code=None):
+        raise NotImplementedError(
+            "Subclasses must implement the sales_summary() method."
+        )
+
+    def critical_records(self, limit=None):
+        raise NotImplementedError(
+            "Subclasses must implement the critical_records() method."
+        )
+
+    @contextmanager
+    def batch(self):
+        yield
+        self.flush()
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.flush()
@@ -0,0 +1,434 @@
+import json
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import date, datetime, time
+
+from Inventory_System.Inventory_Management.inventory_record import InventoryRecord
+from Inventory_System.Inventory_Management.location import Location
+from Inventory_System.Inventory_Management.stock import Stock
+from Inventory_System.Operantions_Center.extracts import Extracts
+from Inventory_System.People.customer import Customer
+from Inventory_System.People.supplier import Supplier
+from Inventory_System.Storage.repository import Repository
+from Inventory_System.Transactions.movements import Movement
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS customers (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    number_id TEXT
+);
+CREATE TABLE IF NOT EXISTS suppliers (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    contact_number TEXT
+);
+CREATE TABLE IF NOT EXISTS records (
+    code TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    category TEXT NOT NULL,
+    price REAL NOT NULL,
+    product TEXT NOT NULL,
+    actual_stock INTEGER NOT NULL,
+    minimum_stock INTEGER NOT NULL,
+    maximum_stock INTEGER NOT NULL,
+    aisle INTEGER,
+    shelf INTEGER,
+    active INTEGER NOT NULL DEFAULT 1,
+    opening_stock INTEGER
+);
+CREATE TABLE IF NOT EXISTS movements (
+    seq INTEGER PRIMARY KEY,
+    code TEXT NOT NULL,
+    amount INTEGER NOT NULL,
+    type TEXT NOT NULL,
+    actor_id TEXT NOT NULL,
+    actor_type TEXT NOT NULL,
+    reason TEXT,
+    date TEXT NOT NULL,
+    final_price REAL NOT NULL,
+    bill_id TEXT,
+    applied INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS bills (
+    id TEXT PRIMARY KEY,
+    entity_id TEXT NOT NULL,
+    entity_type TEXT NOT NULL,
+    date TEXT NOT NULL,
+    total REAL NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS movements_by_code ON movements (code, seq);
+CREATE INDEX IF NOT EXISTS movements_by_actor ON movements (actor_id, seq);
+CREATE INDEX IF NOT EXISTS movements_unbilled
+    ON movements (actor_id, seq) WHERE bill_id IS NULL;
+CREATE INDEX IF NOT EXISTS movements_by_date ON movements (date);
+CREATE INDEX IF NOT EXISTS records_shortage
+    ON records (minimum_stock - actual_stock) WHERE active = 1;
+"""
+
+
+class SQLiteRepository(Repository):
+    def __init__(self, path="inventory.db", batch_size=500):
+        self.path = path
+        self.batch_size = batch_size
+        self.system = None
+        self._products = {}
+        self._pending_movements = []
+        self._pending_bills = []
+        self._pending_applied = []
+        self._dirty_codes = set()
+        self._writes = 0
+        self._batches = 0
+        self._lock = threading.RLock()
+
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.executescript(SCHEMA)
+        columns = {
+            row[1] for row in
+            self.connection.execute("PRAGMA table_info(records)")
+        }
+        if "opening_stock" not in columns:
+            self.connection.execute(
+                "ALTER TABLE records ADD COLUMN opening_stock INTEGER"
+            )
+
+    def load(self, system):
+        self.system = system
+        cursor = self.connection.cursor()
+        no_opening = []
+
+        for row in cursor.execute("SELECT id, name, number_id FROM customers"):
+            system.add_customer(Customer(row[1], row[2], row[0]))
+        for row in cursor.execute(
+            "SELECT id, name, contact_number FROM suppliers"
+        ):
+            system.add_supplier(Supplier(row[1], row[2], row[0]))
+
+        for row in cursor.execute(
+            "SELECT product, actual_stock, minimum_stock, maximum_stock, "
+            "aisle, shelf, active, opening_stock FROM records"
+        ):
+            product = Extracts.dict_to_product(json.loads(row[0]))
+            self._products[product._code] = product
+            if row[6]:
+                stock = Stock(row[1], row[2], row[3], row[7])
+                location = Location(row[4], row[5])
+                system.add_record(InventoryRecord(product, stock, location))
+                if row[7] is None:
+                    no_opening.append(stock)
+
+        for row in cursor.execute(
+            "SELECT seq, code, amount, actor_id, actor_type, reason, date, "
+            "final_price, bill_id, applied FROM movements ORDER BY seq"
+        ):
+            movement = self._movement_from_row(row)
+            system.add_movement(movement, apply_stock=False)
+            if row[9] and movement.product._code in system.records:
+                system.records[movement.product._code].stock._record.append(
+                    movement
+                )
+
+        for stock in no_opening:
+            stock.derive_opening_stock()
+
+        for row in cursor.execute("SELECT data FROM bills"):
+            bill = Extracts.dict_to_bill(json.loads(row[0]), system)
+            system.bills[bill._bill_id] = bill
+
+        print(f"Loaded {len(system.movements)} movements from {self.path}")
+
+    def _movement_from_row(self, row):
+        seq, code, amount, actor_id, actor_type = row[:5]
+        reason, date, final_price, bill_id = row[5:9]
+        if actor_type == "customer":
+            actor = self.system.customers[actor_id]
+        else:
+            actor = self.system.suppliers[actor_id]
+
+        movement = Movement(
+            self._products[code], amount, actor, reason, bill_id
+        )
+        movement.date = datetime.fromisoformat(date)
+        movement.final_price = final_price
+        movement._seq = seq
+        return movement
+
+    @contextmanager
+    def batch(self):
+        # Each logical write commits on its own; inside a batch the commits
+        # are deferred and grouped every batch_size writes instead.
+        with self._lock:
+            self._batches += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._batches -= 1
+                if not self._batches:
+                    self.flush()
+
+    def _wrote(self, count=1):
+        self._writes += count
+        if not self._batches or self._writes >= self.batch_size:
+            self.flush()
+
+    def _write(self, sql, params):
+        with self._lock:
+            self.connection.execute(sql, params)
+            self._wrote()
+
+    def save_customer(self, customer):
+        self._write(
+            "INSERT OR REPLACE INTO customers VALUES (?, ?, ?)",
+            (customer._id, customer.name, customer.number_id)
+        )
+
+    def save_supplier(self, supplier):
+        self._write(
+            "INSERT OR REPLACE INTO suppliers VALUES (?, ?, ?)",
+            (supplier._id, supplier.name, supplier.contact_number)
+        )
+
+    def save_record(self, record):
+        product = record.product
+        stock = record.stock
+        self._products[product._code] = product
+        self._write(
+            "INSERT OR REPLACE INTO records VALUES "
+            "(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 1, ?)",
+            (
+                product._code, product.name, product.category,
+                product._price, json.dumps(product.to_dict()),
+                stock.get_actual_stock(), stock.minimum_stock,
+                stock.maximum_stock, record.location.aisle,
+                record.location.shelf, stock.opening_stock
+            )
+        )
+
+    def remove_record(self, code):
+        with self._lock:
+            self._dirty_codes.discard(code)
+            self._write(
+                "UPDATE records SET active = 0 WHERE code = ?", (code,)
+            )
+
+    def save_limits(self, record):
+        with self._lock:
+            self._dirty_codes.add(record.product._code)
+            self._wrote()
+
+    @staticmethod
+    def _movement_row(movement, applied):
+        return (
+            movement._seq, movement.product._code, movement.amount,
+            movement.type, movement._actor_id, movement.actor_type,
+            movement.reason, movement.date.isoformat(),
+            movement.final_price, movement.bill_id, int(applied)
+        )
+
+    def save_movement(self, movement, applied):
+        self.save_movements([movement], applied)
+
+    def save_movements(self, movements, applied):
+        with self._lock:
+            self._pending_movements.extend(
+                self._movement_row(movement, applied) for movement in movements
+            )
+            if applied:
+                self._dirty_codes.update(m.product._code for m in movements)
+            self._wrote(len(movements))
+
+    def mark_applied(self, movements):
+        with self._lock:
+            self._pending_applied.extend((m._seq,) for m in movements)
+            self._wrote(len(movements))
+
+    def mark_billed(self, movement, bill_id):
+        seq = getattr(movement, "_seq", None)
+        if seq is None:
+            return
+        with self._lock:
+            self._pending_bills.append((bill_id, seq))
+            self._wrote()
+
+    def save_bill(self, bill):
+        data = bill.to_dict()
+        data["date"] = bill.date.isoformat()
+        with self._lock:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO bills VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    bill._bill_id, bill.entity._id, bill.entity_type,
+                    data["date"], data["total"], json.dumps(data)
+                )
+            )
+            self._wrote()
+
+    def flush(self):
+        with self._lock:
+            if not self._writes:
+                return
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO movements VALUES "
+                "(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                self._pending_movements
+            )
+            self.connection.executemany(
+                "UPDATE movements SET bill_id = ? WHERE seq = ?",
+                self._pending_bills
+            )
+            self.connection.executemany(
+                "UPDATE movements SET applied = 1 WHERE seq = ?",
+                self._pending_applied
+            )
+            self.connection.executemany(
+                "UPDATE records SET actual_stock = ?, minimum_stock = ?, "
+                "maximum_stock = ? WHERE code = ?",
+                [
+                    (
+                        stock.get_actual_stock(), stock.minimum_stock,
+                        stock.maximum_stock, code
+                    )
+                    for code, stock in (
+                        (code, self.system.records[code].stock)
+                        for code in self._dirty_codes
+                        if code in self.system.records
+                    )
+                ]
+            )
+            self.connection.commit()
+            self._pending_movements.clear()
+            self._pending_bills.clear()
+            self._pending_applied.clear()
+            self._dirty_codes.clear()
+            self._writes = 0
+
+    def close(self):
+        with self._lock:
+            self.flush()
+            self.connection.close()
+
+    def _query_movements(self, sql, params):
+        with self._lock:
+            self.flush()
+            rows = self.connection.execute(sql, params).fetchall()
+        return [self._movement_from_row(row) for row in rows]
+
+    def movements_by_code(self, code):
+        return self._query_movements(
+            "SELECT seq, code, amount, actor_id, actor_type, reason, date, "
+            "final_price, bill_id, applied FROM movements "
+            "WHERE code = ? ORDER BY seq",
+            (code,)
+        )
+
+    def movements_by_actor(self, actor_id, actor_type=None):
+        sql = (
+            "SELECT seq, code, amount, actor_id, actor_type, reason, date, "
+            "final_price, bill_id, applied FROM movements WHERE actor_id = ?"
+        )
+        params = (actor_id,)
+        if actor_type:
+            sql += " AND actor_type = ?"
+            params += (actor_type,)
+        return self._query_movements(sql + " ORDER BY seq", params)
+
+    def unbilled_movements(self, actor_id):
+        return self._query_movements(
+            "SELECT seq, code, amount, actor_id, actor_type, reason, date, "
+            "final_price, bill_id, applied FROM movements "
+            "WHERE actor_id = ? AND bill_id IS NULL ORDER BY seq",
+            (actor_id,)
+        )
+
+    @staticmethod
+    def _iso(when):
+        if isinstance(when, datetime):
+            return when.isoformat()
+        if isinstance(when, date):
+            return datetime.combine(when, time.min).isoformat()
+        return datetime.fromtimestamp(when).isoformat()
+
+    def query_movements(
+        self, start=None, end=None, product=None, actor=None, type=None,
+        cursor=None, page_size=500
+    ):
+        sql = (
+            "SELECT seq, code, amount, actor_id, actor_type, reason, date, "
+            "final_price, bill_id, applied FROM movements WHERE 1 = 1"
+        )
+        params = ()
+        for column, operator, value in (
+            ("date", ">=", start), ("date", "<", end), ("code", "=", product),
+            ("actor_id", "=", actor), ("type", "=", type)
+        ):
+            if value is None:
+                continue
+            if column == "date":
+                value = self._iso(value)
+            sql += f" AND {column} {operator} ?"
+            params += (value,)
+
+        after = tuple(cursor.rsplit("|", 1)) if cursor else None
+        while True:
+            page_sql, page_params = sql, params
+            if after:
+                page_sql += " AND (date > ? OR (date = ? AND seq > ?))"
+                page_params += (after[0], after[0], int(after[1]))
+            page_sql += " ORDER BY date, seq LIMIT ?"
+            page_params += (page_size,)
+
+            movements = self._query_movements(page_sql, page_params)
+            yield from movements
+            if len(movements) < page_size:
+                return
+            last = movements[-1]
+            after = (last.date.isoformat(), last._seq)
+
+    def sales_summary(self, product_code=None):
+        sql = (
+            "SELECT m.code, r.name, "
+            "SUM(CASE WHEN m.type = 'in' THEN m.amount ELSE 0 END), "
+            "SUM(CASE WHEN m.type = 'in' THEN m.amount * r.price ELSE 0 END), "
+            "SUM(CASE WHEN m.type = 'out' THEN m.amount ELSE 0 END), "
+            "SUM(CASE WHEN m.type = 'out' "
+            "THEN m.amount * m.final_price ELSE 0 END) "
+            "FROM movements m JOIN records r ON r.code = m.code"
+        )
+        params = ()
+        if product_code:
+            sql += " WHERE m.code = ?"
+            params = (product_code,)
+        sql += " GROUP BY m.code ORDER BY MIN(m.seq)"
+
+        with self._lock:
+            self.flush()
+            rows = self.connection.execute(sql, params).fetchall()
+        return {
+            code: {
+                "name": name,
+                "in": {"qty": in_qty, "cost": float(in_cost)},
+                "out": {"qty": out_qty, "cost": float(out_cost)}
+            }
+            for code, name, in_qty, in_cost, out_qty, out_cost in rows
+        }
+
+    def critical_records(self, limit=None):
+        sql = (
+            "SELECT code FROM records "
+            "WHERE active = 1 AND actual_stock < minimum_stock "
+            "ORDER BY minimum_stock - actual_stock DESC"
+        )
+        params = ()
+        if limit is not None:
+            sql += " LIMIT ?"
+            params = (limit,)
+
+        with self._lock:
+            self.flush()
+            rows = self.connection.execute(sql, params).fetchall()
+        return [self.system.records[row[0]] for row in rows]
@@ -0,0 +1,140 @@
+import heapq
+from datetime import datetime
+
+IN_QTY, IN_COST, OUT_QTY, OUT_COST = range(4)
+
+
+class SalesAggregates:
+    def __init__(self):
+        self._products = {}
+        self._totals = {}
+        self._days = {}
+
+    @classmethod
+    def from_movements(cls, movements):
+        aggregates = cls()
+        for movement in movements:
+            aggregates.add(movement)
+        return aggregates
+
+    @classmethod
+    def from_ledger(cls, ledger):
+        aggregates = cls()
+        for product, totals in ledger.product_totals():
+            aggregates._merge(aggregates._totals, product, totals)
+        for day, product, totals in ledger.daily_totals():
+            aggregates._merge(
+                aggregates._days.setdefault(day, {}), product, totals
+            )
+        return aggregates
+
+    def _merge(self, table, product, totals):
+        code = product._code
+        self._products[code] = product
+        current = table.get(code)
+        if current is None:
+            current = table[code] = [0, 0.0, 0, 0.0]
+        for index, value in enumerate(totals):
+            current[index] += value
+
+    def add(self, movement):
+        product = movement.product
+        code = product._code
+        if movement.type == "in":
+            qty, cost = IN_QTY, IN_COST
+            value = movement.amount * product._price
+        else:
+            qty, cost = OUT_QTY, OUT_COST
+            value = movement.amount * movement.final_price
+
+        totals = self._totals.get(code)
+        if totals is None:
+            totals = self._totals[code] = [0, 0.0, 0, 0.0]
+        self._products[code] = product
+        totals[qty] += movement.amount
+        totals[cost] += value
+
+        day = self._days.setdefault(movement.date.date(), {})
+        totals = day.get(code)
+        if totals is None:
+            totals = day[code] = [0, 0.0, 0, 0.0]
+        totals[qty] += movement.amount
+        totals[cost] += value
+
+    @staticmethod
+    def _entry(name, totals):
+        return {
+            "name": name,
+            "in": {"qty": totals[IN_QTY], "cost": totals[IN_COST]},
+            "out": {"qty": totals[OUT_QTY], "cost": totals[OUT_COST]}
+        }
+
+    def summary(self, product_code=None):
+        if product_code:
+            codes = [product_code] if product_code in self._totals else []
+        else:
+            codes = self._totals
+        return {
+            code: self._entry(self._products[code].name, self._totals[code])
+            for code in codes
+        }
+
+    def totals(self):
+        overall = [0, 0.0, 0, 0.0]
+        for totals in self._totals.values():
+            for index, value in enumerate(totals):
+                overall[index] += value
+        return self._entry("Total", overall)
+
+    def top_sellers(self, n=10, by="qty"):
+        column = OUT_QTY if by == "qty" else OUT_COST
+        codes = heapq.nlargest(
+            n, (code for code, totals in self._totals.items()
+                if totals[OUT_QTY]),
+            key=lambda code: self._totals[code][column]
+        )
+        return [
+            (self._products[code], self._totals[code][column])
+            for code in codes
+        ]
+
+    def daily(self, start=None, end=None, product_code=None):
+        if isinstance(start, datetime):
+            start = start.date()
+        if isinstance(end, datetime):
+            end = end.date()
+        result = {}
+        for day in sorted(self._days):
+            if start is not None and day < start:
+                continue
+            if end is not None and day >= end:
+                continue
+            if product_code and product_code not in self._days[day]:
+                continue
+            overall = [0, 0.0, 0, 0.0]
+            for code, totals in self._days[day].items():
+                if product_code and code != product_code:
+                    continue
+                for index, value in enumerate(totals):
+                    overall[index] += value
+            result[day] = self._entry(day.isoformat(), overall)
+        return result
+
+    def differences(self, other, tolerance=1e-6):
+        problems = []
+        for name, mine, theirs in (
+            ("product", self._totals, other._totals),
+            *(
+                (f"day {day}", self._days.get(day, {}),
+                 other._days.get(day, {}))
+                for day in set(self._days) | set(other._days)
+            )
+        ):
+            for code in set(mine) | set(theirs):
+                expected = theirs.get(code, [0, 0.0, 0, 0.0])
+                actual = mine.get(code, [0, 0.0, 0, 0.0])
+                if any(
+                    abs(a - b) > tolerance for a, b in zip(actual, expected)
+                ):
+                    problems.append((name, code, actual, expected))
+        return problems
@@ -5,6 +5,8 @@ from Inventory_System.People.customer import Customer
 from Inventory_System.People.supplier import Supplier
 
 class BillItem:
+    __slots__ = ("product", "quantity", "price")
+
     def __init__(self, product, quantity, price):
         self.product = product
         self.quantity = quantity
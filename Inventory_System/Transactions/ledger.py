@@ -0,0 +1,312 @@
+import pickle
+from array import array
+from datetime import date, datetime
+
+from Inventory_System.Transactions.movements import Movement
+
+
+class LedgerHistory:
+    __slots__ = ("ledger", "_seqs")
+
+    def __init__(self, ledger):
+        self.ledger = ledger
+        self._seqs = array("q")
+
+    def append(self, movement):
+        self._seqs.append(movement._seq)
+
+    def extend(self, movements):
+        self._seqs.extend(movement._seq for movement in movements)
+
+    def pop(self, index=-1):
+        return self.ledger[self._seqs.pop(index)]
+
+    def seqs(self):
+        return self._seqs
+
+    def __len__(self):
+        return len(self._seqs)
+
+    def __iter__(self):
+        for seq in self._seqs:
+            yield self.ledger[seq]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.ledger[seq] for seq in self._seqs[index]]
+        return self.ledger[self._seqs[index]]
+
+
+class MovementLedger:
+    def __init__(self):
+        self._product = array("l")
+        self._delta = array("q")
+        self._timestamp = array("d")
+        self._actor = array("l")
+        self._price = array("d")
+        self._bill = array("l")
+        self._reason = array("l")
+        self._day = array("l")
+
+        self._products = []
+        self._actors = []
+        self._bills = []
+        self._reasons = []
+        self._lookup = {}
+
+    def __reduce_ex__(self, protocol):
+        columns = (
+            self._product, self._delta, self._timestamp, self._actor,
+            self._price, self._bill, self._reason, self._day
+        )
+        if protocol >= 5:
+            columns = tuple(
+                (column.typecode, pickle.PickleBuffer(column))
+                for column in columns
+            )
+        else:
+            columns = tuple(
+                (column.typecode, column.tobytes()) for column in columns
+            )
+        tables = (self._products, self._actors, self._bills, self._reasons)
+        return (MovementLedger._from_columns, (columns, tables))
+
+    @staticmethod
+    def _from_columns(columns, tables):
+        ledger = MovementLedger()
+        columns = [array(typecode, bytes(data)) for typecode, data in columns]
+        if len(columns) == 7:
+            # Snapshots written before the day column existed.
+            columns.append(array("l", (
+                datetime.fromtimestamp(timestamp).toordinal()
+                for timestamp in columns[2]
+            )))
+        (
+            ledger._product, ledger._delta, ledger._timestamp, ledger._actor,
+            ledger._price, ledger._bill, ledger._reason, ledger._day
+        ) = columns
+        ledger._products, ledger._actors, ledger._bills, ledger._reasons = (
+            tables
+        )
+        for index, product in enumerate(ledger._products):
+            ledger._lookup[("product", id(product))] = index
+        for index, actor in enumerate(ledger._actors):
+            ledger._lookup[("actor", id(actor))] = index
+        for index, bill_id in enumerate(ledger._bills):
+            ledger._lookup[("bill", bill_id)] = index
+        for index, reason in enumerate(ledger._reasons):
+            ledger._lookup[("reason", reason)] = index
+        return ledger
+
+    def _intern(self, table, key, value):
+        index = self._lookup.get(key)
+        if index is None:
+            index = len(table)
+            table.append(value)
+            self._lookup[key] = index
+        return index
+
+    def _bill_index(self, bill_id):
+        if bill_id is None:
+            return -1
+        return self._intern(self._bills, ("bill", bill_id), bill_id)
+
+    def append(self, movement):
+        product = movement.product
+        actor = movement.actor
+        self._product.append(
+            self._intern(self._products, ("product", id(product)), product)
+        )
+        self._delta.append(movement.get_delta())
+        self._timestamp.append(movement.date.timestamp())
+        self._actor.append(
+            self._intern(self._actors, ("actor", id(actor)), actor)
+        )
+        self._price.append(movement.final_price)
+        self._bill.append(self._bill_index(movement.bill_id))
+        self._reason.append(
+            self._intern(self._reasons, ("reason", movement.reason),
+                         movement.reason)
+        )
+        self._day.append(movement.date.toordinal())
+
+    def set_bill(self, seq, bill_id):
+        self._bill[seq] = self._bill_index(bill_id)
+
+    def __len__(self):
+        return len(self._delta)
+
+    def __iter__(self):
+        for seq in range(len(self)):
+            yield self._view(seq)
+
+    def __getitem__(self, seq):
+        if isinstance(seq, slice):
+            return [self._view(i) for i in range(*seq.indices(len(self)))]
+        if seq < 0:
+            seq += len(self)
+        if not 0 <= seq < len(self):
+            raise IndexError("movement index out of range")
+        return self._view(seq)
+
+    def _view(self, seq):
+        bill = self._bill[seq]
+        movement = Movement(
+            self._products[self._product[seq]],
+            abs(self._delta[seq]),
+            self._actors[self._actor[seq]],
+            self._reasons[self._reason[seq]],
+            self._bills[bill] if bill >= 0 else None
+        )
+        movement.date = datetime.fromtimestamp(self._timestamp[seq])
+        movement.final_price = self._price[seq]
+        movement._seq = seq
+        return movement
+
+    def history(self):
+        return LedgerHistory(self)
+
+    @staticmethod
+    def _numpy():
+        try:
+            import numpy as np
+        except ImportError:
+            return None
+        return np
+
+    def product_totals(self):
+        np = self._numpy()
+        if np is not None:
+            totals = self._totals_numpy(np)
+        else:
+            totals = self._totals_python()
+
+        for index, product in enumerate(self._products):
+            in_qty, in_cost, out_qty, out_cost, count = (
+                column[index] for column in totals
+            )
+            if count:
+                yield product, (
+                    int(in_qty), float(in_cost), int(out_qty), float(out_cost)
+                )
+
+    def daily_totals(self):
+        np = self._numpy()
+        if np is not None:
+            totals = self._daily_numpy(np)
+        else:
+            totals = self._daily_python()
+
+        days = {}
+        for (ordinal, index), row in totals:
+            day = days.get(ordinal)
+            if day is None:
+                day = days[ordinal] = date.fromordinal(ordinal)
+            yield day, self._products[index], row
+
+    def sales_summary(self, product_code=None):
+        summary = {}
+        for product, totals in self.product_totals():
+            code = product._code
+            if product_code and code != product_code:
+                continue
+            if code not in summary:
+                summary[code] = {
+                    "name": product.name,
+                    "in": {"qty": 0, "cost": 0.0},
+                    "out": {"qty": 0, "cost": 0.0}
+                }
+            in_qty, in_cost, out_qty, out_cost = totals
+            summary[code]["in"]["qty"] += in_qty
+            summary[code]["in"]["cost"] += in_cost
+            summary[code]["out"]["qty"] += out_qty
+            summary[code]["out"]["cost"] += out_cost
+        return summary
+
+    @staticmethod
+    def _column(np, column, dtype):
+        # frombuffer over bytes, not the live array: an exported buffer
+        # would make a concurrent append raise BufferError.
+        return np.frombuffer(column.tobytes(), dtype=dtype)
+
+    def _totals_numpy(self, np):
+        size = len(self._products)
+        product = self._column(np, self._product, np.dtype("l"))
+        delta = self._column(np, self._delta, np.int64)
+        price = self._column(np, self._price, np.float64)
+
+        incoming = delta > 0
+        qty = np.abs(delta)
+        cost = qty * price
+
+        def by_product(weights):
+            return np.bincount(product, weights=weights, minlength=size)
+
+        return (
+            by_product(np.where(incoming, qty, 0)),
+            by_product(np.where(incoming, cost, 0.0)),
+            by_product(np.where(incoming, 0, qty)),
+            by_product(np.where(incoming, 0.0, cost)),
+            np.bincount(product, minlength=size)
+        )
+
+    def _totals_python(self):
+        size = len(self._products)
+        in_qty, in_cost = [0] * size, [0.0] * size
+        out_qty, out_cost = [0] * size, [0.0] * size
+        count = [0] * size
+
+        for index, delta, price in zip(self._product, self._delta, self._price):
+            count[index] += 1
+            if delta > 0:
+                in_qty[index] += delta
+                in_cost[index] += delta * price
+            else:
+                out_qty[index] -= delta
+                out_cost[index] -= delta * price
+        return in_qty, in_cost, out_qty, out_cost, count
+
+    def _daily_numpy(self, np):
+        size = len(self._products)
+        day = self._column(np, self._day, np.dtype("l")).astype(np.int64)
+        product = self._column(np, self._product, np.dtype("l"))
+        delta = self._column(np, self._delta, np.int64)
+        price = self._column(np, self._price, np.float64)
+
+        keys, group = np.unique(day * size + product, return_inverse=True)
+        incoming = delta > 0
+        qty = np.abs(delta)
+        cost = qty * price
+
+        def by_day(weights):
+            return np.bincount(group, weights=weights, minlength=len(keys))
+
+        columns = (
+            by_day(np.where(incoming, qty, 0)),
+            by_day(np.where(incoming, cost, 0.0)),
+            by_day(np.where(incoming, 0, qty)),
+            by_day(np.where(incoming, 0.0, cost))
+        )
+        for position, key in enumerate(keys.tolist()):
+            in_qty, in_cost, out_qty, out_cost = (
+                column[position] for column in columns
+            )
+            yield divmod(key, size), [
+                int(in_qty), float(in_cost), int(out_qty), float(out_cost)
+            ]
+
+    def _daily_python(self):
+        totals = {}
+        for day, index, delta, price in zip(
+            self._day, self._product, self._delta, self._price
+        ):
+            row = totals.get((day, index))
+            if row is None:
+                row = totals[(day, index)] = [0, 0.0, 0, 0.0]
+            if delta > 0:
+                row[0] += delta
+                row[1] += delta * price
+            else:
+                row[2] -= delta
+                row[3] -= delta * price
+        return totals.items()
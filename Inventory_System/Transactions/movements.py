@@ -1,9 +1,15 @@
+import sys
 from datetime import datetime
 
 from Inventory_System.People.customer import Customer
 from Inventory_System.People.supplier import Supplier
 
 class Movement:
+    __slots__ = (
+        "product", "amount", "date", "actor", "_actor_id", "actor_type",
+        "type", "reason", "_bill_id", "final_price", "_seq"
+    )
+
     def __init__(self, product, amount, actor, reason, bill_id=None):
         self.product = product
         self.amount = amount
@@ -17,6 +23,8 @@ class Movement:
             "customer" if isinstance(actor, Customer) else "supplier"
         )
         self.type = "out" if isinstance(actor, Customer) else "in"
+        if isinstance(reason, str):
+            reason = sys.intern(reason)
         self.reason = reason
         self._bill_id = bill_id
         self.final_price = (
@@ -24,6 +32,16 @@ class Movement:
             else product._price
             )
 
+    def __getstate__(self):
+        return tuple(getattr(self, name, None) for name in Movement.__slots__)
+
+    def __setstate__(self, state):
+        (
+            self.product, self.amount, self.date, self.actor,
+            self._actor_id, self.actor_type, self.type, self.reason,
+            self._bill_id, self.final_price, self._seq
+        ) = state
+
     def get_delta(self):
         return self.amount if self.type == "in" else -self.amount
     
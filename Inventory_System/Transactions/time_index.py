@@ -0,0 +1,119 @@
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime, time
+
+
+class MovementTimeIndex:
+    def __init__(self):
+        self._times = array("d")
+        self._seqs = array("q")
+        self._time_by_seq = array("d")
+        self._subsets = {}
+
+    def __len__(self):
+        return len(self._seqs)
+
+    def __getstate__(self):
+        state = dict(vars(self))
+        state["_subsets"] = {}
+        return state
+
+    def __setstate__(self, state):
+        state.setdefault("_subsets", {})
+        vars(self).update(state)
+
+    @staticmethod
+    def timestamp(when):
+        if when is None:
+            return None
+        if isinstance(when, datetime):
+            return when.timestamp()
+        if isinstance(when, date):
+            return datetime.combine(when, time.min).timestamp()
+        return float(when)
+
+    @staticmethod
+    def cursor(movement):
+        return f"{movement.date.isoformat()}|{movement._seq}"
+
+    @staticmethod
+    def parse_cursor(cursor):
+        when, seq = cursor.rsplit("|", 1)
+        return datetime.fromisoformat(when).timestamp(), int(seq)
+
+    def add(self, movement):
+        ts = movement.date.timestamp()
+        seq = movement._seq
+        if seq == len(self._time_by_seq):
+            self._time_by_seq.append(ts)
+        else:
+            self._time_by_seq[seq] = ts
+
+        self._insert(self._times, self._seqs, ts, seq)
+
+    @staticmethod
+    def _position_after(times, seqs, ts, seq):
+        # Entries are ordered by (timestamp, seq), so within a run of equal
+        # timestamps the seqs are sorted and can be bisected too.
+        low = bisect_left(times, ts)
+        high = bisect_right(times, ts, low)
+        return bisect_right(seqs, seq, low, high)
+
+    @staticmethod
+    def _insert(times, seqs, ts, seq):
+        if not times or (ts, seq) > (times[-1], seqs[-1]):
+            times.append(ts)
+            seqs.append(seq)
+        else:
+            index = MovementTimeIndex._position_after(times, seqs, ts, seq)
+            times.insert(index, ts)
+            seqs.insert(index, seq)
+
+    def time_of(self, seq):
+        return self._time_by_seq[seq]
+
+    @staticmethod
+    def _scan(times, seqs, start, end, after):
+        index = 0
+        if after is not None:
+            index = MovementTimeIndex._position_after(times, seqs, *after)
+        if start is not None:
+            index = max(index, bisect_left(times, start))
+
+        stop = len(times)
+        if end is not None:
+            stop = bisect_left(times, end)
+        for position in range(index, stop):
+            yield seqs[position]
+
+    def scan(self, start=None, end=None, after=None):
+        return self._scan(self._times, self._seqs, start, end, after)
+
+    def subset(self, key, seqs):
+        # Ordered copies of the per-product and per-actor seq lists are kept
+        # in step with those lists as they grow. A subset is replaced rather
+        # than modified in place when a seq lands before its end, so pages
+        # already being read are unaffected.
+        times, ordered, count = self._subsets.get(key, (None, None, 0))
+        if times is None or count > len(seqs):
+            keys = sorted((self._time_by_seq[seq], seq) for seq in seqs)
+            times = array("d", (ts for ts, _ in keys))
+            ordered = array("q", (seq for _, seq in keys))
+        else:
+            copied = False
+            for index in range(count, len(seqs)):
+                seq = seqs[index]
+                ts = self._time_by_seq[seq]
+                if (
+                    not copied and ordered and
+                    (ts, seq) < (times[-1], ordered[-1])
+                ):
+                    times, ordered = array("d", times), array("q", ordered)
+                    copied = True
+                self._insert(times, ordered, ts, seq)
+        self._subsets[key] = (times, ordered, len(seqs))
+        return times, ordered
+
+    def select(self, key, seqs, start=None, end=None, after=None):
+        times, ordered = self.subset(key, seqs)
+        return self._scan(times, ordered, start, end, after)
@@ -0,0 +1,243 @@
+import argparse
+import os
+import sys
+
+
+def open_system(args):
+    from Inventory_System.Operantions_Center.system import System
+
+    if args.db:
+        from Inventory_System.Storage.sqlite_repository import SQLiteRepository
+
+        system = System(repository=SQLiteRepository(args.db))
+    else:
+        system = System()
+    if not args.no_journal:
+        system.open_journal(
+            args.journal, args.snapshot, args.snapshot_every,
+            args.sync_interval or True
+        )
+    return system
+
+
+def run_gui(args):
+    import tkinter as tk
+
+    from Inventory_System.Operantions_Center.app import InventoryApp
+
+    root = tk.Tk()
+    system = open_system(args)
+    app = InventoryApp(root, system)
+    root.mainloop()
+    app.tasks.shutdown()
+    system.close()
+
+
+def run_verify(args):
+    from Inventory_System.Operantions_Center.journal import Journal
+    from Inventory_System.Operantions_Center.verifier import StateVerifier
+
+    rebuilt, replayed = Journal.rebuild(args.journal, args.snapshot)
+    print(f"State rebuilt from the snapshot and {replayed} journal entries.")
+    problems = StateVerifier.check(rebuilt)
+    if args.db:
+        from Inventory_System.Operantions_Center.system import System
+        from Inventory_System.Storage.sqlite_repository import SQLiteRepository
+
+        persisted = System(repository=SQLiteRepository(args.db))
+        problems += StateVerifier.compare(rebuilt, persisted)
+        persisted.close()
+    for problem in problems:
+        print(problem)
+    print(f"{len(problems)} problems found.")
+    return 1 if problems else 0
+
+
+def run_import(args, system):
+    from Inventory_System.Operantions_Center.importer import BatchImporter
+
+    importer = BatchImporter(
+        system, args.batch_size, args.checkpoint, args.rejects
+    )
+    method = {
+        "products": importer.import_products,
+        "records": importer.import_records,
+        "movements": importer.import_movements
+    }[args.kind]
+    report = method(args.path, args.compression)
+    return 1 if report["rejected"] and args.strict else 0
+
+
+def run_restore(args, system):
+    system.load_full_backup(args.path)
+    return 0
+
+
+def run_backup(args, system):
+    system.export_full_system(args.path)
+    print(f"Backup written to {args.path}")
+    return 0
+
+
+def run_migrate(args):
+    from Inventory_System.Operantions_Center.extracts import Extracts
+
+    Extracts.migrate_backup(args.path, args.output)
+    return 0
+
+
+def run_snapshot(args, system):
+    system.save_snapshot(args.path)
+    print(f"Snapshot written to {args.path}")
+    return 0
+
+
+def run_report(args, system):
+    output = args.output or f"{args.kind}_report.pdf"
+    if args.kind == "inventory":
+        written = system.export_inventory_pdf(output)
+    elif args.kind == "movements":
+        written = system.export_movements_pdf(output)
+    elif args.kind == "sales":
+        written = system.export_sales_summary_pdf(output, args.product)
+    elif args.kind == "critical":
+        if not system.export_critical_stock_pdf(output):
+            return 0
+        written = True
+    elif args.kind == "actor":
+        if not args.actor:
+            raise ValueError("The actor report needs --actor.")
+        written = system.export_actor_history_pdf(args.actor, output)
+    if not written or not os.path.exists(output):
+        print(f"Error: no report was written to {output}", file=sys.stderr)
+        return 1
+    print(f"Report written to {output}")
+    return 0
+
+
+def run_serve(args, system):
+    from Inventory_System.Operantions_Center.service import InventoryService
+
+    InventoryService(system, args.host, args.port).run()
+    return 0
+
+
+def run_check(args, system):
+    problems = system.check_aggregates()
+    for name, code, actual, expected in problems:
+        print(f"{name} {code}: {actual} != {expected}")
+    if problems and args.repair:
+        system.rebuild_aggregates()
+        print("Aggregates rebuilt from the movement ledger and saved.")
+    print(f"{len(problems)} aggregate differences found.")
+    return 1 if problems and not args.repair else 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="python -m Inventory_System",
+        description="Inventory Management System"
+    )
+    parser.add_argument("--journal", default="inventory.journal")
+    parser.add_argument("--snapshot", default="inventory.snap")
+    parser.add_argument(
+        "--db", help="use a SQLite database instead of the in-memory store"
+    )
+    parser.add_argument(
+        "--no-journal", action="store_true",
+        help="do not recover from or write to the journal"
+    )
+    parser.add_argument(
+        "--snapshot-every", type=int, default=1000,
+        help="journal entries between snapshots"
+    )
+    parser.add_argument(
+        "--sync-interval", type=float,
+        help="fsync the journal at most once per this many seconds "
+        "instead of after every entry"
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser("gui", help="start the graphical interface")
+
+    command = commands.add_parser("import", help="batch import a file")
+    command.add_argument("kind", choices=["products", "records", "movements"])
+    command.add_argument("path")
+    command.add_argument("--compression", choices=["gzip", "lzma"])
+    command.add_argument("--batch-size", type=int, default=1000)
+    command.add_argument("--checkpoint")
+    command.add_argument("--rejects")
+    command.add_argument(
+        "--strict", action="store_true",
+        help="exit with an error if any row is rejected"
+    )
+    command.set_defaults(handler=run_import)
+
+    command = commands.add_parser("restore", help="load a full backup")
+    command.add_argument("path")
+    command.set_defaults(handler=run_restore)
+
+    command = commands.add_parser("backup", help="write a full backup")
+    command.add_argument("path")
+    command.set_defaults(handler=run_backup)
+
+    command = commands.add_parser(
+        "migrate", help="rewrite a backup in the current backup format"
+    )
+    command.add_argument("path")
+    command.add_argument("output")
+
+    command = commands.add_parser("snapshot", help="write a binary snapshot")
+    command.add_argument("path")
+    command.set_defaults(handler=run_snapshot)
+
+    command = commands.add_parser("report", help="generate a PDF report")
+    command.add_argument(
+        "kind", choices=["inventory", "movements", "sales", "critical", "actor"]
+    )
+    command.add_argument("--output")
+    command.add_argument("--product")
+    command.add_argument("--actor")
+    command.set_defaults(handler=run_report)
+
+    command = commands.add_parser(
+        "serve", help="serve the inventory over HTTP on localhost"
+    )
+    command.add_argument("--host", default="127.0.0.1")
+    command.add_argument("--port", type=int, default=8080)
+    command.set_defaults(handler=run_serve)
+
+    commands.add_parser(
+        "verify", help="rebuild the state from the journal and verify it"
+    )
+
+    command = commands.add_parser(
+        "check", help="verify the sales aggregates against the ledger"
+    )
+    command.add_argument("--repair", action="store_true")
+    command.set_defaults(handler=run_check)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.command == "gui":
+        run_gui(args)
+        return 0
+    if args.command == "verify":
+        return run_verify(args)
+    if args.command == "migrate":
+        return run_migrate(args)
+
+    system = open_system(args)
+    try:
+        return args.handler(args, system)
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    finally:
+        system.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
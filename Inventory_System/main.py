@@ -1,11 +1,14 @@
-from Inventory_System.Operantions_Center.system import System
-from Inventory_System.Operantions_Center.app import InventoryApp
-import tkinter as tk
+import os
 
-if __name__ == "__main__":
+from Inventory_System.__main__ import main
 
-    root = tk.Tk()
-    system = System()
+# The GUI keeps its journal in one place instead of the working directory.
+DATA_DIR = os.path.join(os.path.expanduser("~"), ".inventory_system")
 
-    app = InventoryApp(root, system)
-    root.mainloop()
\ No newline at end of file
+if __name__ == "__main__":
+    os.makedirs(DATA_DIR, exist_ok=True)
+    main([
+        "--journal", os.path.join(DATA_DIR, "inventory.journal"),
+        "--snapshot", os.path.join(DATA_DIR, "inventory.snap"),
+        "gui"
+    ])
@@ -0,0 +1,90 @@
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Inventory_System.Inventory_Management.inventory_record import InventoryRecord
+from Inventory_System.Inventory_Management.stock import Stock
+from Inventory_System.Operantions_Center.system import System
+from Inventory_System.People.customer import Customer
+from Inventory_System.Products.product import Product
+from Inventory_System.Products.state import State
+from Inventory_System.Transactions.movements import Movement
+
+PRODUCTS = 2000
+ORDERS = 100
+LINES = 300
+
+
+def build_system(directory=None):
+    system = System()
+    state = State(condition="New")
+    with contextlib.redirect_stdout(io.StringIO()):
+        for i in range(PRODUCTS):
+            product = Product(
+                f"Product {i}", f"Category {i % 20}", f"P{i:06d}", 10.0, state
+            )
+            location = system.locations.assign(product.category, product._code)
+            system.add_record(
+                InventoryRecord(product, Stock(10**6, 20, 10**7), location)
+            )
+        customer = Customer("Customer", "123")
+        system.add_customer(customer)
+        if directory:
+            system.open_journal(
+                os.path.join(directory, "inventory.journal"),
+                os.path.join(directory, "inventory.snap")
+            )
+    return system, customer
+
+
+def orders(system, customer):
+    records = list(system.records.values())
+    return [
+        [
+            (records[(order * LINES + line) % PRODUCTS].product, 1 + line % 5)
+            for line in range(LINES)
+        ]
+        for order in range(ORDERS)
+    ]
+
+
+def per_line(system, customer, batches):
+    for batch in batches:
+        for product, amount in batch:
+            system.make_sale(product._code, amount, customer, "Order")
+
+
+def batched(system, customer, batches):
+    for batch in batches:
+        system.apply_movements(
+            Movement(product, amount, customer, "Order")
+            for product, amount in batch
+        )
+
+
+def measure(journal):
+    for name, run in (("per-line", per_line), ("batched", batched)):
+        with tempfile.TemporaryDirectory() as directory:
+            system, customer = build_system(directory if journal else None)
+            batches = orders(system, customer)
+            with contextlib.redirect_stdout(io.StringIO()):
+                start = time.perf_counter()
+                run(system, customer, batches)
+                elapsed = time.perf_counter() - start
+                system.close()
+        lines = ORDERS * LINES
+        label = "journaled" if journal else "in-memory"
+        print(
+            f"{label} {name:>9}: {lines} lines in {elapsed:.3f}s "
+            f"({lines / elapsed:,.0f} lines/s)"
+        )
+
+
+if __name__ == "__main__":
+    measure(journal=False)
+    measure(journal=True)
@@ -0,0 +1,114 @@
+import contextlib
+import io
+import os
+import random
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Inventory_System.Inventory_Management.inventory_record import InventoryRecord
+from Inventory_System.Inventory_Management.stock import Stock
+from Inventory_System.Operantions_Center.system import System
+from Inventory_System.People.customer import Customer
+from Inventory_System.Products.product import Product
+from Inventory_System.Products.state import State
+
+PRODUCTS = 16
+STOCK = 5000
+ATTEMPTS = 60000
+THREADS = (1, 2, 4, 8)
+
+
+def build_system():
+    system = System()
+    state = State(condition="New")
+    for i in range(PRODUCTS):
+        product = Product(
+            f"Product {i}", f"Category {i % 4}", f"H{i:04d}", 10.0, state
+        )
+        location = system.locations.assign(product.category, product._code)
+        system.add_record(
+            InventoryRecord(product, Stock(STOCK, 0, STOCK), location)
+        )
+    customers = [Customer(f"Customer {i}", str(i)) for i in range(8)]
+    for customer in customers:
+        system.add_customer(customer)
+    return system, customers
+
+
+def worker(system, customers, attempts, seed, sold):
+    rng = random.Random(seed)
+    codes = list(system.records)
+    for _ in range(attempts):
+        code = rng.choice(codes)
+        amount = rng.randint(1, 3)
+        if system.make_sale(code, amount, rng.choice(customers), "Stress"):
+            sold[code] = sold.get(code, 0) + amount
+
+
+def assign_locations(system, thread, count, shelves):
+    for i in range(count):
+        location = system.locations.assign("Stress", f"S{thread}-{i}")
+        shelves.append(location.shelf)
+
+
+def verify(system, sold, shelves):
+    for code, record in system.records.items():
+        actual = record.stock.get_actual_stock()
+        expected = STOCK - sum(totals.get(code, 0) for totals in sold)
+        if actual < 0 or actual != expected:
+            raise AssertionError(f"{code}: stock {actual}, expected {expected}")
+    for seq, movement in enumerate(system.movements):
+        if movement._seq != seq:
+            raise AssertionError(f"Movement {seq} carries seq {movement._seq}")
+    if sum(len(record.stock._record) for record in system.records.values()) \
+            != len(system.movements):
+        raise AssertionError("Stock records and movement log disagree.")
+    if system.check_aggregates():
+        raise AssertionError("Sales aggregates drifted from the ledger.")
+    if len(set(shelves)) != len(shelves):
+        raise AssertionError("Two products were given the same shelf.")
+
+
+def run(threads, switch_interval):
+    with contextlib.redirect_stdout(io.StringIO()):
+        system, customers = build_system()
+    sold = [{} for _ in range(threads)]
+    shelves = []
+    sys.setswitchinterval(switch_interval)
+    workers = [
+        threading.Thread(
+            target=worker,
+            args=(system, customers, ATTEMPTS // threads, n, sold[n])
+        )
+        for n in range(threads)
+    ] + [
+        threading.Thread(
+            target=assign_locations, args=(system, n, 200, shelves)
+        )
+        for n in range(threads)
+    ]
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        for thread in workers:
+            thread.start()
+        for thread in workers:
+            thread.join()
+        elapsed = time.perf_counter() - start
+    sys.setswitchinterval(0.005)
+    verify(system, sold, shelves)
+    return elapsed, len(system.movements)
+
+
+if __name__ == "__main__":
+    for threads in THREADS:
+        elapsed, movements = run(threads, 1e-6)
+        print(f"{threads} threads, forced switching: ok ({movements} sales)")
+    for threads in THREADS:
+        elapsed, movements = run(threads, 0.005)
+        print(
+            f"{threads} threads: {ATTEMPTS} attempts, {movements} sales in "
+            f"{elapsed:.3f}s ({ATTEMPTS / elapsed:,.0f} attempts/s)"
+        )
@@ -0,0 +1,146 @@
+import asyncio
+import contextlib
+import io
+import json
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Inventory_System.Inventory_Management.inventory_record import InventoryRecord
+from Inventory_System.Inventory_Management.stock import Stock
+from Inventory_System.Operantions_Center.service import InventoryService
+from Inventory_System.Operantions_Center.system import System
+from Inventory_System.People.customer import Customer
+from Inventory_System.Products.product import Product
+from Inventory_System.Products.state import State
+
+PRODUCTS = 2000
+CONNECTIONS = 32
+REQUESTS = 400
+BATCH = 50
+
+
+def serve(ready, directory):
+    sys.stdout = io.StringIO()
+    system = System()
+    state = State(condition="New")
+    for i in range(PRODUCTS):
+        product = Product(
+            f"Product {i}", f"Category {i % 20}", f"P{i:06d}", 10.0, state
+        )
+        location = system.locations.assign(product.category, product._code)
+        system.add_record(
+            InventoryRecord(product, Stock(10**7, 20, 10**8), location)
+        )
+    customer = Customer("Customer", "123")
+    system.add_customer(customer)
+    if directory:
+        system.open_journal(
+            os.path.join(directory, "inventory.journal"),
+            os.path.join(directory, "inventory.snap")
+        )
+
+    async def main():
+        service = InventoryService(system, port=0)
+        await service.start()
+        ready.put((service.port, customer._id))
+        await service.server.serve_forever()
+
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(main())
+
+
+async def client(port, requests):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    for method, path, body in requests:
+        body = json.dumps(body).encode() if body is not None else b""
+        writer.write(
+            f"{method} {path} HTTP/1.1\r\nHost: localhost\r\n"
+            f"Content-Length: {len(body)}\r\n\r\n".encode() + body
+        )
+        await writer.drain()
+        length = 0
+        status = await reader.readline()
+        while True:
+            line = await reader.readline()
+            if line == b"\r\n":
+                break
+            if line.lower().startswith(b"content-length:"):
+                length = int(line.split(b":")[1])
+        await reader.readexactly(length)
+        if b" 200 " not in status:
+            raise RuntimeError(status.decode().strip())
+    writer.close()
+
+
+def sale(i, customer):
+    return ("POST", "/sales", {
+        "product": f"P{i % PRODUCTS:06d}", "amount": 1, "customer": customer
+    })
+
+
+def workload(name, connection, customer):
+    base = connection * REQUESTS
+    if name == "reads":
+        return [
+            ("GET", f"/stock/P{(base + i) % PRODUCTS:06d}", None)
+            for i in range(REQUESTS)
+        ]
+    if name == "sales":
+        return [sale(base + i, customer) for i in range(REQUESTS)]
+    if name == "mixed":
+        return [
+            sale(base + i, customer) if i % 5 == 0 else
+            ("GET", f"/records/P{(base + i) % PRODUCTS:06d}", None)
+            for i in range(REQUESTS)
+        ]
+    return [
+        ("POST", "/batch", {"requests": [
+            {"method": "POST", "path": path, "body": body}
+            for _, path, body in (
+                sale(base * BATCH + i * BATCH + line, customer)
+                for line in range(BATCH)
+            )
+        ]})
+        for i in range(REQUESTS // BATCH)
+    ]
+
+
+async def load(port, customer, name):
+    work = [workload(name, c, customer) for c in range(CONNECTIONS)]
+    start = time.perf_counter()
+    await asyncio.gather(*(client(port, requests) for requests in work))
+    elapsed = time.perf_counter() - start
+    requests = sum(len(requests) for requests in work)
+    operations = requests * (BATCH if name == "batched sales" else 1)
+    print(
+        f"{name:>13}: {requests} requests, {operations} operations in "
+        f"{elapsed:.2f}s ({requests / elapsed:,.0f} req/s, "
+        f"{operations / elapsed:,.0f} ops/s)"
+    )
+
+
+def measure(journal):
+    print("journaled" if journal else "in-memory")
+    with tempfile.TemporaryDirectory() as directory:
+        ready = multiprocessing.Queue()
+        server = multiprocessing.Process(
+            target=serve, args=(ready, directory if journal else None)
+        )
+        server.start()
+        try:
+            port, customer = ready.get(timeout=60)
+            for name in ("reads", "sales", "mixed", "batched sales"):
+                asyncio.run(load(port, customer, name))
+        finally:
+            server.terminate()
+            server.join()
+
+
+if __name__ == "__main__":
+    measure(journal=False)
+    measure(journal=True)
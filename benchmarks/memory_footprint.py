@@ -0,0 +1,122 @@
+import json
+import os
+import sys
+import tracemalloc
+from contextlib import contextmanager
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Inventory_System.Inventory_Management import allocator
+from Inventory_System.Inventory_Management.allocator import LocationAllocator
+from Inventory_System.Inventory_Management.inventory import Inventory
+from Inventory_System.Inventory_Management.inventory_record import InventoryRecord
+from Inventory_System.Inventory_Management.stock import Stock
+from Inventory_System.Operantions_Center import extracts
+from Inventory_System.Operantions_Center.extracts import Extracts
+from Inventory_System.People.customer import Customer
+from Inventory_System.People.supplier import Supplier
+from Inventory_System.Transactions.movements import Movement
+
+RECORDS = 20000
+MOVEMENTS = 200000
+
+
+def product_rows(count):
+    rows = [
+        {
+            "name": f"Product {i}",
+            "category": f"Category {i % 25}",
+            "code": f"P{i:06d}",
+            "price": 10.0 + i % 100,
+            "state": {"condition": "New"} if i % 2 else
+                     {"expiration_date": [2030, 1, 1 + i % 28]}
+        }
+        for i in range(count)
+    ]
+    return json.loads(json.dumps(rows))
+
+
+def unslotted(cls):
+    # Shadowing every slot with a plain class attribute sends instance
+    # writes to a __dict__, the way the classes stored them before slots.
+    shadows = {name: None for name in cls.__slots__}
+    return type(cls.__name__, (cls,), shadows)
+
+
+@contextmanager
+def classes(slots):
+    if slots:
+        yield Stock, InventoryRecord, Movement
+        return
+    saved = extracts.Product, allocator.Location
+    extracts.Product = unslotted(extracts.Product)
+    allocator.Location = unslotted(allocator.Location)
+    try:
+        yield unslotted(Stock), unslotted(InventoryRecord), unslotted(Movement)
+    finally:
+        extracts.Product, allocator.Location = saved
+
+
+def build_records(inventory, rows, stock_class, record_class):
+    locations = LocationAllocator()
+    for row in rows:
+        product = Extracts.dict_to_product(row)
+        location = locations.assign(product.category, product._code)
+        inventory.add_record(
+            record_class(product, stock_class(100000, 20, 10**9), location)
+        )
+
+
+def build_movements(inventory, count, supplier, customer, movement_class):
+    reasons = json.loads(json.dumps(["Restock", "Sale"] * (count // 2)))
+    records = list(inventory.records.values())
+    for i in range(count):
+        actor = supplier if i % 2 == 0 else customer
+        product = records[i % len(records)].product
+        inventory.add_movement(movement_class(product, 1, actor, reasons[i]))
+
+
+def measure(columnar, slots=True):
+    inventory = Inventory(columnar=columnar)
+    rows = product_rows(RECORDS)
+    supplier = Supplier("Supplier", "123")
+    customer = Customer("Customer", "456")
+
+    with classes(slots) as (stock_class, record_class, movement_class):
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        build_records(inventory, rows, stock_class, record_class)
+        after_records = tracemalloc.get_traced_memory()[0]
+        build_movements(
+            inventory, MOVEMENTS, supplier, customer, movement_class
+        )
+        after_movements = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+    per_record = (after_records - before) / RECORDS
+    per_movement = (after_movements - after_records) / MOVEMENTS
+    return per_record, per_movement
+
+
+def main():
+    results = {}
+    for name, columnar, slots in (
+        ("no slots", False, False), ("list", False, True),
+        ("columnar", True, True)
+    ):
+        per_record, per_movement = results[name] = measure(columnar, slots)
+        print(
+            f"{name:>8}: {RECORDS} records {per_record:8.1f} bytes/record, "
+            f"{MOVEMENTS} movements {per_movement:8.1f} bytes/movement"
+        )
+    records = 1 - results["list"][0] / results["no slots"][0]
+    movements = 1 - results["list"][1] / results["no slots"][1]
+    print(
+        f"slots save {records:.0%} per record, {movements:.0%} per movement"
+    )
+    saving = 1 - results["columnar"][1] / results["list"][1]
+    print(f"columnar ledger saves {saving:.0%} per movement")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Inventory_System.Products.product import Product
+from Inventory_System.Products.search import ProductSearchIndex
+from Inventory_System.Products.state import State
+
+PRODUCTS = 500000
+WORDS = [
+    "steel", "hammer", "drill", "copper", "wire", "screw", "bolt", "nut",
+    "washer", "cable", "pipe", "valve", "socket", "wrench", "saw", "blade",
+    "glue", "tape", "paint", "brush", "roller", "ladder", "bucket", "glove",
+    "helmet", "mask", "filter", "battery", "charger", "lamp", "bulb", "switch"
+]
+CATEGORIES = ["Tools", "Electrical", "Plumbing", "Paint", "Safety", "Garden"]
+QUERIES = ["hammer", "cop", "steel wire", "P0123", "hamer", "safety glove"]
+
+
+def build(count):
+    rng = random.Random(0)
+    state = State(condition="New")
+    index = ProductSearchIndex()
+    for i in range(count):
+        name = " ".join(rng.sample(WORDS, 3)) + f" {rng.randint(1, 999)}"
+        index.add(Product(
+            name, rng.choice(CATEGORIES), f"P{i:06d}", 10.0, state
+        ))
+    return index
+
+
+def measure():
+    start = time.perf_counter()
+    index = build(PRODUCTS)
+    print(f"indexed {PRODUCTS} products in {time.perf_counter() - start:.1f}s")
+
+    index.search("warmup")
+    for query in QUERIES:
+        start = time.perf_counter()
+        results = index.search(query, limit=20)
+        elapsed = (time.perf_counter() - start) * 1000
+        top = results[0].name if results else "-"
+        print(f"{query!r:>16}: {elapsed:7.1f} ms  top: {top}")
+
+
+if __name__ == "__main__":
+    measure()
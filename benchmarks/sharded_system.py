@@ -0,0 +1,86 @@
+import contextlib
+import io
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Inventory_System.Operantions_Center.sharding import ShardedSystem
+from Inventory_System.Operantions_Center.system import System
+from Inventory_System.People.customer import Customer
+from Inventory_System.People.supplier import Supplier
+from Inventory_System.Products.product import Product
+from Inventory_System.Products.state import State
+
+PRODUCTS = 20000
+CATEGORIES = 40
+SALES = 200000
+CHUNK = 20000
+SHARDS = (1, 2, 4)
+
+
+def populate(target):
+    state = State(condition="New")
+    supplier = Supplier("Supplier", "1", "supplier")
+    customer = Customer("Customer", "2", "customer")
+    target.add_supplier(supplier)
+    target.add_customer(customer)
+    for i in range(PRODUCTS):
+        product = Product(
+            f"Product {i}", f"Category {i % CATEGORIES}", f"P{i:06d}",
+            10.0, state
+        )
+        target.entry_record(product, 40, supplier, "Initial")
+    rng = random.Random(7)
+    return [
+        (
+            f"P{rng.randrange(PRODUCTS):06d}", rng.randint(1, 3), customer,
+            "Sale"
+        )
+        for _ in range(SALES)
+    ]
+
+
+def timed(label, run):
+    start = time.perf_counter()
+    result = run()
+    elapsed = time.perf_counter() - start
+    print(f"{label:>28}: {elapsed:.3f}s")
+    return result
+
+
+def single():
+    with contextlib.redirect_stdout(io.StringIO()):
+        system = System()
+        sales = populate(system)
+
+    def run():
+        with contextlib.redirect_stdout(io.StringIO()):
+            return [system.make_sale(*sale) for sale in sales]
+
+    timed("single System, sales", run)
+    timed("single System, summary", system.sales_summary)
+    timed("single System, restock", system.restock_suggestions)
+
+
+def sharded(shards):
+    with ShardedSystem(shards) as system:
+        sales = populate(system)
+        timed(
+            f"{shards} shards, sales",
+            lambda: [
+                system.make_sales(sales[start:start + CHUNK])
+                for start in range(0, SALES, CHUNK)
+            ]
+        )
+        timed(f"{shards} shards, summary", system.sales_summary)
+        timed(f"{shards} shards, restock", system.restock_suggestions)
+
+
+if __name__ == "__main__":
+    print(f"{os.cpu_count()} CPUs, {PRODUCTS} products, {SALES} sales")
+    single()
+    for shards in SHARDS:
+        sharded(shards)
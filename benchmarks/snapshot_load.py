@@ -0,0 +1,91 @@
+import contextlib
+import io
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Inventory_System.Operantions_Center.snapshot import Snapshot
+from Inventory_System.Operantions_Center.system import System
+from Inventory_System.People.customer import Customer
+from Inventory_System.People.supplier import Supplier
+from Inventory_System.Products.product import Product
+from Inventory_System.Products.state import State
+
+PRODUCTS = 2000
+SALES = 25000
+TARGET = 10
+ROUNDS = 3
+
+
+def build(columnar):
+    rng = random.Random(0)
+    system = System(columnar)
+    supplier = Supplier("Supplier", "1000")
+    customers = [Customer(f"Customer {i}", str(2000 + i)) for i in range(50)]
+    system.add_supplier(supplier)
+    for customer in customers:
+        system.add_customer(customer)
+    for i in range(PRODUCTS):
+        product = Product(
+            f"Product {i}", f"Category {i % 20}", f"P{i:05d}", 10.0,
+            State("New")
+        )
+        system.entry_record(product, 150, supplier, "Initial")
+    for _ in range(SALES):
+        system.make_sale(
+            f"P{rng.randrange(PRODUCTS):05d}", rng.randint(1, 3),
+            rng.choice(customers), "Sale"
+        )
+    return system
+
+
+def best_of(load, columnar):
+    times = []
+    for _ in range(ROUNDS):
+        system = System(columnar)
+        start = time.perf_counter()
+        load(system)
+        times.append(time.perf_counter() - start)
+        del system
+    return min(times)
+
+
+def measure(directory, columnar):
+    backup = os.path.join(directory, "full_backup.json")
+    snapshot = os.path.join(directory, "inventory.snap")
+    with contextlib.redirect_stdout(io.StringIO()):
+        system = build(columnar)
+        system.export_full_system(backup)
+        system.save_snapshot(snapshot)
+        json_time = best_of(
+            lambda target: target.load_full_backup(backup), columnar
+        )
+    snapshot_time = best_of(
+        lambda target: Snapshot.load(snapshot, target), columnar
+    )
+
+    print(
+        f"{'columnar' if columnar else 'list'} ledger: "
+        f"{len(system.records)} records, {len(system.movements)} movements"
+    )
+    print(
+        f"  load_full_backup ({os.path.getsize(backup) / 1e6:.1f} MB) "
+        f"{json_time:.3f}s"
+    )
+    print(
+        f"  Snapshot.load    ({os.path.getsize(snapshot) / 1e6:.1f} MB) "
+        f"{snapshot_time:.3f}s"
+    )
+    ratio = json_time / snapshot_time
+    print(f"  snapshot load is {ratio:.1f}x faster (target {TARGET}x)")
+    return ratio
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as directory:
+        ratios = [measure(directory, columnar) for columnar in (False, True)]
+    sys.exit(0 if min(ratios) >= TARGET else 1)
@@ -0,0 +1,52 @@
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Inventory_System.Operantions_Center.system import System
+from Inventory_System.People.customer import Customer
+from Inventory_System.People.supplier import Supplier
+from Inventory_System.Products.product import Product
+from Inventory_System.Products.state import State
+from Inventory_System.Transactions.payment import Cash
+
+
+def populate(system, products=12, sales=120, seed=1):
+    rng = random.Random(seed)
+    suppliers = [Supplier(f"Supplier {i}", str(1000 + i)) for i in range(2)]
+    customers = [Customer(f"Customer {i}", str(2000 + i)) for i in range(3)]
+    for supplier in suppliers:
+        system.add_supplier(supplier)
+    for customer in customers:
+        system.add_customer(customer)
+
+    for i in range(products):
+        state = State("New") if i % 2 else State(expiration_date=(2030, 1, 1))
+        product = Product(
+            f"Product {i}", f"Category {i % 3}", f"P{i:03d}", 10.0 + i, state
+        )
+        system.entry_record(
+            product, rng.randint(20, 60), suppliers[i % 2], "Initial"
+        )
+    for _ in range(sales):
+        system.make_sale(
+            f"P{rng.randrange(products):03d}", rng.randint(1, 6),
+            rng.choice(customers), "Sale"
+        )
+
+    customer = customers[0]
+    unbilled = system.get_unbilled_movements(customer._id)[:3]
+    if unbilled:
+        system.create_bill(customer, unbilled, Cash(10 ** 9))
+    return suppliers, customers
+
+
+@pytest.fixture
+def system():
+    system = System()
+    populate(system)
+    yield system
+    system.close()
@@ -0,0 +1,75 @@
+import pickle
+
+from Inventory_System.Inventory_Management.allocator import LocationAllocator
+from Inventory_System.Inventory_Management.location import Location
+
+
+def slot(location):
+    return (int(location.aisle), int(location.shelf))
+
+
+def test_categories_get_aisles_and_freed_shelves_are_reused():
+    allocator = LocationAllocator()
+    assert slot(allocator.assign("Fruit", "F1")) == (1, 1)
+    assert slot(allocator.assign("Fruit", "F2")) == (1, 2)
+    assert slot(allocator.assign("Dairy", "D1")) == (2, 1)
+    assert slot(allocator.assign("Fruit", "F1")) == (1, 1)
+
+    allocator.release("Fruit", "F1")
+    assert allocator.occupant(1, 1) is None
+    assert allocator.free_shelves("Fruit") == [1]
+    assert slot(allocator.assign("Fruit", "F3")) == (1, 1)
+    assert allocator.occupant(1, 1) == "F3"
+    assert allocator.free_shelves("Fruit") == []
+    assert slot(allocator.assign("Fruit", "F4")) == (1, 3)
+
+
+def test_placing_a_stored_location_claims_its_shelf():
+    allocator = LocationAllocator()
+    allocator.place("Fruit", "F1", Location(4, 3))
+    assert allocator.aisle_of("Fruit") == 4
+    assert allocator.occupant(4, 3) == "F1"
+    assert slot(allocator.assign("Fruit", "F2")) == (4, 4)
+    assert slot(allocator.assign("Dairy", "D1")) == (5, 1)
+
+    allocator.place("Fruit", "F1", Location(4, 6))
+    assert allocator.occupant(4, 3) is None
+    assert allocator.free_shelves("Fruit") == [3]
+    assert slot(allocator.location_of("Fruit", "F1")) == (4, 6)
+
+
+def test_allocators_are_independent_per_warehouse():
+    north, south = LocationAllocator("north"), LocationAllocator("south")
+    north.assign("Fruit", "F1")
+    north.assign("Fruit", "F2")
+    assert slot(south.assign("Fruit", "F9")) == (1, 1)
+    assert north.occupant(1, 1) == "F1"
+
+
+def test_state_round_trips_with_free_shelves():
+    allocator = LocationAllocator("north")
+    for code in ("F1", "F2", "F3"):
+        allocator.assign("Fruit", code)
+    allocator.assign("Dairy", "D1")
+    allocator.release("Fruit", "F2")
+
+    state = pickle.loads(pickle.dumps(allocator.export_state()))
+    copy = LocationAllocator()
+    copy.import_state(state)
+    assert copy.warehouse == "north"
+    assert copy.export_state() == allocator.export_state()
+    assert copy.occupant(1, 3) == "F3"
+    assert slot(copy.assign("Fruit", "F4")) == (1, 2)
+    assert slot(copy.assign("Fruit", "F5")) == (1, 4)
+    assert slot(copy.assign("Bakery", "B1")) == (3, 1)
+
+
+def test_removed_records_free_their_shelf(system):
+    code, record = next(iter(system.records.items()))
+    category = record.product.category
+    shelf = slot(record.location)
+    system.remove_record(code)
+    assert system.record_at(*shelf) is None
+    assert int(record.location.shelf) in system.locations.free_shelves(
+        category
+    )
@@ -0,0 +1,146 @@
+import json
+from datetime import datetime, time, timedelta
+
+import pytest
+
+from Inventory_System.Operantions_Center.extracts import Extracts
+from Inventory_System.Operantions_Center.system import System
+from Inventory_System.Operantions_Center.verifier import StateVerifier
+from Inventory_System.Storage.sqlite_repository import SQLiteRepository
+from Inventory_System.__main__ import main
+
+
+def v1_backup(system):
+    return {
+        "movements": Extracts.get_movements(system),
+        "bills": Extracts.get_bills(system),
+        "records": Extracts.get_records(system),
+        "customers": Extracts.get_customers(system),
+        "suppliers": Extracts.get_suppliers(system)
+    }
+
+
+def history_sizes(system):
+    return {
+        code: len(record.stock._record)
+        for code, record in system.records.items()
+    }
+
+
+def test_backup_round_trip(system, tmp_path):
+    path = str(tmp_path / "full_backup.json")
+    system.export_full_system(path)
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    assert data["format"] == Extracts.BACKUP_FORMAT
+    assert data["version"] == Extracts.BACKUP_VERSION
+    assert all("record" not in r["stock"] for r in data["records"])
+
+    restored = System()
+    restored.load_full_backup(path)
+    assert StateVerifier.compare(system, restored) == []
+    assert StateVerifier.check(restored) == []
+    assert history_sizes(restored) == history_sizes(system)
+    assert [m.date for m in restored.movements] == \
+        [m.date for m in system.movements]
+
+
+def test_v1_backup_is_migrated(system, tmp_path):
+    for movement in system.movements:
+        movement.date = datetime.combine(movement.date.date(), time.min)
+    restored = System()
+    path = tmp_path / "full_backup.json"
+    path.write_text(json.dumps(v1_backup(system)), encoding="utf-8")
+
+    restored.load_full_backup(str(path))
+    assert StateVerifier.compare(system, restored) == []
+    assert history_sizes(restored) == history_sizes(system)
+
+
+def test_migrate_command_writes_v2(system, tmp_path):
+    source = tmp_path / "v1.json"
+    target = tmp_path / "v2.json"
+    source.write_text(json.dumps(v1_backup(system)), encoding="utf-8")
+
+    assert main(["--no-journal", "migrate", str(source), str(target)]) == 0
+    data = json.loads(target.read_text(encoding="utf-8"))
+    assert data["version"] == Extracts.BACKUP_VERSION
+    billed = [m for m in data["movements"] if m["Bill_ID"] is not None]
+    assert len(billed) == sum(len(b["items"]) for b in data["bills"])
+
+
+def test_unknown_backup_version_is_rejected():
+    with pytest.raises(ValueError):
+        Extracts.upgrade_backup({"version": Extracts.BACKUP_VERSION + 1})
+
+
+def test_ndjson_export_starts_with_header(system, tmp_path):
+    path = str(tmp_path / "full_backup.ndjson")
+    system.export_full_system(path)
+    with open(path, encoding="utf-8") as f:
+        rows = [json.loads(line) for line in f]
+    assert rows[0] == {"type": "header", "data": Extracts.backup_header()}
+    assert sum(row["type"] == "movement" for row in rows) == \
+        len(system.movements)
+
+
+@pytest.mark.parametrize("suffix, magic", [
+    (".ndjson", b'{"type"'), (".ndjson.gz", b"\x1f\x8b"), (".ndjson.xz", b"\xfd7zXZ")
+])
+def test_ndjson_backup_round_trips(system, tmp_path, suffix, magic):
+    path = str(tmp_path / f"full_backup{suffix}")
+    system.export_full_system(path)
+    with open(path, "rb") as f:
+        assert f.read(len(magic)) == magic
+
+    restored = System()
+    restored.load_full_backup(path)
+    assert StateVerifier.compare(system, restored) == []
+    restored.close()
+
+
+def test_ndjson_compression_can_be_chosen_explicitly(system, tmp_path):
+    path = str(tmp_path / "movements.ndjson")
+    rows = Extracts.iter_movements(system)
+    count = Extracts.write_ndjson(rows, path, "lzma", chunk_size=7)
+    assert count == len(system.movements)
+    with Extracts.open_stream(path, compression="lzma") as f:
+        assert sum(1 for line in f) == count
+    with pytest.raises(ValueError):
+        Extracts.write_ndjson([], path, "zip")
+
+
+def test_restore_into_sqlite_keeps_the_applied_history(system, tmp_path):
+    path = str(tmp_path / "full_backup.json")
+    db = str(tmp_path / "inventory.db")
+    system.export_full_system(path)
+
+    restored = System(repository=SQLiteRepository(db))
+    restored.load_full_backup(path)
+    restored.close()
+
+    reopened = System(repository=SQLiteRepository(db))
+    yesterday = datetime.now() - timedelta(days=1)
+    assert history_sizes(reopened) == history_sizes(system)
+    assert reopened.stock_snapshot(yesterday) == \
+        system.stock_snapshot(yesterday)
+    assert reopened.stock_snapshot(datetime.now()) == \
+        system.stock_snapshot(datetime.now())
+    assert StateVerifier.check(reopened) == []
+    reopened.close()
+
+
+def test_backup_flags_exactly_the_applied_movements(system):
+    suppliers = list(system.suppliers.values())
+    product = system.records["P003"].product
+    system.remove_record("P003")
+    system.entry_record(product, 10, suppliers[0], "Restock")
+
+    expected = {
+        movement._seq
+        for record in system.records.values()
+        for movement in record.stock._record
+    }
+    rows = Extracts.iter_backup_movements(system)
+    assert {seq for seq, row in enumerate(rows) if row["Applied"]} == \
+        expected
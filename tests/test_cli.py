@@ -0,0 +1,57 @@
+from conftest import populate
+from Inventory_System.Operantions_Center.verifier import StateVerifier
+from Inventory_System.__main__ import build_parser, main, open_system
+
+
+def test_sqlite_and_journal_do_not_apply_twice(tmp_path):
+    args = build_parser().parse_args([
+        "--db", str(tmp_path / "inventory.db"),
+        "--journal", str(tmp_path / "inventory.journal"),
+        "--snapshot", str(tmp_path / "inventory.snap"),
+        "check"
+    ])
+    system = open_system(args)
+    populate(system)
+    system.close()
+
+    for _ in range(2):
+        reopened = open_system(args)
+        assert len(reopened.movements) == len(system.movements)
+        assert StateVerifier.compare(system, reopened) == []
+        reopened.close()
+
+    assert main([
+        "--db", str(tmp_path / "inventory.db"),
+        "--journal", str(tmp_path / "inventory.journal"),
+        "--snapshot", str(tmp_path / "inventory.snap"),
+        "verify"
+    ]) == 0
+
+
+def test_report_fails_when_nothing_is_written(tmp_path):
+    output = tmp_path / "report.pdf"
+    for argv in (
+        ["report", "actor", "--actor", "bogus"],
+        ["report", "sales"]
+    ):
+        assert main(
+            ["--no-journal", *argv, "--output", str(output)]
+        ) == 1
+        assert not output.exists()
+
+
+def test_check_repair_persists_the_rebuilt_aggregates(tmp_path):
+    argv = [
+        "--journal", str(tmp_path / "inventory.journal"),
+        "--snapshot", str(tmp_path / "inventory.snap")
+    ]
+    system = open_system(build_parser().parse_args([*argv, "check"]))
+    populate(system)
+    code = next(iter(system.records))
+    system.aggregates._totals[code][0] += 1
+    system.journal.compact()
+    system.close()
+
+    assert main([*argv, "check"]) == 1
+    assert main([*argv, "check", "--repair"]) == 0
+    assert main([*argv, "check"]) == 0
@@ -0,0 +1,104 @@
+import random
+import sys
+import threading
+
+import pytest
+
+from test_journal import assert_same_state
+from Inventory_System.Inventory_Management.inventory_record import InventoryRecord
+from Inventory_System.Inventory_Management.stock import Stock
+from Inventory_System.Operantions_Center.journal import Journal
+from Inventory_System.Operantions_Center.system import System
+from Inventory_System.People.customer import Customer
+from Inventory_System.Products.product import Product
+from Inventory_System.Products.state import State
+
+STOCK = 60
+THREADS = 6
+ATTEMPTS = 300
+
+
+@pytest.fixture
+def switching():
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+
+def stocked_system(products=4):
+    system = System()
+    for i in range(products):
+        product = Product(
+            f"Product {i}", "Stress", f"H{i:03d}", 10.0, State("New")
+        )
+        location = system.locations.assign(product.category, product._code)
+        system.add_record(
+            InventoryRecord(product, Stock(STOCK, 0, STOCK), location)
+        )
+    customer = Customer("Customer", "2000")
+    system.add_customer(customer)
+    return system, customer
+
+
+def sell_concurrently(system, customer):
+    codes = sorted(system.records)
+    sold = [{} for _ in range(THREADS)]
+
+    def worker(seed):
+        rng = random.Random(seed)
+        for _ in range(ATTEMPTS):
+            code = rng.choice(codes)
+            amount = rng.randint(1, 3)
+            if system.make_sale(code, amount, customer, "Stress"):
+                sold[seed][code] = sold[seed].get(code, 0) + amount
+
+    threads = [
+        threading.Thread(target=worker, args=(n,)) for n in range(THREADS)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return {
+        code: sum(totals.get(code, 0) for totals in sold) for code in codes
+    }
+
+
+def assert_not_oversold(system, sold):
+    for code, record in system.records.items():
+        assert 0 <= record.stock.get_actual_stock() == STOCK - sold[code]
+    assert [m._seq for m in system.movements] == list(
+        range(len(system.movements))
+    )
+    assert sum(
+        len(record.stock._record) for record in system.records.values()
+    ) == len(system.movements)
+    assert system.check_aggregates() == []
+
+
+def test_concurrent_sales_never_oversell(switching):
+    system, customer = stocked_system()
+    sold = sell_concurrently(system, customer)
+    assert_not_oversold(system, sold)
+    # Demand exceeds stock, so every product ends up sold out or close.
+    assert all(
+        record.stock.get_actual_stock() < 3
+        for record in system.records.values()
+    )
+
+
+def test_concurrent_journaled_sales_replay_exactly(tmp_path, switching):
+    system, customer = stocked_system()
+    system.open_journal(
+        str(tmp_path / "inventory.journal"),
+        str(tmp_path / "inventory.json"), compact_every=50
+    )
+    sold = sell_concurrently(system, customer)
+    system.close()
+    assert_not_oversold(system, sold)
+
+    rebuilt, _ = Journal.rebuild(
+        str(tmp_path / "inventory.journal"), str(tmp_path / "inventory.json")
+    )
+    assert_same_state(system, rebuilt)
@@ -0,0 +1,20 @@
+def test_critical_records_are_ordered_by_shortage(system):
+    for code in list(system.records)[:4]:
+        stock = system.records[code].stock
+        system.update_stock_limits(
+            code, stock.get_actual_stock() + int(code[1:]) + 1,
+            stock.maximum_stock
+        )
+
+    records = system.get_critical_records()
+    shortages = [record.stock.shortage() for record in records]
+    assert shortages == sorted(shortages, reverse=True)
+    assert system.count_critical_records() == len(records)
+    assert system.get_critical_records(limit=2, offset=1) == records[1:3]
+
+    code = records[0].product._code
+    maximum = system.records[code].stock.maximum_stock
+    system.update_stock_limits(code, 0, maximum)
+    assert code not in [
+        record.product._code for record in system.get_critical_records()
+    ]
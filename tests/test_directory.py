@@ -0,0 +1,73 @@
+from Inventory_System.Operantions_Center.system import System
+from Inventory_System.People.customer import Customer
+from Inventory_System.People.directory import ActorDirectory
+from Inventory_System.People.supplier import Supplier
+
+
+def names(actors):
+    return [actor.name for actor in actors]
+
+
+def test_lookups_ignore_case_spacing_and_punctuation():
+    directory = ActorDirectory("contact_number")
+    acme = Supplier("Acme  Foods", "+1 (555) 010-200")
+    directory.add(acme)
+
+    assert directory.find_by_name("acme foods") == [acme]
+    assert directory.first(" ACME Foods ") is acme
+    assert directory.find_by_contact("1555010200") == [acme]
+    assert directory.find_duplicate("Acme Foods", "1-555-010-200") is acme
+    assert directory.find_duplicate(
+        "Acme Foods", "1-555-010-200", exact=True
+    ) is None
+    assert directory.first("Acme") is None
+
+
+def test_prefix_search_is_ordered_and_limited():
+    directory = ActorDirectory("number_id")
+    for name in ("Carla", "bruno", "Ana", "Berta", "Beto"):
+        directory.add(Customer(name, name.upper()))
+
+    assert names(directory.search("b")) == ["Berta", "Beto", "bruno"]
+    assert names(directory.search("BE", limit=1)) == ["Berta"]
+    assert names(directory.search("")) == [
+        "Ana", "Berta", "Beto", "bruno", "Carla"
+    ]
+    assert directory.search("z") == []
+
+
+def test_remove_and_duplicates():
+    directory = ActorDirectory("number_id")
+    first = Customer("Dana", "77")
+    second = Customer("dana", "7-7")
+    other = Customer("Dana", "88")
+    for customer in (first, second, other):
+        directory.add(customer)
+
+    assert len(directory) == 3
+    assert [sorted(a._id for a in group) for group in directory.duplicates()] \
+        == [sorted((first._id, second._id))]
+
+    directory.remove(first)
+    directory.remove(second)
+    assert directory.find_by_contact("77") == []
+    assert directory.find_by_name("dana") == [other]
+    directory.remove(other)
+    assert directory.search("d") == []
+    assert len(directory) == 0
+
+
+def test_system_keeps_the_directories_after_a_restore(system, tmp_path):
+    customer = next(iter(system.customers.values()))
+    supplier = next(iter(system.suppliers.values()))
+    path = str(tmp_path / "full_backup.json")
+    system.export_full_system(path)
+
+    restored = System()
+    restored.load_full_backup(path)
+    assert restored.find_customer(customer.name.upper())._id == customer._id
+    assert restored.find_supplier(supplier.name)._id == supplier._id
+    assert len(restored.search_actors("customer", "customer")) == len(
+        system.customers
+    )
+    restored.close()
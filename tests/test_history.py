@@ -0,0 +1,27 @@
+import time
+from datetime import datetime
+
+import pytest
+
+from conftest import populate
+from Inventory_System.Operantions_Center.system import System
+
+
+def test_stock_at_answers_from_history():
+    system = System()
+    populate(system, products=3, sales=0)
+    customer = next(iter(system.customers.values()))
+    record = system.records["P000"]
+    start = record.stock.get_actual_stock()
+
+    time.sleep(0.01)
+    middle = datetime.now()
+    time.sleep(0.01)
+    system.make_sale("P000", 2, customer, "Sale")
+    system.make_sale("P000", 3, customer, "Sale")
+
+    assert system.stock_at("P000", datetime(2000, 1, 1)) == 0
+    assert system.stock_at("P000", middle) == start
+    assert system.stock_at("P000", datetime.now()) == start - 5
+    with pytest.raises(ValueError):
+        system.stock_at("missing", middle)
@@ -0,0 +1,124 @@
+import json
+
+import pytest
+
+from conftest import populate
+from Inventory_System.Operantions_Center.importer import BatchImporter
+from Inventory_System.Operantions_Center.system import System
+
+
+def product_row(i):
+    return json.dumps({
+        "name": f"Product {i}", "category": "Fruit", "code": f"P{i:03d}",
+        "price": 1.0, "state": {"condition": "New"}
+    })
+
+
+def test_bad_lines_are_rejected_without_aborting(tmp_path):
+    path = tmp_path / "products.ndjson"
+    rejects = tmp_path / "rejects.ndjson"
+    lines = [
+        product_row(0), "{not json", product_row(1), "5",
+        product_row(2), '["a list"]', product_row(3)
+    ]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    system = System()
+    report = BatchImporter(
+        system, batch_size=2, rejects_path=str(rejects)
+    ).import_products(str(path))
+
+    assert report["read"] == len(lines)
+    assert report["imported"] == 4
+    assert report["rejected"] == 3
+    assert sorted(system.records) == ["P000", "P001", "P002", "P003"]
+    rejected = [
+        json.loads(line)
+        for line in rejects.read_text(encoding="utf-8").splitlines()
+    ]
+    assert [reject["row"] for reject in rejected] == [1, 3, 5]
+    assert rejected[0]["data"] == "{not json"
+
+
+def test_bad_array_elements_are_rejected_without_aborting(tmp_path):
+    path = tmp_path / "products.json"
+    elements = [
+        product_row(0), '{"name": oops}', product_row(1),
+        '{"name": "unterminated', product_row(2)
+    ]
+    path.write_text(
+        "[\n" + ",\n".join(elements) + "\n]\n", encoding="utf-8"
+    )
+
+    system = System()
+    report = BatchImporter(system, batch_size=2).import_products(str(path))
+
+    assert report["read"] == len(elements)
+    assert report["imported"] == 3
+    assert report["rejected"] == 2
+    assert sorted(system.records) == ["P000", "P001", "P002"]
+
+
+def test_ndjson_rows_only_split_on_newlines(tmp_path):
+    path = tmp_path / "products.ndjson"
+    names = ["Line\u2028separator", "Next\x85line"]
+    rows = [
+        json.dumps({
+            "name": name, "category": "Fruit", "code": f"P{i:03d}",
+            "price": 1.0, "state": {"condition": "New"}
+        }, ensure_ascii=False)
+        for i, name in enumerate(names)
+    ]
+    path.write_text("\n".join(rows) + "\n", encoding="utf-8")
+
+    system = System()
+    report = BatchImporter(system).import_products(str(path))
+
+    assert report["imported"] == 2
+    assert [
+        system.records[f"P{i:03d}"].product.name for i in range(2)
+    ] == names
+
+
+def test_resumed_import_does_not_repeat_a_landed_batch(tmp_path, monkeypatch):
+    system = System()
+    _, customers = populate(system, sales=0)
+    path = tmp_path / "movements.ndjson"
+    checkpoint = tmp_path / "import.checkpoint"
+    rows = [
+        {
+            "Code": f"P{i % 4:03d}", "Quantity": 1, "Type": "out",
+            "Actor_ID": customers[0]._id, "Reason": "Import",
+            "Timestamp": f"2024-01-0{i + 1}T10:00:00"
+        }
+        for i in range(6)
+    ]
+    path.write_text(
+        "\n".join(json.dumps(row) for row in rows) + "\n", encoding="utf-8"
+    )
+
+    apply_movements = system.apply_movements
+    calls = []
+
+    def crash_after_second_batch(batch):
+        apply_movements(batch)
+        calls.append(None)
+        if len(calls) == 2:
+            raise RuntimeError("crashed after the batch landed")
+
+    monkeypatch.setattr(system, "apply_movements", crash_after_second_batch)
+    before = len(system.movements)
+    importer = BatchImporter(
+        system, batch_size=2, checkpoint_path=str(checkpoint)
+    )
+    with pytest.raises(RuntimeError):
+        importer.import_movements(str(path))
+    assert len(system.movements) == before + 4
+
+    monkeypatch.setattr(system, "apply_movements", apply_movements)
+    report = importer.import_movements(str(path))
+
+    assert report["read"] == 6
+    assert report["imported"] == 6
+    assert len(system.movements) == before + 6
+    assert [m.reason for m in system.movements][before:] == ["Import"] * 6
@@ -0,0 +1,126 @@
+import threading
+
+import pytest
+
+from conftest import populate
+from Inventory_System.Operantions_Center.journal import Journal
+from Inventory_System.Operantions_Center.system import System
+from Inventory_System.Operantions_Center.verifier import StateVerifier
+from Inventory_System.People.customer import Customer
+from Inventory_System.Transactions.payment import Cash
+
+
+def journaled_system(tmp_path, snapshot, compact_every=1000):
+    system = System()
+    system.open_journal(
+        str(tmp_path / "inventory.journal"), str(tmp_path / snapshot),
+        compact_every
+    )
+    return system
+
+
+def assert_same_state(expected, actual):
+    assert StateVerifier.compare(expected, actual) == []
+    assert StateVerifier.check(actual) == []
+    for code, record in expected.records.items():
+        assert len(actual.records[code].stock._record) == \
+            len(record.stock._record)
+
+
+@pytest.mark.parametrize("snapshot", ["inventory.snap", "inventory.json"])
+@pytest.mark.parametrize("compact_every", [1000, 40])
+def test_reopen_replays_the_journal(tmp_path, snapshot, compact_every):
+    live = journaled_system(tmp_path, snapshot, compact_every)
+    suppliers, customers = populate(live)
+    live.update_stock_limits("P001", 5, 500)
+    live.remove_record("P002")
+    live.create_bill(
+        customers[1], live.get_unbilled_movements(customers[1]._id)[:2],
+        Cash(10 ** 9)
+    )
+    live.close()
+
+    reopened = journaled_system(tmp_path, snapshot, compact_every)
+    assert_same_state(live, reopened)
+    assert reopened.check_aggregates() == []
+    reopened.close()
+
+
+def test_torn_tail_is_truncated(tmp_path):
+    live = journaled_system(tmp_path, "inventory.snap")
+    populate(live, sales=20)
+    live.close()
+
+    path = tmp_path / "inventory.journal"
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"seq": 99999, "kind": "movement", "da')
+
+    reopened = journaled_system(tmp_path, "inventory.snap")
+    assert_same_state(live, reopened)
+    reopened.close()
+    assert path.read_text(encoding="utf-8").endswith("\n")
+
+
+def test_compaction_during_a_sale_does_not_apply_it_twice(tmp_path):
+    live = journaled_system(tmp_path, "inventory.json")
+    suppliers, customers = populate(live, sales=0)
+    stock = live.records["P000"].stock
+    refresh = stock._listener
+    compactions = []
+
+    def compact_while_selling():
+        refresh()
+        if not compactions:
+            compactor = threading.Thread(target=live.journal.compact)
+            compactions.append(compactor)
+            compactor.start()
+            compactor.join(0.2)
+
+    stock._listener = compact_while_selling
+    assert live.make_sale("P000", 2, customers[0], "Sale")
+    compactions[0].join(5)
+    live.close()
+
+    rebuilt, _ = Journal.rebuild(
+        str(tmp_path / "inventory.journal"), str(tmp_path / "inventory.json")
+    )
+    assert rebuilt.records["P000"].stock.get_actual_stock() == \
+        stock.get_actual_stock()
+
+
+def test_bills_replay_with_their_full_timestamp(tmp_path):
+    live = journaled_system(tmp_path, "inventory.snap")
+    populate(live, sales=20)
+    live.close()
+
+    reopened = journaled_system(tmp_path, "inventory.snap")
+    assert {
+        bill_id: bill.date for bill_id, bill in reopened.bills.items()
+    } == {bill_id: bill.date for bill_id, bill in live.bills.items()}
+    reopened.close()
+
+
+@pytest.mark.parametrize("sync, expected", [(True, 30), (False, 0), (5, 5)])
+def test_sync_interval_groups_fsyncs(tmp_path, monkeypatch, sync, expected):
+    now = [0.0]
+    synced = []
+    monkeypatch.setattr(
+        "Inventory_System.Operantions_Center.journal.time.monotonic",
+        lambda: now[0]
+    )
+    monkeypatch.setattr(
+        "Inventory_System.Operantions_Center.journal.os.fsync",
+        synced.append
+    )
+    system = System()
+    system.open_journal(
+        str(tmp_path / "inventory.journal"),
+        str(tmp_path / "inventory.json"), sync=sync
+    )
+    synced.clear()
+    for i in range(30):
+        system.add_customer(Customer(f"Customer {i}", str(3000 + i)))
+        now[0] += 1
+    assert len(synced) == expected
+    system.close()
+    assert len(synced) == expected + bool(sync)
@@ -0,0 +1,91 @@
+from datetime import datetime
+
+import pytest
+
+from conftest import populate
+from Inventory_System.Operantions_Center.system import System
+from Inventory_System.Operantions_Center.verifier import StateVerifier
+from Inventory_System.Transactions.aggregates import SalesAggregates
+from Inventory_System.Transactions.ledger import LedgerHistory, MovementLedger
+from Inventory_System.Transactions.movements import Movement
+
+
+@pytest.fixture
+def columnar():
+    system = System(columnar=True)
+    populate(system)
+    yield system
+    system.close()
+
+
+def test_stock_history_keeps_ledger_seqs(columnar):
+    for record in columnar.records.values():
+        history = record.stock._record
+        assert isinstance(history, LedgerHistory)
+        assert [m._seq for m in history] == list(history.seqs())
+    assert StateVerifier.check(columnar) == []
+
+
+def test_aggregates_rebuild_from_the_columns(columnar):
+    rebuilt = SalesAggregates.from_ledger(columnar.movements)
+    assert columnar.aggregates.differences(rebuilt) == []
+    assert rebuilt.daily() == columnar.daily_sales()
+    summary = columnar.movements.sales_summary()
+    assert summary.keys() == columnar.sales_summary().keys()
+    for code, entry in columnar.sales_summary().items():
+        for side in ("in", "out"):
+            assert summary[code][side]["qty"] == entry[side]["qty"]
+            assert summary[code][side]["cost"] == \
+                pytest.approx(entry[side]["cost"])
+
+    code = next(iter(columnar.records))
+    columnar.aggregates._totals[code][0] += 1
+    assert columnar.check_aggregates()
+    columnar.rebuild_aggregates()
+    assert columnar.check_aggregates() == []
+
+
+def test_columnar_backup_restores_into_a_list_ledger(columnar, tmp_path):
+    path = str(tmp_path / "full_backup.json")
+    columnar.export_full_system(path)
+    restored = System()
+    restored.load_full_backup(path)
+    assert StateVerifier.compare(columnar, restored) == []
+    assert StateVerifier.check(restored) == []
+
+
+def dated_ledger(system, *dates):
+    ledger = MovementLedger()
+    record = next(iter(system.records.values()))
+    actor = next(iter(system.customers.values()))
+    for when in dates:
+        movement = Movement(record.product, 2, actor, "Sale")
+        movement.date = when
+        ledger.append(movement)
+    return ledger
+
+
+def test_daily_totals_bucket_by_local_date(columnar):
+    ledger = dated_ledger(
+        columnar,
+        datetime(2024, 3, 9, 0, 7), datetime(2024, 3, 9, 23, 53),
+        datetime(2024, 3, 10, 0, 1)
+    )
+    daily = {
+        day: totals for day, product, totals in ledger.daily_totals()
+    }
+    assert sorted(daily) == [datetime(2024, 3, 9).date(),
+                             datetime(2024, 3, 10).date()]
+    assert daily[datetime(2024, 3, 9).date()][2] == 4
+    assert daily[datetime(2024, 3, 10).date()][2] == 2
+
+
+def test_ledger_pickles_without_a_day_column_still_load(columnar):
+    ledger = dated_ledger(
+        columnar, datetime(2024, 3, 9, 23, 53), datetime(2024, 3, 10, 0, 1)
+    )
+    function, (columns, tables) = ledger.__reduce_ex__(2)
+    assert len(columns) == 8
+    restored = function(columns[:7], tables)
+    assert list(restored._day) == list(ledger._day)
+    assert list(restored.daily_totals()) == list(ledger.daily_totals())
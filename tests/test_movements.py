@@ -0,0 +1,104 @@
+import pytest
+
+from conftest import populate
+from Inventory_System.Operantions_Center.system import System
+from Inventory_System.Operantions_Center.verifier import StateVerifier
+from Inventory_System.Transactions.payment import Cash
+from Inventory_System.Products.product import Product
+from Inventory_System.Products.state import State
+from Inventory_System.Transactions.movements import Movement
+
+
+def test_apply_movements_is_all_or_nothing(system):
+    customer = next(iter(system.customers.values()))
+    first, second = list(system.records.values())[:2]
+    stock = {
+        code: record.stock.get_actual_stock()
+        for code, record in system.records.items()
+    }
+    ledger = len(system.movements)
+
+    batch = [
+        Movement(first.product, 1, customer, "Sale"),
+        Movement(second.product, second.stock.get_actual_stock() + 1,
+                 customer, "Sale")
+    ]
+    with pytest.raises(ValueError):
+        system.apply_movements(batch)
+
+    assert len(system.movements) == ledger
+    assert {
+        code: record.stock.get_actual_stock()
+        for code, record in system.records.items()
+    } == stock
+    assert system.check_aggregates() == []
+
+
+def test_apply_movements_applies_the_whole_batch(system):
+    customer = next(iter(system.customers.values()))
+    record = max(
+        system.records.values(), key=lambda r: r.stock.get_actual_stock()
+    )
+    before = record.stock.get_actual_stock()
+    batch = [Movement(record.product, 1, customer, "Sale") for _ in range(2)]
+
+    system.apply_movements(batch)
+
+    assert record.stock.get_actual_stock() == before - 2
+    assert [m._seq for m in batch] == [
+        len(system.movements) - 2, len(system.movements) - 1
+    ]
+    assert StateVerifier.check(system) == []
+
+
+def test_apply_movements_rejects_unknown_products(system):
+    customer = next(iter(system.customers.values()))
+    product = Product("Ghost", "Category 0", "X999", 1.0, State("New"))
+    with pytest.raises(ValueError):
+        system.apply_movements([Movement(product, 1, customer, "Sale")])
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_indexes_match_a_full_scan(columnar):
+    system = System(columnar=columnar)
+    populate(system)
+    movements = list(system.movements)
+
+    for code in system.records:
+        assert [m._seq for m in system.get_movements_by_code(code)] == [
+            m._seq for m in movements if m.product._code == code
+        ]
+    actors = [*system.customers.values(), *system.suppliers.values()]
+    for actor in actors:
+        assert [
+            m._seq for m in system.get_movements_by_actor(actor._id)
+        ] == [m._seq for m in movements if m._actor_id == actor._id]
+        unbilled = [
+            m._seq for m in movements
+            if m._actor_id == actor._id and m.bill_id is None
+        ]
+        assert [
+            m._seq for m in system.get_unbilled_movements(actor._id)
+        ] == unbilled
+        assert system.count_unbilled_movements(actor._id) == len(unbilled)
+    system.close()
+
+
+def test_billing_removes_movements_from_the_unbilled_index(system):
+    customer = next(iter(system.customers.values()))
+    before = system.count_unbilled_movements(customer._id)
+    page = system.get_unbilled_movements(customer._id, offset=1, limit=2)
+    assert [m._seq for m in page] == [
+        m._seq for m in system.get_unbilled_movements(customer._id)[1:3]
+    ]
+
+    bill = system.create_bill(customer, page, Cash(10 ** 9))
+    billed = {m._seq for m in page}
+    assert system.count_unbilled_movements(customer._id) == before - 2
+    assert billed.isdisjoint(
+        m._seq for m in system.get_unbilled_movements(customer._id)
+    )
+    assert {
+        m._seq for m in system.get_movements_by_actor(customer._id)
+        if m.bill_id == bill._bill_id
+    } == billed
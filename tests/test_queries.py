@@ -0,0 +1,84 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from conftest import populate
+from Inventory_System.Operantions_Center.system import System
+from Inventory_System.Storage.sqlite_repository import SQLiteRepository
+from Inventory_System.Transactions.movements import Movement
+
+
+@pytest.fixture(params=["memory", "columnar", "sqlite"])
+def dated_system(request, tmp_path):
+    if request.param == "sqlite":
+        system = System(repository=SQLiteRepository(str(tmp_path / "q.db")))
+    else:
+        system = System(columnar=request.param == "columnar")
+    _, customers = populate(system, sales=0)
+
+    # Mostly one shared midnight timestamp, as v1 backups produce, with some
+    # movements dated a day earlier than movements recorded before them.
+    midnight = datetime(2024, 3, 1)
+    for i in range(90):
+        record = system.records[f"P{i % 12:03d}"]
+        movement = Movement(record.product, 1, customers[i % 3], "Sale")
+        movement.date = midnight - timedelta(days=i % 5 == 4)
+        system.add_movement(movement)
+    yield system
+    system.close()
+
+
+def paginate(system, limit=7, cursor=None, **filters):
+    seqs = []
+    while True:
+        page = list(system.query_movements(
+            cursor=cursor, limit=limit, **filters
+        ))
+        seqs.extend(movement._seq for movement in page)
+        if len(page) < limit:
+            return seqs
+        cursor = system.movement_cursor(page[-1])
+
+
+def expected(system, keep=lambda movement: True):
+    return [
+        movement._seq for movement in sorted(
+            system.movements, key=lambda m: (m.date, m._seq)
+        )
+        if keep(movement)
+    ]
+
+
+def test_pages_cover_equal_timestamps_exactly_once(dated_system):
+    assert paginate(dated_system) == expected(dated_system)
+
+
+def test_product_pages_follow_timestamp_order(dated_system):
+    for code in ("P000", "P004", "P011"):
+        assert paginate(dated_system, limit=3, product=code) == expected(
+            dated_system, lambda m: m.product._code == code
+        )
+
+
+def test_actor_pages_follow_timestamp_order(dated_system):
+    actor = next(iter(dated_system.customers))
+    assert paginate(dated_system, limit=4, actor=actor) == expected(
+        dated_system, lambda m: m._actor_id == actor
+    )
+
+
+def test_pages_see_movements_added_between_pages(dated_system):
+    first = list(dated_system.query_movements(product="P001", limit=3))
+    customer = next(iter(dated_system.customers.values()))
+    late = Movement(dated_system.records["P001"].product, 1, customer, "Late")
+    late.date = datetime(2024, 3, 1)
+    dated_system.add_movement(late)
+
+    rest = paginate(
+        dated_system, limit=3, product="P001",
+        cursor=dated_system.movement_cursor(first[-1])
+    )
+    assert [m._seq for m in first] + rest == expected(
+        dated_system, lambda m: m.product._code == "P001"
+    )
+    assert late._seq in rest
@@ -0,0 +1,49 @@
+from Inventory_System.Products.product import Product
+from Inventory_System.Products.search import ProductSearchIndex
+from Inventory_System.Products.state import State
+
+
+def product(name, code, category="Fruit"):
+    return Product(name, category, code, 1.0, State("New"))
+
+
+def codes(products):
+    return [p._code for p in products]
+
+
+def test_search_ranks_exact_prefix_and_fuzzy_matches():
+    index = ProductSearchIndex()
+    index.add(product("Red apple", "A1"))
+    index.add(product("Green apple", "A2"))
+    index.add(product("Apricot jam", "J1", "Pantry"))
+
+    assert codes(index.search("apple")) == ["A1", "A2"]
+    assert codes(index.search("ap", limit=1)) == ["A1"]
+    assert codes(index.search("red apple")) == ["A1"]
+    assert codes(index.search("aple")) == ["A1", "A2"]
+    assert index.search("") == []
+
+
+def test_search_without_limit_returns_every_match():
+    index = ProductSearchIndex()
+    for i in range(30):
+        index.add(product(f"Apple {i}", f"A{i:02d}"))
+
+    assert len(index.search("apple", limit=None)) == 30
+    assert len(index.search("apple fruit", limit=None)) == 30
+    assert len(index.search("apple")) == 20
+
+
+def test_removed_tokens_do_not_accumulate():
+    index = ProductSearchIndex()
+    apple = product("Red apple", "A1")
+    for _ in range(5):
+        index.add(apple)
+        assert codes(index.search("red")) == ["A1"]
+        index.remove(apple)
+        assert index.search("red") == []
+
+    index.add(apple)
+    index.search("r")
+    assert len(index._tokens) == len(set(index._tokens))
+    assert sorted(index._tokens) == sorted(index._postings)
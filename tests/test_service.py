@@ -0,0 +1,85 @@
+import asyncio
+from http import HTTPStatus
+
+from Inventory_System.Operantions_Center.service import InventoryService
+
+
+def run_service(system, scenario):
+    async def run():
+        service = InventoryService(system, port=0)
+        await service.start()
+        try:
+            return await scenario(service)
+        finally:
+            await service.stop()
+
+    return asyncio.run(run())
+
+
+def sale(system, amount=1):
+    code = max(
+        system.records,
+        key=lambda code: system.records[code].stock.get_actual_stock()
+    )
+    customer = next(iter(system.customers))
+    return {"product": code, "customer": customer, "amount": amount}
+
+
+def test_sales_are_applied_through_the_writer(system):
+    async def scenario(service):
+        return await asyncio.gather(*(
+            service.submit("sales", sale(system)) for _ in range(5)
+        ))
+
+    before = len(system.movements)
+    results = run_service(system, scenario)
+    assert [status for status, _ in results] == [HTTPStatus.OK] * 5
+    assert len(system.movements) == before + 5
+    assert system.check_aggregates() == []
+
+
+def test_writer_survives_a_cancelled_request(system):
+    async def scenario(service):
+        abandoned = service.submit("sales", sale(system))
+        abandoned.cancel()
+        return await asyncio.wait_for(
+            service.submit("sales", sale(system)), 5
+        )
+
+    status, payload = run_service(system, scenario)
+    assert status == HTTPStatus.OK
+    assert payload["seq"] == len(system.movements) - 1
+
+
+def test_rejected_sale_is_a_conflict(system):
+    async def scenario(service):
+        return await service.submit("sales", sale(system, 10 ** 6))
+
+    status, _ = run_service(system, scenario)
+    assert status == HTTPStatus.CONFLICT
+
+
+def test_writer_survives_an_unexpected_failure(system, monkeypatch):
+    apply_movements = system.apply_movements
+
+    def failing(batch):
+        movements = list(batch)
+        if any(m.reason == "malformed" for m in movements):
+            raise RuntimeError("malformed sale")
+        return apply_movements(movements)
+
+    monkeypatch.setattr(system, "apply_movements", failing)
+
+    async def scenario(service):
+        bad = dict(sale(system), reason="malformed")
+        failed = await asyncio.wait_for(service.submit("sales", bad), 5)
+        done = await asyncio.wait_for(
+            service.submit("sales", sale(system)), 5
+        )
+        return failed, done
+
+    before = len(system.movements)
+    (failed, _), (status, payload) = run_service(system, scenario)
+    assert failed == HTTPStatus.INTERNAL_SERVER_ERROR
+    assert status == HTTPStatus.OK
+    assert len(system.movements) == before + 1
@@ -0,0 +1,53 @@
+import pytest
+
+from Inventory_System.Operantions_Center.sharding import ShardedSystem
+from Inventory_System.People.customer import Customer
+from Inventory_System.People.supplier import Supplier
+from Inventory_System.Products.product import Product
+from Inventory_System.Products.state import State
+
+
+@pytest.fixture
+def sharded():
+    system = ShardedSystem(2, by="code")
+    supplier = Supplier("Supplier", "1")
+    customer = Customer("Customer", "2")
+    system.add_supplier(supplier)
+    system.add_customer(customer)
+    for i in range(8):
+        product = Product(
+            f"Product {i}", f"Category {i % 2}", f"P{i}", 10.0, State("New")
+        )
+        system.entry_record(product, 50, supplier, "Initial")
+    yield system, customer
+    system.close()
+
+
+def test_sales_are_routed_to_the_owning_shard(sharded):
+    system, customer = sharded
+    results = system.make_sales(
+        [(f"P{i}", i + 1, customer, "Sale") for i in range(8)]
+    )
+
+    assert results == [True] * 8
+    assert [system.get_stock(f"P{i}") for i in range(8)] == \
+        [50 - (i + 1) for i in range(8)]
+    assert system.counts() == (8, 16)
+    assert system.sales_totals()["out"]["qty"] == sum(range(1, 9))
+    assert len({system.owner(f"P{i}") for i in range(8)}) == 2
+
+
+def test_shard_errors_leave_the_pipes_in_sync(sharded):
+    system, customer = sharded
+    ghost = Customer("Ghost", "3", "ghost")
+    with pytest.raises(KeyError):
+        system.make_sales([
+            (f"P{i}", 1, customer if i % 2 else ghost, "Sale")
+            for i in range(8)
+        ])
+
+    assert system.get_stock("P1") in (49, 50)
+    assert system.counts()[0] == 8
+    with pytest.raises(ValueError):
+        system.make_sale("missing", 1, customer, "Sale")
+    assert system.make_sale("P1", 1, customer, "Sale")
@@ -0,0 +1,37 @@
+import pytest
+
+from conftest import populate
+from Inventory_System.Operantions_Center.system import System
+from Inventory_System.Operantions_Center.verifier import StateVerifier
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_snapshot_round_trip(tmp_path, columnar):
+    system = System(columnar=columnar)
+    populate(system)
+    path = str(tmp_path / "inventory.snap")
+    system.save_snapshot(path)
+
+    loaded = System(columnar=columnar)
+    loaded.load_snapshot(path)
+    assert StateVerifier.compare(system, loaded) == []
+    assert StateVerifier.check(loaded) == []
+    assert [r.product._code for r in loaded.get_critical_records()] == \
+        [r.product._code for r in system.get_critical_records()]
+    assert loaded.locations.export_state() == system.locations.export_state()
+
+    customer = next(iter(loaded.customers.values()))
+    code = max(
+        loaded.records,
+        key=lambda code: loaded.records[code].stock.get_actual_stock()
+    )
+    assert loaded.make_sale(code, 1, customer, "Sale")
+    assert loaded.movements[-1]._seq == len(system.movements)
+    assert loaded.check_aggregates() == []
+
+
+def test_snapshot_rejects_other_files(tmp_path):
+    path = tmp_path / "inventory.snap"
+    path.write_bytes(b"not a snapshot at all")
+    with pytest.raises(ValueError):
+        System().load_snapshot(str(path))
@@ -0,0 +1,81 @@
+import sqlite3
+
+from conftest import populate
+from Inventory_System.Operantions_Center.system import System
+from Inventory_System.Operantions_Center.verifier import StateVerifier
+from Inventory_System.Transactions.payment import Cash
+from Inventory_System.Storage.sqlite_repository import SQLiteRepository
+
+
+def test_sqlite_state_survives_a_reopen(tmp_path):
+    path = str(tmp_path / "inventory.db")
+    system = System(repository=SQLiteRepository(path))
+    populate(system)
+    system.update_stock_limits("P001", 5, 500)
+    system.close()
+
+    reopened = System(repository=SQLiteRepository(path))
+    assert StateVerifier.compare(system, reopened) == []
+    assert StateVerifier.check(reopened) == []
+    assert reopened.records["P001"].stock.minimum_stock == 5
+    assert reopened.sales_summary() == system.sales_summary()
+    reopened.close()
+
+
+def test_each_write_is_committed_before_it_returns(tmp_path):
+    path = str(tmp_path / "inventory.db")
+    system = System(repository=SQLiteRepository(path))
+    _, customers = populate(system, sales=0)
+    observer = sqlite3.connect(path)
+
+    def count(sql):
+        return observer.execute(sql).fetchone()[0]
+
+    system.make_sale("P002", 3, customers[1], "Sale")
+    assert count("SELECT COUNT(*) FROM movements") == len(system.movements)
+    assert count(
+        "SELECT actual_stock FROM records WHERE code = 'P002'"
+    ) == system.records["P002"].stock.get_actual_stock()
+
+    system.update_stock_limits("P002", 7, 300)
+    assert count(
+        "SELECT minimum_stock FROM records WHERE code = 'P002'"
+    ) == 7
+    observer.close()
+    system.close()
+
+
+def test_reopening_replays_journal_entries_the_database_lost(
+    tmp_path, monkeypatch
+):
+    path = str(tmp_path / "inventory.db")
+    journal = str(tmp_path / "inventory.journal")
+    snapshot = str(tmp_path / "inventory.json")
+    repository = SQLiteRepository(path)
+    system = System(repository=repository)
+    system.open_journal(journal, snapshot)
+    _, customers = populate(system, sales=30)
+
+    # Writes that were never committed are gone when the process dies, but
+    # they are already in the journal.
+    monkeypatch.setattr(repository, "flush", lambda: None)
+    for code in ("P001", "P002", "P003", "P004", "P005"):
+        system.make_sale(code, 2, customers[1], "Sale")
+    system.update_stock_limits("P003", 4, 400)
+    system.create_bill(
+        customers[1], system.get_unbilled_movements(customers[1]._id),
+        Cash(10 ** 9)
+    )
+    repository.connection.close()
+    system.journal.close()
+
+    reopened = System(repository=SQLiteRepository(path))
+    reopened.open_journal(journal, snapshot)
+    assert len(reopened.movements) == len(system.movements)
+    assert StateVerifier.compare(system, reopened) == []
+    assert StateVerifier.check(reopened) == []
+    reopened.close()
+
+    again = System(repository=SQLiteRepository(path))
+    assert StateVerifier.compare(system, again) == []
+    again.close()
@@ -0,0 +1,150 @@
+import threading
+
+import pytest
+
+from conftest import populate
+from Inventory_System.Operantions_Center.system import System
+from Inventory_System.Operantions_Center.tasks import ReadWriteLock, TaskRunner
+from Inventory_System.Operantions_Center.verifier import StateVerifier
+from test_journal import journaled_system
+
+
+class Root:
+    def after(self, ms, callback):
+        pass
+
+
+@pytest.fixture
+def runner():
+    runner = TaskRunner(Root())
+    yield runner
+    runner.shutdown()
+
+
+def test_running_job_is_cancelled_at_its_next_update(runner):
+    started = threading.Event()
+    release = threading.Event()
+
+    def job(task):
+        task.update(0, 2, "first")
+        started.set()
+        release.wait(5)
+        task.update(1, 2, "second")
+        return "finished"
+
+    task = runner.submit("job", job)
+    assert started.wait(5)
+    task.cancel()
+    release.set()
+    task.future.result(5)
+    assert task.status == "cancelled"
+    assert task.result is None
+
+
+def test_cancelling_a_restore_leaves_the_system_unchanged(
+    runner, system, tmp_path
+):
+    path = str(tmp_path / "full_backup.json")
+    system.export_full_system(path)
+    restored = journaled_system(tmp_path, "inventory.snap")
+    suppliers, customers = populate(restored, products=3, sales=5, seed=2)
+    restored.save_snapshot(str(tmp_path / "before.snap"))
+    before = System()
+    before.load_snapshot(str(tmp_path / "before.snap"))
+
+    def job(task):
+        def progress(done, total, phase):
+            if phase == "records":
+                task.cancel()
+            task.update(done, total, phase)
+
+        return restored.load_full_backup(path, progress=progress)
+
+    task = runner.submit("restore", job, writes=True)
+    task.future.result(5)
+    assert task.status == "cancelled"
+    assert StateVerifier.compare(before, restored) == []
+    assert StateVerifier.check(restored) == []
+
+    assert restored.make_sale("P000", 1, customers[0], "Sale")
+    restored.close()
+    reopened = journaled_system(tmp_path, "inventory.snap")
+    assert StateVerifier.compare(restored, reopened) == []
+    reopened.close()
+
+
+def test_completed_job_is_not_reported_cancelled(runner):
+    def job(task):
+        task.update(1, 1, "done")
+        task.cancel()
+        task.update(1, 1, "done")
+        return "finished"
+
+    task = runner.submit("job", job, writes=True)
+    task.future.result(5)
+    assert task.status == "done"
+    assert task.result == "finished"
+
+
+def test_waiting_writer_goes_before_new_readers():
+    lock = ReadWriteLock()
+    order = []
+    lock.acquire_read()
+
+    def writer():
+        lock.acquire_write()
+        order.append("writer")
+        lock.release_write()
+
+    def reader():
+        lock.acquire_read()
+        order.append("reader")
+        lock.release_read()
+
+    waiting = threading.Thread(target=writer)
+    waiting.start()
+    while not lock._waiting_writers:
+        waiting.join(0.001)
+    late = threading.Thread(target=reader)
+    late.start()
+    late.join(0.05)
+    assert order == []
+
+    lock.release_read()
+    waiting.join(5)
+    late.join(5)
+    assert order == ["writer", "reader"]
+
+
+def test_collected_tasks_are_evicted(runner):
+    results = []
+    tasks = [
+        runner.submit(f"job {i}", lambda task, i=i: [i] * 1000,
+                      on_done=results.append)
+        for i in range(runner.history + 10)
+    ]
+    for task in tasks:
+        task.future.result(5)
+    runner._poll()
+
+    assert len(results) == len(tasks)
+    assert runner.tasks == tasks[-runner.history:]
+    assert all(task.result is None for task in runner.tasks)
+
+
+def test_restore_swaps_in_a_working_system(system, tmp_path):
+    path = str(tmp_path / "full_backup.json")
+    system.export_full_system(path)
+    restored = System()
+    populate(restored, products=3, sales=5, seed=2)
+    restored.load_full_backup(path)
+
+    assert StateVerifier.compare(system, restored) == []
+    code = "P005"
+    stock = restored.records[code].stock
+    customer = next(iter(restored.customers.values()))
+    restored.make_sale(
+        code, stock.get_actual_stock() - stock.minimum_stock + 1,
+        customer, "Sale"
+    )
+    assert restored.records[code] in restored.get_critical_records()
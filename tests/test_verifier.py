@@ -0,0 +1,65 @@
+import sqlite3
+
+from conftest import populate
+from Inventory_System.Operantions_Center.journal import Journal
+from Inventory_System.Operantions_Center.system import System
+from Inventory_System.Operantions_Center.verifier import StateVerifier
+from Inventory_System.Storage.sqlite_repository import SQLiteRepository
+from test_journal import assert_same_state, journaled_system
+
+
+def test_rebuild_matches_the_live_system(tmp_path):
+    live = journaled_system(tmp_path, "inventory.snap", 50)
+    populate(live)
+
+    rebuilt, replayed = Journal.rebuild(
+        str(tmp_path / "inventory.journal"), str(tmp_path / "inventory.snap")
+    )
+    assert replayed < len(live.movements)
+    assert_same_state(live, rebuilt)
+    live.close()
+
+
+def test_verifier_reports_divergence(system, tmp_path):
+    system.save_snapshot(str(tmp_path / "copy.snap"))
+    other = System()
+    other.load_snapshot(str(tmp_path / "copy.snap"))
+    assert StateVerifier.compare(system, other) == []
+
+    code = next(iter(other.records))
+    other.records[code].stock._actual_stock += 1
+    problems = StateVerifier.compare(system, other)
+    assert len(problems) == 1 and code in problems[0]
+
+
+def test_verifier_reports_tampered_applied_history(system, tmp_path):
+    system.save_snapshot(str(tmp_path / "copy.snap"))
+    other = System()
+    other.load_snapshot(str(tmp_path / "copy.snap"))
+    assert StateVerifier.check(other) == []
+
+    code = next(iter(other.records))
+    other.records[code].stock._record.pop()
+    problems = StateVerifier.check(other)
+    assert len(problems) == 1 and "opening stock" in problems[0]
+    problems = StateVerifier.compare(system, other)
+    assert len(problems) == 1 and "applied movements" in problems[0]
+
+
+def test_verifier_catches_history_lost_in_sqlite(tmp_path):
+    path = str(tmp_path / "inventory.db")
+    system = System(repository=SQLiteRepository(path))
+    populate(system)
+    system.close()
+
+    connection = sqlite3.connect(path)
+    connection.execute("UPDATE movements SET applied = 0 WHERE code = 'P001'")
+    connection.commit()
+    connection.close()
+
+    reopened = System(repository=SQLiteRepository(path))
+    assert any("P001" in problem for problem in StateVerifier.check(reopened))
+    assert any(
+        "P001" in problem for problem in StateVerifier.compare(system, reopened)
+    )
+    reopened.close()
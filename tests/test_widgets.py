@@ -0,0 +1,85 @@
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("tkinter")
+
+from Inventory_System.Operantions_Center.app import InventoryApp
+from Inventory_System.Operantions_Center.widgets import VirtualWindow
+
+
+class Scrollbar:
+    def set(self, first, last):
+        self.view = (first, last)
+
+
+class Window(VirtualWindow):
+    # The window logic without Tk: no scrollbar widget and a counting draw.
+    def __init__(self, rows, height=5):
+        self.data = rows
+        self.fetched = []
+        self.fetch = self._fetch
+        self.count = lambda: len(self.data)
+        self.height = height
+        self.offset = 0
+        self.total = 0
+        self.rows = []
+        self.selected = {}
+        self.scrollbar = Scrollbar()
+        self.refresh()
+
+    def _fetch(self, offset, limit):
+        self.fetched.append((offset, limit))
+        return self.data[offset:offset + limit]
+
+    def draw(self):
+        pass
+
+
+def test_window_fetches_only_the_visible_rows():
+    window = Window(list(range(100)))
+    assert window.rows == [0, 1, 2, 3, 4]
+    assert window.fetched == [(0, 5)]
+    assert window.scrollbar.view == (0.0, 0.05)
+
+    window.yview("scroll", "2", "pages")
+    assert window.rows == [10, 11, 12, 13, 14]
+    window.yview("moveto", "0.5")
+    assert window.offset == 50
+    window.scroll(1000)
+    assert window.rows == [95, 96, 97, 98, 99]
+    window.scroll(-1000)
+    assert window.offset == 0
+    assert all(limit == 5 for offset, limit in window.fetched)
+
+    window.data = window.data[:3]
+    window.refresh()
+    assert window.rows == [0, 1, 2]
+
+
+def test_window_keeps_the_selection_across_scrolling():
+    window = Window([f"row {i}" for i in range(40)])
+    window.remember_selection({1, 3})
+    window.scroll(20)
+    window.remember_selection({0})
+    window.scroll(-20)
+    window.remember_selection({3})
+    assert window.selected_rows() == ["row 3", "row 20"]
+
+    window.reset()
+    assert window.selected_rows() == []
+    assert window.offset == 0
+
+
+def test_product_suggestions_stop_at_the_limit(system):
+    app = SimpleNamespace(system=system)
+    first = InventoryApp.product_suggestions(app, "", 3)
+    assert [code for label, code in first] == list(system.records)[:3]
+
+    record = next(iter(system.records.values()))
+    matches = InventoryApp.product_suggestions(app, record.product.name, 2)
+    assert 0 < len(matches) <= 2
+    assert matches[0] == (
+        f"{record.product.name} ({record.product._code})",
+        record.product._code
+    )